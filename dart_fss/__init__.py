@@ -5,7 +5,7 @@ from dart_fss.corp import get_corp_list
 from dart_fss.filings import search
 from dart_fss.fs import extract
 from dart_fss.xbrl import get_xbrl_from_file
-from dart_fss.utils import enable_spinner
+from dart_fss.utils import enable_spinner, set_html_parser
 
 __all__ = [
     'api',
@@ -16,7 +16,7 @@ __all__ = [
     'fs', 'extract',
     'utils',
     'xbrl', 'get_xbrl_from_file',
-    'enable_spinner'
+    'enable_spinner', 'set_html_parser'
 ]
 
 from ._version import get_versions
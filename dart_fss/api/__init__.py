@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from dart_fss.api import filings, finance, info, issue, market, registration, shareholder
+from dart_fss.api.batch import batch
 
 
 __all__ = ['filings', 'finance', 'info', 'issue',
-           'market', 'registration', 'shareholder']
+           'market', 'registration', 'shareholder', 'batch']
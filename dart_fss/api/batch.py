@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from typing import Callable, Dict, List, Union
+
+from dart_fss.utils.concurrency import thread_map
+
+
+def batch(func: Callable[..., Dict],
+          params: List[Dict],
+          max_workers: int = 4,
+          progressbar: bool = False) -> List[Union[Dict, Exception]]:
+    """ 여러 API 요청을 병렬로 처리하는 함수
+
+    모든 요청은 dart_fss.utils.request 의 요청 제한(RateLimiter)을 공유한다.
+
+    Parameters
+    ----------
+    func: callable
+        dart_fss.api 의 API 함수 (ex. dart_fss.api.info.emp_sttus)
+    params: list of dict
+        func 에 전달할 인자 리스트
+    max_workers: int, optional
+        최대 Thread 수 (default: 4)
+    progressbar: bool, optional
+        ProgressBar 표시 여부 (default: False)
+
+    Returns
+    -------
+    list of (dict or Exception)
+        입력 순서대로 정렬된 API 요청 결과, 오류가 발생한 요청은 발생한 예외(ex. NoDataReceived)
+
+    Examples
+    --------
+    >>> from dart_fss.api import batch, info
+    >>> params = [{'corp_code': x, 'bsns_year': '2019', 'reprt_code': '11011'} for x in ['00126380', '00164779']]
+    >>> results = batch(info.emp_sttus, params)
+    """
+    def run(kwargs):
+        return func(**kwargs)
+
+    return thread_map(run, params, max_workers=max_workers, return_exceptions=True,
+                      progressbar=progressbar, desc=getattr(func, '__name__', None))
@@ -1,8 +1,8 @@
 from .company import get_corp_info
-from .corp_code import get_corp_code
+from .corp_code import get_corp_code, iter_corp_code, iter_corp_code_xml
 from .document import download_document
 from .search_filings import search_filings
 
 
-__all__ = ['get_corp_info', 'get_corp_code',
+__all__ = ['get_corp_info', 'get_corp_code', 'iter_corp_code', 'iter_corp_code_xml',
            'download_document', 'search_filings']
@@ -1,41 +1,104 @@
 # -*- coding: utf-8 -*-
-from collections import OrderedDict
+from typing import Dict, Iterator, List, Tuple
+from xml.etree.ElementTree import iterparse
 
 from dart_fss.auth import get_api_key
-from dart_fss.utils import request, unzip, get_cache_folder, search_file, xml_to_dict
+from dart_fss.utils import request, unzip, get_cache_folder, search_file
 
+# CORPCODE.xml 의 회사 정보 항목
+CORP_CODE_FIELDS = ('corp_code', 'corp_name', 'corp_eng_name', 'stock_code', 'modify_date')
+
+
+def iter_corp_code_xml(path: str) -> Iterator[Tuple[str, ...]]:
+    """ CORPCODE.xml 을 순차적으로 읽어 회사 정보를 반환
+
+    전체 파일을 메모리에 올리지 않고 <list> 항목 단위로 분석하며, 분석이 끝난 항목은 메모리에서 삭제한다.
+    빈 값 및 공백은 None 으로 변환한다.
+
+    Parameters
+    ----------
+    path: str
+        CORPCODE.xml 파일 경로
+
+    Yields
+    ------
+    tuple of str
+        CORP_CODE_FIELDS 순서의 회사 정보(고유번호, 회사명, 영문회사명, 종목코드, 최종변경일자)
+    """
+    root = None
+    for event, elem in iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            continue
+        if elem.tag != 'list':
+            continue
+        values = dict.fromkeys(CORP_CODE_FIELDS)
+        for child in elem:
+            text = child.text.strip() if child.text else ''
+            values[child.tag] = text if text else None
+        # 분석이 끝난 항목 삭제
+        elem.clear()
+        root.clear()
+        yield tuple(values[field] for field in CORP_CODE_FIELDS)
 
-def get_corp_code() -> OrderedDict:
-    """ DART에 등록되어있는 공시대상회사의 고유번호,회사명,대표자명,종목코드, 최근변경일자 다운로드
+
+def download_corp_code_xml(path: str) -> str:
+    """ 공시대상회사 고유번호 파일(CORPCODE.xml) 다운로드
+
+    Parameters
+    ----------
+    path: str
+        다운로드 받을 임시 폴더 경로
 
     Returns
     -------
-    OrderedDict
-        고유번호 및 회사 정보
+    str
+        CORPCODE.xml 파일 경로
     """
-    import tempfile
+    url = 'https://opendart.fss.or.kr/api/corpCode.xml'
 
-    with tempfile.TemporaryDirectory() as path:
-        url = 'https://opendart.fss.or.kr/api/corpCode.xml'
+    # Set API KEY
+    api_key = get_api_key()
+    payload = {'crtfc_key': api_key}
+
+    # Request Download
+    resp = request.download(url=url, path=path, payload=payload)
+    download_path = resp['full_path']
+    cache_folder = get_cache_folder()
 
-        # Set API KEY
-        api_key = get_api_key()
-        payload = {'crtfc_key': api_key}
+    # Unzip File in User Cache Folder
+    unzip_path = unzip(file=download_path, path=cache_folder)
 
-        # Request Download
-        resp = request.download(url=url, path=path, payload=payload)
-        download_path = resp['full_path']
-        cache_folder = get_cache_folder()
+    # Search CORPCODE.xml
+    files = search_file(
+        path=unzip_path, filename='CORPCODE', extensions='xml')
+    if len(files) == 0:
+        raise FileNotFoundError('CORPCODE.xml Not Found')
+    return files[0]
 
-        # Unzip File in User Cache Folder
-        unzip_path = unzip(file=download_path, path=cache_folder)
 
-        # Search CORPCODE.xml
-        files = search_file(
-            path=unzip_path, filename='CORPCODE', extensions='xml')
-        if len(files) == 0:
-            raise FileNotFoundError('CORPCODE.xml Not Found')
+def iter_corp_code() -> Iterator[Tuple[str, ...]]:
+    """ DART에 등록되어있는 공시대상회사 정보를 다운로드 후 순차적으로 반환
 
-        file = files[0]
-        data = xml_to_dict(file)
-        return data['result']['list']
+    Yields
+    ------
+    tuple of str
+        CORP_CODE_FIELDS 순서의 회사 정보(고유번호, 회사명, 영문회사명, 종목코드, 최종변경일자)
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as path:
+        file = download_corp_code_xml(path)
+        yield from iter_corp_code_xml(file)
+
+
+def get_corp_code() -> List[Dict[str, str]]:
+    """ DART에 등록되어있는 공시대상회사의 고유번호,회사명,대표자명,종목코드, 최근변경일자 다운로드
+
+    Returns
+    -------
+    list of dict
+        고유번호 및 회사 정보
+    """
+    return [dict(zip(CORP_CODE_FIELDS, values)) for values in iter_corp_code()]
@@ -2,8 +2,8 @@
 from typing import Union, List
 
 from dart_fss.auth import get_api_key
-from dart_fss.utils import request, str_upper
-from dart_fss.errors import check_status
+from dart_fss.utils import str_upper
+from ..helper import request_json
 
 str_or_list = Union[str, List[str]]
 
@@ -74,9 +74,4 @@ def search_filings(corp_code: str = None,
         'page_count': page_count
     }
 
-    resp = request.get(url=url, payload=payload)
-    dataset = resp.json()
-
-    # Check Error
-    check_status(**dataset)
-    return dataset
+    return request_json(url=url, payload=payload)
@@ -4,6 +4,7 @@ import re
 from urllib.parse import urljoin
 from dart_fss.auth import get_api_key
 from dart_fss.utils import request
+from dart_fss.utils.http_cache import http_cache
 from dart_fss.errors import check_status
 
 # corp_code check regular expression
@@ -22,6 +23,39 @@ sj_div_checker = ('BS1', 'BS2', 'BS3', 'BS4', 'IS1', 'IS2', 'IS3', 'IS4', 'CIS1'
                   'SCE2')
 
 
+def request_json(url: str, payload: dict) -> dict:
+    """ Open DART JSON API 요청 및 Status Code 확인
+
+    디스크 캐시(enable_http_cache)가 활성화된 경우 저장된 응답을 우선 사용하며, 정상 응답만 저장한다.
+
+    Parameters
+    ----------
+    url: str
+        Request URL
+    payload: dict
+        Request parameters
+
+    Returns
+    -------
+    dict
+        API Request Result
+    """
+    dataset = http_cache.get(url, payload)
+    if dataset is not None:
+        return dataset
+
+    # Request Data
+    resp = request.get(url=url, payload=payload)
+
+    # Convert Response to json
+    dataset = resp.json()
+
+    # Status Code Check
+    check_status(**dataset)
+    http_cache.set(url, payload, dataset)
+    return dataset
+
+
 def api_request(
         path: str,
         corp_code: str = None,
@@ -108,12 +142,4 @@ def api_request(
 
     payload = {k: v for k, v in payload.items() if v is not None}
 
-    # Request Data
-    resp = request.get(url=url, payload=payload)
-
-    # Convert Response to json
-    dataset = resp.json()
-
-    # Status Code Check
-    check_status(**dataset)
-    return dataset
+    return request_json(url=url, payload=payload)
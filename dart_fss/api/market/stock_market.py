@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
-from dart_fss.utils import request
-from bs4 import BeautifulSoup
+from dart_fss.utils import request, html_to_soup
 
 
 def get_stock_market_list(corp_cls: str, include_corp_name=True) -> dict:
@@ -46,7 +45,7 @@ def get_stock_market_list(corp_cls: str, include_corp_name=True) -> dict:
     stock_market_list = dict()
 
     resp = request.post(url=url, payload=payload, referer=referer)
-    html = BeautifulSoup(resp.text, 'html.parser')
+    html = html_to_soup(resp.text)
     rows = html.find_all('tr')
 
     for row in rows:
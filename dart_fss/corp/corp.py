@@ -11,6 +11,25 @@ from dart_fss.fs import extract, FinancialStatement
 str_or_list = Union[str, List[str]]
 
 
+def get_corp_profile(corp_code: str) -> Dict[str, str]:
+    """ 기업 개황 정보 반환
+
+    Parameters
+    ----------
+    corp_code: str
+        공시대상회사의 고유번호(8자리)
+
+    Returns
+    -------
+    dict of str
+        기업 개황 정보(status, message 제외)
+    """
+    info = get_corp_info(corp_code)
+    info.pop('status')
+    info.pop('message')
+    return info
+
+
 class Corp(object):
     """ 회사(종목) 정보를 담고 있는 클래스
 
@@ -29,6 +48,8 @@ class Corp(object):
         최종 업데이트 일자
 
     """
+    __slots__ = ('_info', '_loading', '_profile')
+
     def __init__(self,
                  corp_code: str,
                  corp_name: str = None,
@@ -65,6 +86,10 @@ class Corp(object):
         self._profile = profile
 
     def __getattr__(self, item):
+        # pickle, copy 등에서 _info 초기화 전에 호출되는 경우 재귀 호출 방지
+        if item in Corp.__slots__ or (item.startswith('__') and item.endswith('__')):
+            error = "'{}' object has no attribute '{}'".format(type(self).__name__, item)
+            raise AttributeError(error)
         if item in self._info:
             return self._info[item]
         else:
@@ -93,9 +118,7 @@ class Corp(object):
     def load(self):
         """ 종목 정보 로딩 """
         if self._loading is False:
-            info = get_corp_info(self._info['corp_code'])
-            info.pop('status')
-            info.pop('message')
+            info = get_corp_profile(self._info['corp_code'])
             self._info.update(info)
             self._loading = True
         return self._info
@@ -216,7 +239,8 @@ class Corp(object):
                    progressbar: bool = True,
                    skip_error: bool = True,
                    last_report_only: bool = True,
-                   min_required: int = 4) -> FinancialStatement:
+                   min_required: int = 4,
+                   max_workers: int = 1) -> FinancialStatement:
         """
         재무제표 검색
 
@@ -248,6 +272,8 @@ class Corp(object):
            최종 보고서만을 이용하여 데이터를 추출할지 여부 (default: True)
         min_required: int, optional
             Merge를 위한 최소한의 유효 데이터 개수 (default: 4)
+        max_workers: int, optional
+            보고서 다운로드 및 분석에 사용할 최대 Thread 수 (default: 1)
 
         Returns
         -------
@@ -255,4 +281,5 @@ class Corp(object):
             제무제표 검색 결과
          """
         return extract(self.corp_code, bgn_de, end_de, fs_tp, separate, report_tp, lang,
-                       separator, dataset, cumulative, progressbar, skip_error, last_report_only, min_required)
+                       separator, dataset, cumulative, progressbar, skip_error, last_report_only, min_required,
+                       max_workers)
@@ -1,21 +1,38 @@
 # -*- coding: utf-8 -*-
-import re
-from typing import Union, List
+import time
+import datetime
+import warnings
+import threading
+
+import pandas as pd
+
+from typing import Union, List, Dict, Tuple
+from requests.exceptions import RequestException
+
 from dart_fss.utils import Singleton, Spinner
-from dart_fss.api.filings import get_corp_code
+from dart_fss.utils.concurrency import thread_map
+from dart_fss.api.filings import iter_corp_code
+from dart_fss.api.filings.corp_code import CORP_CODE_FIELDS
 from dart_fss.api.market import get_stock_market_list, get_trading_halt_list
-from dart_fss.corp.corp import Corp
+from dart_fss.corp.corp import Corp, get_corp_profile
+from dart_fss.corp.search_index import CorpSearchIndex
+from dart_fss.corp.snapshot import load_snapshot, save_snapshot, is_expired, merge_profiles
 
 
-def get_corp_list():
+def get_corp_list(max_age: datetime.timedelta = None):
     """ DART 공시된 회사 리스트 반환
 
+    Parameters
+    ----------
+    max_age: datetime.timedelta, optional
+        저장된 회사 리스트 Snapshot 의 최대 사용 기간, None 인 경우 항상 새로 다운로드(default: None)
+
     Returns
     -------
     CorpList
         회사 리스트
     """
-    return CorpList()
+    return CorpList(max_age=max_age)
 
 
 def market_type_checker(market: Union[str, list]) -> List[str]:
@@ -43,31 +60,69 @@ def market_type_checker(market: Union[str, list]) -> List[str]:
     return market
 
 
-class CorpList(object, metaclass=Singleton):
+class _CorpListMeta(Singleton):
+    """ 이미 생성된 CorpList 와 다른 설정으로 호출한 경우 경고하는 Singleton metaclass """
+    def __call__(cls, profile=False, max_age: datetime.timedelta = None, snapshot_path: str = None):
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            instance._check_settings(max_age=max_age, snapshot_path=snapshot_path)
+        return super(_CorpListMeta, cls).__call__(profile=profile, max_age=max_age, snapshot_path=snapshot_path)
 
-    def __init__(self, profile=False):
+
+class CorpList(object, metaclass=_CorpListMeta):
+
+    def __init__(self, profile=False, max_age: datetime.timedelta = None, snapshot_path: str = None):
         """ CorpList 초기화
 
+        회사 리스트는 {cache folder}/corp_list.pkl 에 Snapshot 으로 저장되며, 저장된 Snapshot 이 max_age 보다
+        최근에 생성된 경우 다운로드 없이 Snapshot 을 사용한다. 다운로드에 실패한 경우 만료된 Snapshot 을 사용한다.
+
+        CorpList 는 Singleton 으로 처음 생성할 때의 설정만 적용된다. 이후 다른 max_age 또는 snapshot_path 로
+        호출한 경우 설정은 무시되며 RuntimeWarning 이 발생한다. 회사 정보를 새로 받으려면 refresh 를 사용한다.
+
+        회사 정보는 pandas DataFrame 에 열 단위로 저장되며, Corp 는 조회시 생성된다.
+
         Parameters
         ----------
         profile: bool
             Corp Class 반환시 Profile 자동 로딩 여부
+        max_age: datetime.timedelta, optional
+            Snapshot 최대 사용 기간, None 인 경우 항상 새로 다운로드(default: None)
+        snapshot_path: str, optional
+            Snapshot 파일 경로(default: {cache folder}/corp_list.pkl)
         """
+        self._max_age = max_age
+        self._snapshot_path = snapshot_path
+        self._profile = profile
+        self._index_lock = threading.Lock()
+        self._reset()
+        self.load(profile=self._profile)
+
+    def _check_settings(self, max_age: datetime.timedelta = None, snapshot_path: str = None):
+        """ 이미 생성된 CorpList 와 설정이 다른 경우 경고 """
+        ignored = [name for name, value, active in (('max_age', max_age, self._max_age),
+                                                     ('snapshot_path', snapshot_path, self._snapshot_path))
+                   if value is not None and value != active]
+        if ignored:
+            warnings_text = 'CorpList is already initialized, {} ignored. Use CorpList.refresh() to reload.'.format(
+                ', '.join(ignored))
+            warnings.warn(warnings_text, RuntimeWarning)
+
+    def _reset(self):
+        """ 회사 정보 초기화 """
+        self._df = None
+        self._columns = None
         self._corps = None
+        self._index = None
         self._corp_codes = dict()
-        self._corp_names = []
-        self._corp_cls_list = []
-        self._corp_product = []
-        self._corp_sector = []
         self._sectors = []
 
         self._stock_codes = dict()
         self._delisting = dict()
         self._trading_halt = dict()
         self._stock_market = dict()
-        self._profile = profile
-
-        self.load(profile=self._profile)
+        self._profiles = dict()
+        self._created = None
 
     def load(self, profile=False):
         """ 회사 정보가 없을시 회사 정보 로딩
@@ -77,7 +132,7 @@ class CorpList(object, metaclass=Singleton):
         profile: bool, optional
             상세정보 로딩 여부
         """
-        if self._corps is None:
+        if self._df is None:
             self._load(profile=profile)
 
     def _load(self, profile=False):
@@ -88,57 +143,273 @@ class CorpList(object, metaclass=Singleton):
         profile: bool, optional
             상세정보 로딩 여부
         """
+        snapshot = load_snapshot(self._snapshot_path)
+        if snapshot is not None and not is_expired(snapshot, self._max_age):
+            self._build(snapshot, profile=profile)
+            return
+
+        try:
+            data = self._download(snapshot)
+        except RequestException as ex:
+            if snapshot is None:
+                raise
+            created = datetime.datetime.fromtimestamp(snapshot['created'])
+            warnings_text = 'Unable to update the company list, using the snapshot created at {}: {}'.format(
+                created.strftime('%Y-%m-%d %H:%M:%S'), ex)
+            warnings.warn(warnings_text, RuntimeWarning)
+            data = snapshot
+        self._build(data, profile=profile)
+
+    def _download(self, snapshot: Dict = None) -> Dict:
+        """ 회사 정보 다운로드 및 Snapshot 저장
+
+        Open DART 는 변경분만 제공하지 않으므로 전체 목록을 다운로드한 후
+        최종변경일자(modify_date)가 동일한 회사의 기업개황 정보만 이전 Snapshot 에서 유지한다.
+
+        Parameters
+        ----------
+        snapshot: dict, optional
+            이전 Snapshot
+
+        Returns
+        -------
+        dict
+            corps, stock_market, trading_halt, profiles 정보
+        """
         # Loading Stock Market Information
         spinner = Spinner('Loading Stock Market Information')
         spinner.start()
-        for k in ['Y', 'K', 'N']:
-            data = get_stock_market_list(k, False)
-            self._stock_market = {**self._stock_market, **data}
-            trading_halt = get_trading_halt_list(k, False)
-            self._trading_halt = {**self._trading_halt, **trading_halt}
-        spinner.stop()
+        stock_market = dict()
+        trading_halt = dict()
+        try:
+            for k in ['Y', 'K', 'N']:
+                stock_market.update(get_stock_market_list(k, False))
+                trading_halt.update(get_trading_halt_list(k, False))
+        finally:
+            spinner.stop()
 
         spinner = Spinner('Loading Companies in OpenDART')
         spinner.start()
+        try:
+            corps = pd.DataFrame.from_records(iter_corp_code(), columns=list(CORP_CODE_FIELDS))
+        finally:
+            spinner.stop()
+
+        profiles = merge_profiles(corps, snapshot)
+        created = time.time()
+        data = {'corps': corps, 'stock_market': stock_market, 'trading_halt': trading_halt,
+                'profiles': profiles, 'created': created}
+        try:
+            save_snapshot(corps, stock_market, trading_halt, profiles, path=self._snapshot_path, created=created)
+        except OSError as ex:
+            warnings.warn('Unable to save the company list snapshot: {}'.format(ex), RuntimeWarning)
+        return data
+
+    def _build(self, data: Dict, profile=False):
+        """ 회사 정보 DataFrame 및 검색용 Index 생성
+
+        Parameters
+        ----------
+        data: dict
+            corps, stock_market, trading_halt, profiles 정보
+        profile: bool, optional
+            상세정보 로딩 여부
+        """
+        self._reset()
+        self._profile = profile
+        self._created = data.get('created')
+        # Snapshot 의 데이터가 변경되지 않도록 복사 후 사용
+        self._stock_market = {k: dict(v) for k, v in data['stock_market'].items()}
+        self._trading_halt = dict(data['trading_halt'])
+        self._profiles = dict(data.get('profiles') or {})
+
+        corps = data['corps']
+        if not isinstance(corps, pd.DataFrame):
+            corps = pd.DataFrame(list(corps), columns=list(CORP_CODE_FIELDS))
+        # None 을 유지하기 위해 object 타입으로 저장
+        df = corps.reindex(columns=list(CORP_CODE_FIELDS)).astype(object).reset_index(drop=True)
+        df = df.where(df.notna(), None)
+
+        size = len(df)
+        corp_cls_list = ['E'] * size
+        corp_product = [None] * size
+        corp_sector = [None] * size
+        listed = [False] * size
+        halted = [False] * size
+        issues = [None] * size
+
+        self._corp_codes = {corp_code: idx for idx, corp_code in enumerate(df['corp_code'])}
+        for idx, stock_code in enumerate(df['stock_code']):
+            if stock_code is None:
+                continue
+            info = self._stock_market.get(stock_code)
+            if info is None:
+                self._delisting[stock_code] = idx
+                continue
+            trading_halt = self._trading_halt.get(stock_code)
+            if trading_halt:
+                halted[idx] = True
+                issues[idx] = trading_halt['issue']
+            corp_cls_list[idx] = info['corp_cls']
+            corp_product[idx] = info['product']
+            corp_sector[idx] = info['sector']
+            listed[idx] = True
+            self._stock_codes[stock_code] = idx
+
+        df['corp_cls'] = pd.Series(corp_cls_list, dtype=object)
+        df['sector'] = pd.Series(corp_sector, dtype=object)
+        df['product'] = pd.Series(corp_product, dtype=object)
+        df['listed'] = pd.Series(listed, dtype=bool)
+        df['trading_halt'] = pd.Series(halted, dtype=bool)
+        df['issue'] = pd.Series(issues, dtype=object)
+
+        self._df = df
+        self._columns = {column: df[column].to_numpy() for column in df.columns}
+        self._corps = [None] * size
+        self._sectors = sorted(set(x for x, y in zip(corp_sector, listed) if y))
+
+    def _materialize(self, indices: List[int]) -> List[Corp]:
+        """ DataFrame 의 행을 Corp 로 변환, 생성된 Corp 는 재사용
+
+        Parameters
+        ----------
+        indices: list of int
+            행 번호 리스트
+
+        Returns
+        -------
+        list of Corp
+            회사 정보를 담고 있는 클래스 리스트
+        """
+        self.load(profile=self._profile)
+        columns = self._columns.items()
+        for idx in indices:
+            if self._corps[idx] is None:
+                row = {column: values[idx] for column, values in columns}
+                self._corps[idx] = self._create_corp(row)
+        return [self._corps[idx] for idx in indices]
+
+    def _create_corp(self, row: Dict) -> Corp:
+        """ DataFrame 의 행 정보를 이용한 Corp 생성 """
+        corp = Corp(**{key: row[key] for key in CORP_CODE_FIELDS}, profile=self._profile)
+        # 저장된 기업개황 정보
+        profile_info = self._profiles.get(row['corp_code'])
+        if profile_info is not None:
+            corp.update(profile_info)
+            corp._loading = True
+        if row['listed']:
+            info = {'sector': row['sector'], 'product': row['product'], 'corp_cls': row['corp_cls']}
+            if row['trading_halt']:
+                info['trading_halt'] = True
+                info['issue'] = row['issue']
+            corp.update(info)
+        return corp
 
-        sectors = set()
-
-        self._corps = [Corp(**x, profile=profile) for x in get_corp_code()]
-        for idx, x in enumerate(self._corps):
-            self._corp_codes[x.corp_code] = idx
-            self._corp_names.append(x.corp_name)
-            stock_code = x.stock_code
-            # Market type check
-            corp_cls = 'E'
-            product = None
-            sector = None
-            if stock_code is not None:
-                try:
-                    info = self._stock_market[stock_code]
-                    trading_halt = self._trading_halt.get(stock_code)
-                    if trading_halt:
-                        info['trading_halt'] = True
-                        info['issue'] = trading_halt['issue']
-                    corp_cls = info['corp_cls']
-                    product = info['product']
-                    sector = info['sector']
-                    sectors.add(sector)
-                    self._stock_codes[stock_code] = idx
-                    # Update information
-                    x.update(info)
-                except KeyError:
-                    self._delisting[stock_code] = idx
-            self._corp_cls_list.append(corp_cls)
-            self._corp_product.append(product)
-            self._corp_sector.append(sector)
-        self._sectors = sorted(list(sectors))
-        spinner.stop()
+    @property
+    def search_index(self) -> CorpSearchIndex:
+        """ 검색용 색인, 최초 검색시 생성 """
+        self.load(profile=self._profile)
+        index = self._index
+        if index is None:
+            with self._index_lock:
+                if self._index is None:
+                    self._index = CorpSearchIndex(self._df)
+                index = self._index
+        return index
+
+    def refresh(self):
+        """ 회사 정보를 새로 다운로드하고 Snapshot 갱신 """
+        snapshot = load_snapshot(self._snapshot_path)
+        self._build(self._download(snapshot), profile=self._profile)
+
+    def load_profiles(self, corps: List[Union[Corp, str]] = None, max_workers: int = 4,
+                      progressbar: bool = True, refresh: bool = False) -> Dict[str, Exception]:
+        """ 여러 회사의 기업개황 정보를 병렬로 로딩 후 Snapshot 에 저장
+
+        모든 요청은 dart_fss.utils.request 의 요청 제한(RateLimiter)을 공유하며, 저장된 기업개황 정보는
+        최종변경일자(modify_date)가 변경되기 전까지 다시 요청하지 않는다.
+
+        Parameters
+        ----------
+        corps: list of Corp or str, optional
+            Corp 또는 공시대상회사의 고유번호 리스트(default: 모든 상장 회사)
+        max_workers: int, optional
+            최대 Thread 수 (default: 4)
+        progressbar: bool, optional
+            ProgressBar 표시 여부 (default: True)
+        refresh: bool, optional
+            True 인 경우 저장된 기업개황 정보가 있어도 다시 요청 (default: False)
+
+        Returns
+        -------
+        dict of {str: Exception}
+            기업개황 정보 로딩에 실패한 회사의 고유번호 및 발생한 예외
+
+        Examples
+        --------
+        >>> from dart_fss import get_corp_list
+        >>> corp_list = get_corp_list()
+        >>> errors = corp_list.load_profiles()
+        >>> corp_list.find_by_stock_code('005930').ceo_nm
+        """
+        self.load(profile=self._profile)
+        if corps is None:
+            indices = sorted(self._stock_codes.values())
+            corp_codes = [self._columns['corp_code'][idx] for idx in indices]
+        else:
+            corp_codes = [x.corp_code if isinstance(x, Corp) else x for x in corps]
+        corp_codes = list(dict.fromkeys(corp_codes))
+        if not refresh:
+            corp_codes = [x for x in corp_codes if x not in self._profiles]
+
+        results = thread_map(get_corp_profile, corp_codes, max_workers=max_workers, return_exceptions=True,
+                             progressbar=progressbar, desc='Loading company profiles')
+
+        errors = dict()
+        for corp_code, info in zip(corp_codes, results):
+            if isinstance(info, Exception):
+                errors[corp_code] = info
+                continue
+            self._profiles[corp_code] = info
+            # 이미 생성된 Corp 정보 갱신
+            idx = self._corp_codes.get(corp_code)
+            corp = self._corps[idx] if idx is not None else None
+            if corp is not None:
+                corp.update(info)
+                corp._loading = True
+
+        if len(corp_codes) > len(errors):
+            try:
+                save_snapshot(self._df[list(CORP_CODE_FIELDS)], self._stock_market, self._trading_halt,
+                              self._profiles, path=self._snapshot_path, created=self._created)
+            except OSError as ex:
+                warnings.warn('Unable to save the company list snapshot: {}'.format(ex), RuntimeWarning)
+        return errors
+
+    @property
+    def created(self) -> Union[datetime.datetime, None]:
+        """ 회사 정보 다운로드 시각 """
+        if self._created is None:
+            return None
+        return datetime.datetime.fromtimestamp(self._created)
 
     @property
     def corps(self):
         """ 모든 상장된 종목(회사)를 반환한다 """
         self.load(profile=self._profile)
-        return self._corps
+        return self._materialize(range(len(self._df)))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """ 회사 정보를 DataFrame 으로 반환
+
+        Returns
+        -------
+        pd.DataFrame
+            corp_code, corp_name, corp_eng_name, stock_code, modify_date, corp_cls, sector, product, listed,
+            trading_halt, issue 정보
+        """
+        self.load(profile=self._profile)
+        return self._df.copy()
 
     def find_by_corp_code(self, corp_code):
         """ DART에서 사용하는 회사 코드를 이용한 찾기
@@ -153,9 +424,9 @@ class CorpList(object, metaclass=Singleton):
         Corp
             회사 정보를 담고 있는 클래스
         """
-        corps = self.corps
+        self.load(profile=self._profile)
         idx = self._corp_codes.get(corp_code)
-        return corps[idx] if idx is not None else None
+        return self._materialize([idx])[0] if idx is not None else None
 
     def find_by_corp_name(self, corp_name, exactly=False, market='YKNE'):
         """ 회사 명칭을 이용한 검색
@@ -173,20 +444,10 @@ class CorpList(object, metaclass=Singleton):
         list of Corp
             회사 정보를 담고 있는 클래스 리스트
         """
-        corps = self.corps
-        res = []
-        if exactly is True:
-            corp_name = '^' + corp_name + '$'
-        regex = re.compile(corp_name)
-
         # market 타입 체크 및 list로 변경
         market = market_type_checker(market)
-
-        for idx, corp_name in enumerate(self._corp_names):
-            if regex.search(corp_name) is not None:
-                if self._corp_cls_list[idx] in market:
-                    res.append(corps[idx])
-        return res if len(res) > 0 else None
+        indices = self.search_index.find_by_corp_name(corp_name, exactly=exactly is True, market=market)
+        return self._materialize(indices) if len(indices) > 0 else None
 
     def find_by_product(self, product, market='YKN'):
         """ 취급 상품으로 검색(코스피, 코스닥, 코넥스만 지원)
@@ -202,21 +463,12 @@ class CorpList(object, metaclass=Singleton):
         list of Corp
             회사 정보를 담고 있는 클래스 리스트
         """
-        corps = self.corps
-        res = []
-
-        regex = re.compile(product)
-
         # market 타입 체크 및 list로 변경
         market = market_type_checker(market)
         if 'E' in market:
             raise ValueError('ETC Market is not supported')
-
-        for idx, product in enumerate(self._corp_product):
-            if product and regex.search(product) is not None:
-                if self._corp_cls_list[idx] in market:
-                    res.append(corps[idx])
-        return res if len(res) > 0 else None
+        indices = self.search_index.find_by_value('product', product, market)
+        return self._materialize(indices) if len(indices) > 0 else None
 
     def find_by_sector(self, sector, market='YKN'):
         """ 산업 섹터로 검색(코스피, 코스닥, 코넥스만 지원)
@@ -232,21 +484,41 @@ class CorpList(object, metaclass=Singleton):
         list of Corp
             회사 정보를 담고 있는 클래스 리스트
         """
-        corps = self.corps
-        res = []
-
-        regex = re.compile(sector)
-
         # market 타입 체크 및 list로 변경
         market = market_type_checker(market)
         if 'E' in market:
             raise ValueError('ETC Market is not supported')
+        indices = self.search_index.find_by_value('sector', sector, market)
+        return self._materialize(indices) if len(indices) > 0 else None
+
+    def fuzzy_search(self, query: str, top_k: int = 10, market='YKNE',
+                     min_score: float = 0.0) -> List[Tuple[Corp, float]]:
+        """ 회사명, 영문 회사명 및 종목 코드를 이용한 유사 검색
+
+        회사명은 법인 형태 표기, 공백 및 특수문자를 제외한 후 bigram Dice 계수로 비교하며,
+        종목 코드는 앞자리가 일치하는 경우 일치하는 길이의 비율을 유사도로 사용한다.
+
+        Parameters
+        ----------
+        query: str
+            회사명, 영문 회사명 또는 종목 코드
+        top_k: int, optional
+            최대 검색 결과 수(default: 10)
+        market: str or list of str, optional
+            'Y': 코스피, 'K': 코스닥, 'N': 코넥스, 'E': 기타
+        min_score: float, optional
+            최소 유사도(0~1), 유사도가 min_score 보다 큰 결과만 반환(default: 0.0)
 
-        for idx, sector in enumerate(self._corp_sector):
-            if sector and regex.search(sector) is not None:
-                if self._corp_cls_list[idx] in market:
-                    res.append(corps[idx])
-        return res if len(res) > 0 else None
+        Returns
+        -------
+        list of tuple of (Corp, float)
+            유사도 내림차순 (회사 정보, 유사도) 리스트
+        """
+        # market 타입 체크 및 list로 변경
+        market = market_type_checker(market)
+        res = self.search_index.fuzzy_search(query, top_k=top_k, market=market, min_score=min_score)
+        corps = self._materialize([idx for idx, _ in res])
+        return [(corp, score) for corp, (_, score) in zip(corps, res)]
 
     @property
     def sectors(self):
@@ -268,22 +540,24 @@ class CorpList(object, metaclass=Singleton):
         Corp
             회사 정보를 담고 있는 클래스
         """
-        corps = self.corps
+        self.load(profile=self._profile)
         idx = self._stock_codes.get(stock_code)
         if include_delisting and idx is None:
             idx = self._delisting.get(stock_code)
         if (not include_trading_halt) and (self._trading_halt.get(stock_code)):
             idx = None
-        return corps[idx] if idx is not None else None
+        return self._materialize([idx])[0] if idx is not None else None
 
     def __repr__(self):
-        corps = self.corps
-        return 'Number of companies: {}'.format(len(corps))
+        return 'Number of companies: {}'.format(len(self))
 
     def __getitem__(self, item):
-        corps = self.corps
-        return corps[item]
+        self.load(profile=self._profile)
+        indices = range(len(self._df))[item]
+        if isinstance(indices, range):
+            return self._materialize(indices)
+        return self._materialize([indices])[0]
 
     def __len__(self):
-        corps = self.corps
-        return len(corps)
\ No newline at end of file
+        self.load(profile=self._profile)
+        return len(self._df)
\ No newline at end of file
@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+import re
+import bisect
+import numpy as np
+import pandas as pd
+
+from collections import defaultdict
+from typing import Dict, List, Iterable, Optional, Tuple
+
+# 한글 초성(호환용 자모)
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+# 정규식에서 특수한 의미를 가지는 문자
+_REGEX_SPECIAL = frozenset('.^$*+?{}[]\\|()')
+
+# 회사명 비교시 제외하는 법인 형태 표기
+_regex_corp_form = re.compile(
+    r'\(주\)|㈜|주식회사|\(유\)|유한회사|\b(?:co|ltd|inc|corp|corporation|limited|company|plc)\b')
+_regex_non_word = re.compile(r'[\W_]+')
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def to_choseong(text: str) -> str:
+    """ 한글 음절을 초성으로 변환, 한글 음절이 아닌 문자는 그대로 유지
+
+    Parameters
+    ----------
+    text: str
+        변환할 문자열
+
+    Returns
+    -------
+    str
+        초성 문자열
+    """
+    res = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            res.append(CHOSEONG[code // 588])
+        else:
+            res.append(ch)
+    return ''.join(res)
+
+
+def normalize_corp_name(name: str) -> str:
+    """ 회사명 비교를 위해 소문자로 변환 후 법인 형태 표기, 공백 및 특수문자 제거
+
+    Parameters
+    ----------
+    name: str
+        회사명
+
+    Returns
+    -------
+    str
+        정규화된 회사명
+    """
+    name = name.lower()
+    normalized = _regex_non_word.sub('', _regex_corp_form.sub(' ', name))
+    # 법인 형태 표기만으로 이루어진 경우
+    return normalized if normalized else _regex_non_word.sub('', name)
+
+
+def bigrams(text: str) -> set:
+    """ 앞뒤에 공백을 추가한 문자열의 bigram 반환, 1글자 문자열도 비교 가능 """
+    if not text:
+        return set()
+    text = ' ' + text + ' '
+    return set(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def is_choseong(text: str) -> bool:
+    """ 문자열이 초성으로만 이루어져 있는지 여부 """
+    return len(text) > 0 and all(ch in _CHOSEONG_SET for ch in text)
+
+
+def is_literal(pattern: str) -> bool:
+    """ 정규식 특수 문자를 포함하지 않는 문자열 여부 """
+    return not any(ch in _REGEX_SPECIAL for ch in pattern)
+
+
+class NGramIndex(object):
+    """ 부분 문자열 검색을 위한 N-gram 역색인
+
+    1글자 및 n글자 단위로 문자열이 포함된 행 번호를 저장하며, 검색시 후보 행 번호의 교집합을 구한 후
+    실제 포함 여부를 확인한다.
+    """
+    def __init__(self, values: Iterable[Optional[str]], n: int = 2):
+        """ N-gram 역색인 생성
+
+        Parameters
+        ----------
+        values: iterable of str
+            색인할 문자열, None 인 경우 제외
+        n: int, optional
+            n-gram 길이(default: 2)
+        """
+        self._n = n
+        self._values = list(values)
+        postings = defaultdict(list)
+        for idx, value in enumerate(self._values):
+            if not value:
+                continue
+            for gram in self._grams(value):
+                postings[gram].append(idx)
+        self._postings = {k: np.array(v, dtype=np.int64) for k, v in postings.items()}
+
+    def _grams(self, text: str) -> set:
+        n = self._n
+        grams = set(text)
+        grams.update(text[i:i + n] for i in range(len(text) - n + 1))
+        return grams
+
+    def candidates(self, query: str) -> np.ndarray:
+        """ query 의 모든 n-gram 을 포함하는 행 번호 반환 """
+        if len(query) < self._n:
+            grams = set(query)
+        else:
+            grams = set(query[i:i + self._n] for i in range(len(query) - self._n + 1))
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                return _EMPTY
+            postings.append(posting)
+        if len(postings) == 0:
+            return _EMPTY
+        # 짧은 목록부터 교집합
+        postings.sort(key=len)
+        res = postings[0]
+        for posting in postings[1:]:
+            res = np.intersect1d(res, posting, assume_unique=True)
+            if len(res) == 0:
+                break
+        return res
+
+    def search(self, query: str, exactly: bool = False) -> np.ndarray:
+        """ query 를 포함하는(exactly=True 인 경우 일치하는) 행 번호 반환
+
+        Parameters
+        ----------
+        query: str
+            검색어
+        exactly: bool, optional
+            일치 여부(default: False)
+
+        Returns
+        -------
+        np.ndarray
+            오름차순 행 번호
+        """
+        values = self._values
+        if exactly:
+            matched = [idx for idx in self.candidates(query).tolist() if values[idx] == query]
+        else:
+            matched = [idx for idx in self.candidates(query).tolist() if query in values[idx]]
+        return np.array(matched, dtype=np.int64)
+
+
+class FuzzyIndex(object):
+    """ Bigram Dice 계수를 이용한 유사 문자열 검색 색인 """
+    def __init__(self, values: Iterable[Optional[str]]):
+        """ 유사 문자열 검색 색인 생성
+
+        Parameters
+        ----------
+        values: iterable of str
+            색인할 문자열, None 인 경우 제외
+        """
+        values = list(values)
+        self._size = len(values)
+        self._lengths = np.zeros(self._size, dtype=np.float64)
+        postings = defaultdict(list)
+        for idx, value in enumerate(values):
+            if not value:
+                continue
+            grams = bigrams(normalize_corp_name(value))
+            self._lengths[idx] = len(grams)
+            for gram in grams:
+                postings[gram].append(idx)
+        self._postings = {k: np.array(v, dtype=np.int64) for k, v in postings.items()}
+
+    def scores(self, query: str) -> np.ndarray:
+        """ 모든 행에 대한 Dice 계수(0~1) 반환
+
+        Parameters
+        ----------
+        query: str
+            검색어
+
+        Returns
+        -------
+        np.ndarray
+            행 별 유사도
+        """
+        grams = bigrams(normalize_corp_name(query))
+        hits = [self._postings[gram] for gram in grams if gram in self._postings]
+        if len(hits) == 0:
+            return np.zeros(self._size, dtype=np.float64)
+        common = np.bincount(np.concatenate(hits), minlength=self._size)
+        return 2 * common / (len(grams) + self._lengths)
+
+
+class CorpSearchIndex(object):
+    """ CorpList 검색용 색인
+
+    회사명 Hash, 회사명 및 초성 N-gram 역색인, 시장별 Bitset, 상품 및 섹터별 행 번호를 가지고 있다.
+    """
+    def __init__(self, df: pd.DataFrame):
+        """ 검색용 색인 생성
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            corp_name, corp_cls, sector, product 정보를 포함한 회사 정보
+        """
+        names = df['corp_name'].tolist()
+        self._size = len(names)
+        self._names = names
+        self._eng_names = df['corp_eng_name'].tolist()
+        self._stock_codes = sorted((x, idx) for idx, x in enumerate(df['stock_code'].tolist()) if x)
+
+        # 회사명 Hash
+        exact = defaultdict(list)
+        for idx, name in enumerate(names):
+            if name is not None:
+                exact[name].append(idx)
+        self._exact = {k: np.array(v, dtype=np.int64) for k, v in exact.items()}
+
+        # 회사명 N-gram 역색인, 초성 역색인은 사용시 생성
+        self._name_index = NGramIndex(names)
+        self._choseong_index = None
+        # 유사 회사명 검색 색인은 사용시 생성
+        self._fuzzy_indexes = None
+
+        # 시장별 Bitset
+        corp_cls = df['corp_cls'].to_numpy()
+        self._markets = {m: corp_cls == m for m in ['Y', 'K', 'N', 'E']}
+        self._market_masks = dict()
+
+        # 상품 및 섹터별 행 번호
+        self._values = {column: self._group(df[column]) for column in ['product', 'sector']}
+
+    @staticmethod
+    def _group(series: pd.Series) -> Dict[str, np.ndarray]:
+        groups = defaultdict(list)
+        for idx, value in enumerate(series.tolist()):
+            if value:
+                groups[value].append(idx)
+        return {k: np.array(v, dtype=np.int64) for k, v in groups.items()}
+
+    def market_mask(self, market: List[str]) -> np.ndarray:
+        """ market 에 속한 회사의 Bitset 반환 """
+        key = frozenset(market)
+        mask = self._market_masks.get(key)
+        if mask is None:
+            mask = np.zeros(self._size, dtype=bool)
+            for m in key:
+                mask |= self._markets[m]
+            self._market_masks[key] = mask
+        return mask
+
+    def _filter(self, indices: np.ndarray, market: List[str]) -> List[int]:
+        if len(indices) == 0:
+            return []
+        indices = indices[self.market_mask(market)[indices]]
+        return np.sort(indices).tolist()
+
+    def find_by_corp_name(self, corp_name: str, exactly: bool = False, market: List[str] = None) -> List[int]:
+        """ 회사명으로 검색
+
+        정규식이 아닌 검색어는 색인을 이용하며, 초성으로만 이루어진 검색어는 회사명의 초성으로 검색한다.
+
+        Parameters
+        ----------
+        corp_name: str
+            회사명, 초성 또는 정규식
+        exactly: bool, optional
+            일치 여부(default: False)
+        market: list of str, optional
+            Market type 리스트(default: 전체)
+
+        Returns
+        -------
+        list of int
+            오름차순 행 번호
+        """
+        market = market or ['Y', 'K', 'N', 'E']
+        if is_choseong(corp_name):
+            indices = self.choseong_index.search(corp_name, exactly=exactly)
+        elif corp_name and is_literal(corp_name):
+            if exactly:
+                indices = self._exact.get(corp_name, _EMPTY)
+            else:
+                indices = self._name_index.search(corp_name)
+        else:
+            if exactly:
+                corp_name = '^' + corp_name + '$'
+            regex = re.compile(corp_name)
+            indices = np.array([idx for idx, name in enumerate(self._names)
+                                if name is not None and regex.search(name) is not None], dtype=np.int64)
+        return self._filter(indices, market)
+
+    @property
+    def choseong_index(self) -> NGramIndex:
+        """ 회사명 초성 N-gram 역색인 """
+        if self._choseong_index is None:
+            self._choseong_index = NGramIndex(to_choseong(x) if x else None for x in self._names)
+        return self._choseong_index
+
+    def find_by_value(self, column: str, pattern: str, market: List[str]) -> List[int]:
+        """ 상품 또는 섹터로 검색, 정규식은 중복되지 않는 값에 대해서만 검사
+
+        Parameters
+        ----------
+        column: str
+            'product' 또는 'sector'
+        pattern: str
+            정규식
+        market: list of str
+            Market type 리스트
+
+        Returns
+        -------
+        list of int
+            오름차순 행 번호
+        """
+        regex = re.compile(pattern)
+        groups = self._values[column]
+        matched = [indices for value, indices in groups.items() if regex.search(value) is not None]
+        if len(matched) == 0:
+            return []
+        return self._filter(np.concatenate(matched), market)
+
+    @property
+    def fuzzy_indexes(self) -> Tuple[FuzzyIndex, FuzzyIndex]:
+        """ 회사명 및 영문 회사명 유사 문자열 검색 색인 """
+        if self._fuzzy_indexes is None:
+            self._fuzzy_indexes = (FuzzyIndex(self._names), FuzzyIndex(self._eng_names))
+        return self._fuzzy_indexes
+
+    def _stock_code_scores(self, query: str, scores: np.ndarray):
+        """ 종목 코드가 query 로 시작하는 경우 일치하는 길이의 비율을 유사도로 사용 """
+        query = query.strip().upper()
+        if not query or not query.isalnum() or len(query) > 6:
+            return
+        stock_codes = self._stock_codes
+        start = bisect.bisect_left(stock_codes, (query,))
+        for stock_code, idx in stock_codes[start:]:
+            if not stock_code.startswith(query):
+                break
+            scores[idx] = max(scores[idx], len(query) / len(stock_code))
+
+    def fuzzy_search(self, query: str, top_k: int = 10, market: List[str] = None,
+                     min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """ 회사명, 영문 회사명 및 종목 코드를 이용한 유사 검색
+
+        Parameters
+        ----------
+        query: str
+            검색어
+        top_k: int, optional
+            최대 검색 결과 수(default: 10)
+        market: list of str, optional
+            Market type 리스트(default: 전체)
+        min_score: float, optional
+            최소 유사도, 유사도가 min_score 보다 큰 결과만 반환(default: 0.0)
+
+        Returns
+        -------
+        list of tuple of (int, float)
+            유사도 내림차순 (행 번호, 유사도)
+        """
+        market = market or ['Y', 'K', 'N', 'E']
+        name_index, eng_name_index = self.fuzzy_indexes
+        scores = np.maximum(name_index.scores(query), eng_name_index.scores(query))
+        self._stock_code_scores(query, scores)
+        scores[~self.market_mask(market)] = 0
+
+        candidates = np.flatnonzero(scores > min_score)
+        if len(candidates) > top_k:
+            # top_k 번째 유사도 이상인 후보만 정렬
+            kth = np.partition(scores[candidates], len(candidates) - top_k)[len(candidates) - top_k]
+            candidates = candidates[scores[candidates] >= kth]
+        order = np.lexsort((candidates, -scores[candidates]))[:top_k]
+        return [(int(idx), float(scores[idx])) for idx in candidates[order]]
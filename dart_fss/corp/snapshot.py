@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import pickle
+import datetime
+
+import pandas as pd
+
+from typing import Dict, List, Optional, Union, Iterator, Tuple
+
+from dart_fss.utils import get_cache_folder
+
+# Snapshot 파일 형식 버전
+CORP_LIST_SNAPSHOT_VERSION = 2
+
+# Snapshot 파일 이름
+CORP_LIST_SNAPSHOT_FILENAME = 'corp_list.pkl'
+
+
+def get_snapshot_path() -> str:
+    """ 회사 리스트 Snapshot 파일 경로 반환 """
+    return os.path.join(get_cache_folder(), CORP_LIST_SNAPSHOT_FILENAME)
+
+
+def load_snapshot(path: str = None) -> Optional[Dict]:
+    """ 저장된 회사 리스트 Snapshot 반환
+
+    Parameters
+    ----------
+    path: str, optional
+        Snapshot 파일 경로(default: {cache folder}/corp_list.pkl)
+
+    Returns
+    -------
+    dict or None
+        created, corps, stock_market, trading_halt, profiles 정보, 없거나 읽을 수 없는 경우 None
+    """
+    path = path or get_snapshot_path()
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if not isinstance(data, dict) or data.get('version') != CORP_LIST_SNAPSHOT_VERSION:
+        return None
+    return data
+
+
+def save_snapshot(corps: pd.DataFrame, stock_market: Dict, trading_halt: Dict,
+                  profiles: Dict[str, Dict], path: str = None, created: float = None):
+    """ 회사 리스트 Snapshot 저장
+
+    Parameters
+    ----------
+    corps: pd.DataFrame
+        공시대상회사 정보(corp_code, corp_name, corp_eng_name, stock_code, modify_date)
+    stock_market: dict
+        상장 회사 정보
+    trading_halt: dict
+        거래정지 회사 정보
+    profiles: dict of {str: dict}
+        corp_code 별 기업개황 정보
+    path: str, optional
+        Snapshot 파일 경로(default: {cache folder}/corp_list.pkl)
+    created: float, optional
+        Snapshot 생성 시각(default: 현재 시각)
+    """
+    path = path or get_snapshot_path()
+    data = {
+        'version': CORP_LIST_SNAPSHOT_VERSION,
+        'created': time.time() if created is None else created,
+        'corps': corps,
+        'stock_market': stock_market,
+        'trading_halt': trading_halt,
+        'profiles': profiles,
+    }
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+
+def is_expired(snapshot: Dict, max_age: Optional[datetime.timedelta]) -> bool:
+    """ Snapshot 만료 여부 반환, max_age 가 None 인 경우 항상 만료 """
+    if max_age is None:
+        return True
+    return time.time() - snapshot['created'] > max_age.total_seconds()
+
+
+def _iter_modify_dates(corps: Union[pd.DataFrame, List[Dict]]) -> Iterator[Tuple[str, str]]:
+    """ (corp_code, modify_date) 반환 """
+    if isinstance(corps, pd.DataFrame):
+        return zip(corps['corp_code'], corps['modify_date'])
+    return ((x['corp_code'], x.get('modify_date')) for x in corps)
+
+
+def merge_profiles(corps: Union[pd.DataFrame, List[Dict]], snapshot: Optional[Dict]) -> Dict[str, Dict]:
+    """ 최종변경일자(modify_date)가 동일한 회사의 기업개황 정보만 유지
+
+    Parameters
+    ----------
+    corps: pd.DataFrame or list of dict
+        새로 다운로드한 공시대상회사 정보
+    snapshot: dict
+        이전 Snapshot
+
+    Returns
+    -------
+    dict of {str: dict}
+        유지할 corp_code 별 기업개황 정보
+    """
+    if snapshot is None:
+        return {}
+    profiles = snapshot.get('profiles') or {}
+    if len(profiles) == 0:
+        return {}
+    modify_dates = dict(_iter_modify_dates(snapshot['corps']))
+    return {corp_code: profiles[corp_code] for corp_code, modify_date in _iter_modify_dates(corps)
+            if corp_code in profiles and modify_dates.get(corp_code) == modify_date}
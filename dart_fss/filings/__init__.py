@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
-from dart_fss.filings.search import search
+from dart_fss.filings.search import search, search_iter, search_all
+from dart_fss.filings.crawler import split_date_range, iter_filings, crawl_filings
+from dart_fss.filings.store import FilingStore
+from dart_fss.filings.sync import sync_filings
 
-__all__ = ['search']
\ No newline at end of file
+__all__ = ['search', 'search_iter', 'search_all', 'split_date_range', 'iter_filings', 'crawl_filings',
+           'FilingStore', 'sync_filings']
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple, Union
+
+from dateutil.relativedelta import relativedelta
+
+from dart_fss.api.filings import search_filings
+from dart_fss.errors import NoDataReceived
+from dart_fss.filings.store import FilingStore
+from dart_fss.utils import get_datetime, is_notebook
+
+str_or_list = Union[str, List[str]]
+
+# 고유번호(corp_code) 없이 검색 가능한 최대 기간(개월)
+SEARCH_WINDOW_MONTHS = 3
+
+
+def split_date_range(bgn_de: str, end_de: str = None, months: int = SEARCH_WINDOW_MONTHS) -> List[Tuple[str, str]]:
+    """ 검색 기간을 months 개월 이하의 기간으로 분할
+
+    Parameters
+    ----------
+    bgn_de: str
+        검색시작 접수일자(YYYYMMDD)
+    end_de: str, optional
+        검색종료 접수일자(YYYYMMDD), 없으면 당일
+    months: int, optional
+        분할 기간(개월), default: 3
+
+    Returns
+    -------
+    list of tuple of str
+        (검색시작 접수일자, 검색종료 접수일자) 리스트
+    """
+    bgn = get_datetime(bgn_de)
+    end = get_datetime(end_de) if end_de else datetime.today()
+    if bgn > end:
+        raise ValueError('bgn_de must be earlier than end_de')
+    windows = []
+    while bgn <= end:
+        window_end = min(bgn + relativedelta(months=months) - timedelta(days=1), end)
+        windows.append((bgn.strftime('%Y%m%d'), window_end.strftime('%Y%m%d')))
+        bgn = window_end + timedelta(days=1)
+    return windows
+
+
+def iter_filings(bgn_de: str,
+                 end_de: str = None,
+                 last_reprt_at: str = 'N',
+                 pblntf_ty: str_or_list = None,
+                 pblntf_detail_ty: str_or_list = None,
+                 corp_cls: str = None,
+                 page_count: int = 100,
+                 max_workers: int = 4,
+                 progressbar: bool = True) -> Iterator[Dict]:
+    """ 전체 회사의 공시검색 결과를 기간 분할 및 병렬 요청을 통해 반환
+
+    검색 기간을 3개월 이하의 기간으로 분할한 후 각 기간의 모든 페이지를 병렬로 요청하며,
+    모든 요청은 dart_fss.utils.request 의 요청 제한(RateLimiter)을 공유한다.
+    결과는 요청이 완료된 순서대로 반환되며, 접수번호(rcept_no)가 중복된 공시는 한번만 반환한다.
+
+    Parameters
+    ----------
+    bgn_de: str
+        검색시작 접수일자(YYYYMMDD)
+    end_de: str, optional
+        검색종료 접수일자(YYYYMMDD), 없으면 당일
+    last_reprt_at: str, optional
+        최종보고서만 검색여부(Y or N), default : N
+    pblntf_ty: str, optional
+        공시유형
+    pblntf_detail_ty: str, optional
+        공시상세유형
+    corp_cls: str, optional
+        법인구분 : Y(유가), K(코스닥), N(코넥스), E(기타), 없으면 전체조회
+    page_count: int, optional
+        페이지당 건수(1~100), default : 100
+    max_workers: int, optional
+        최대 Thread 수 (default: 4)
+    progressbar: bool, optional
+        ProgressBar 표시 여부 (default: True)
+
+    Yields
+    ------
+    dict
+        search_filings 검색 결과의 list 항목
+    """
+    if is_notebook():
+        from tqdm import tqdm_notebook as tqdm
+    else:
+        from tqdm import tqdm
+
+    params = dict(last_reprt_at=last_reprt_at, pblntf_ty=pblntf_ty, pblntf_detail_ty=pblntf_detail_ty,
+                  corp_cls=corp_cls, page_count=page_count)
+
+    def fetch(window, page_no):
+        try:
+            return search_filings(bgn_de=window[0], end_de=window[1], page_no=page_no, **params)
+        except NoDataReceived:
+            return None
+
+    windows = split_date_range(bgn_de, end_de)
+    seen = set()
+    pbar = tqdm(total=len(windows), desc='Searching filings', unit='page', disable=not progressbar)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {executor.submit(fetch, window, 1): window for window in windows}
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                window = pending.pop(future)
+                resp = future.result()
+                pbar.update(1)
+                if resp is None:
+                    continue
+                # 첫 페이지 결과로 나머지 페이지 요청
+                if int(resp['page_no']) == 1:
+                    total_page = int(resp['total_page'])
+                    pbar.total += max(total_page - 1, 0)
+                    pbar.refresh()
+                    for page_no in range(2, total_page + 1):
+                        pending[executor.submit(fetch, window, page_no)] = window
+                for filing in resp['list']:
+                    rcept_no = filing['rcept_no']
+                    if rcept_no in seen:
+                        continue
+                    seen.add(rcept_no)
+                    yield filing
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+        pbar.close()
+
+
+def crawl_filings(store: Union[str, FilingStore],
+                  bgn_de: str,
+                  end_de: str = None,
+                  last_reprt_at: str = 'N',
+                  pblntf_ty: str_or_list = None,
+                  pblntf_detail_ty: str_or_list = None,
+                  corp_cls: str = None,
+                  max_workers: int = 4,
+                  batch_size: int = 1000,
+                  progressbar: bool = True) -> int:
+    """ 전체 회사의 공시검색 결과를 수집하여 SQLite 에 저장
+
+    iter_filings 의 결과를 batch_size 단위로 저장하므로 중단된 경우에도 수집된 결과는 유지된다.
+
+    Parameters
+    ----------
+    store: str or FilingStore
+        SQLite 파일 경로 또는 FilingStore
+    bgn_de: str
+        검색시작 접수일자(YYYYMMDD)
+    end_de: str, optional
+        검색종료 접수일자(YYYYMMDD), 없으면 당일
+    last_reprt_at: str, optional
+        최종보고서만 검색여부(Y or N), default : N
+    pblntf_ty: str, optional
+        공시유형
+    pblntf_detail_ty: str, optional
+        공시상세유형
+    corp_cls: str, optional
+        법인구분 : Y(유가), K(코스닥), N(코넥스), E(기타), 없으면 전체조회
+    max_workers: int, optional
+        최대 Thread 수 (default: 4)
+    batch_size: int, optional
+        한번에 저장할 공시 수 (default: 1000)
+    progressbar: bool, optional
+        ProgressBar 표시 여부 (default: True)
+
+    Returns
+    -------
+    int
+        새로 저장된 공시 수
+
+    Examples
+    --------
+    >>> from dart_fss.filings import crawl_filings, FilingStore
+    >>> with FilingStore('./filings.db') as store:
+    ...     crawl_filings(store, bgn_de='20190101', end_de='20191231')
+    ...     df = store.to_dataframe()
+    """
+    own_store = not isinstance(store, FilingStore)
+    if own_store:
+        store = FilingStore(store)
+
+    count = 0
+    batch = []
+    try:
+        for filing in iter_filings(bgn_de=bgn_de, end_de=end_de, last_reprt_at=last_reprt_at, pblntf_ty=pblntf_ty,
+                                   pblntf_detail_ty=pblntf_detail_ty, corp_cls=corp_cls,
+                                   max_workers=max_workers, progressbar=progressbar):
+            batch.append(filing)
+            if len(batch) >= batch_size:
+                count += store.add(batch)
+                batch = []
+    finally:
+        # 오류가 발생한 경우에도 수집된 결과 저장
+        try:
+            count += store.add(batch)
+        finally:
+            if own_store:
+                store.close()
+    return count
@@ -4,8 +4,13 @@ import re
 import base64
 
 from typing import Dict
-from bs4 import BeautifulSoup
-from dart_fss.utils import request
+from dart_fss.utils import request, html_to_soup
+
+regex_window_open = re.compile(r'window.open\(\'(.*?)\'')
+
+
+def _add_prefix(match_obj):
+    return r"window.open('https://dart.fss.or.kr" + match_obj.group(1) + r"'"
 
 
 class Page(object):
@@ -39,6 +44,7 @@ class Page(object):
         self._length = length
         self._dtd = dtd
         self._html = None
+        self._soup = None
         if not lazy_loading:
             self.load()
 
@@ -53,9 +59,28 @@ class Page(object):
 
         """
         if self._html is None:
-            self.load()
+            # 분석된 html 을 필요한 경우에만 문자열로 변환
+            self._html = str(self.soup)
         return self._html
 
+    @property
+    def soup(self):
+        """ 분석된 html 반환
+
+        load 시 한번만 분석한 결과를 보관하여 반환하므로, 반환된 객체를 수정하는 경우 복사 후 수정해야 한다.
+
+        Returns
+        -------
+        BeautifulSoup
+            page html
+        """
+        if self._soup is None:
+            if self._html is None:
+                self.load()
+            else:
+                self._soup = html_to_soup(self._html)
+        return self._soup
+
     def load(self):
         """ page loading 함수 """
         def change_url(bs, tag):
@@ -65,9 +90,6 @@ class Page(object):
                     t[tag] = "https://dart.fss.or.kr" + t[tag]
             return bs
 
-        def add_prefix(match_obj):
-            return r"window.open('https://dart.fss.or.kr" + match_obj.group(1) + r"'"
-
         payload = {
             'rcpNo': self.rcp_no,
             'dcmNo': self.dcm_no,
@@ -82,7 +104,9 @@ class Page(object):
         except UnicodeDecodeError:
             html = html.decode('cp949')
         finally:
-            soup = BeautifulSoup(html, 'html.parser')
+            # window.open 의 URL 을 분석 전에 변환하여 html 을 한번만 분석
+            html = regex_window_open.sub(_add_prefix, html)
+            soup = html_to_soup(html)
             meta = soup.find('meta', {'content': re.compile(r'charset')})
             if meta:
                 meta['content'] = meta['content'].replace('euc-kr', 'utf-8')
@@ -90,10 +114,8 @@ class Page(object):
             soup = change_url(soup, 'href')
             soup = change_url(soup, 'src')
 
-            html = str(soup)
-            html = re.sub(r'window.open\(\'(.*?)\'', add_prefix, html)
-
-            self._html = html
+            self._soup = soup
+            self._html = None
 
     def to_dict(self, summary=True) -> Dict[str, str]:
         """ dict 타입으로 반환
@@ -1,18 +1,22 @@
 # -*- coding: utf-8 -*-
 import re
-import copy
 
 from urllib.parse import parse_qs
 from typing import Iterable
 from bs4 import BeautifulSoup
 
 from dart_fss.filings.pages import Page
-from dart_fss.utils import dict_to_html, request, str_compare, unzip, search_file
+from dart_fss.utils import dict_to_html, request, str_compare, unzip, search_file, html_to_soup
 from dart_fss.xbrl import get_xbrl_from_file
+from dart_fss.xbrl.cache import xbrl_cache
 from dart_fss.utils.regex import str_to_regex
+from dart_fss.utils.concurrency import thread_map
 from dart_fss.api.finance import download_xbrl
 from dart_fss.filings.xbrl_viewer import XBRLViewer
 
+# Report.load 로 불러올 수 있는 항목
+REPORT_COMPONENTS = ('related_reports', 'attached_reports', 'pages', 'attached_files', 'xbrlviewer')
+
 
 class Report(object):
     """ 보고서 클래스
@@ -65,7 +69,8 @@ class Report(object):
             raise ValueError('rcp_no must be not None')
 
         self.dcm_no = kwargs.get('dcm_no')
-        self.info = copy.deepcopy(kwargs)
+        # 검색 결과의 값은 문자열이며, parent(Report) 및 lazy_loading 은 공유해도 되므로 얕은 복사로 충분
+        self.info = dict(kwargs)
         if self.dcm_no:
             self.info.pop('dcm_no')
 
@@ -111,7 +116,7 @@ class Report(object):
             payload['dcmNo'] = self.dcm_no
         resp = request.get(url=self._REPORT_URL_,
                            payload=payload, referer=self._DART_URL_)
-        self.html = BeautifulSoup(resp.text, 'html.parser')
+        self.html = html_to_soup(resp.text)
 
     @property
     def related_reports(self):
@@ -251,7 +256,7 @@ class Report(object):
         resp = request.get(url=self._DOWNLOAD_URL_,
                            payload=payload, referer=self._REPORT_URL_)
         referer = resp.url
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        soup = html_to_soup(resp.text)
         tr_list = soup.find_all('tr')
         attached_files = []
 
@@ -328,15 +333,56 @@ class Report(object):
             self._xbrlviewer = XBRLViewer(self.rcp_no, lazy_loading=False)
         return self._xbrlviewer
 
-    def load(self):
-        """ 페이지들의 HTML을 불러오는 함수 """
+    def load(self, concurrent: bool = False, components: Iterable[str] = None, max_workers: int = 4):
+        """ 페이지들의 HTML을 불러오는 함수
+
+        concurrent 가 True 인 경우 보고서 HTML 을 불러온 후 첨부파일 목록, XBRL Viewer,
+        연관 보고서 및 첨부 보고서의 HTML 을 병렬로 요청한다.
+        모든 요청은 dart_fss.utils.request 의 요청 제한(RateLimiter)을 공유한다.
+
+        Parameters
+        ----------
+        concurrent: bool, optional
+            병렬 요청 여부(default: False)
+        components: iterable of str, optional
+            불러올 항목, 'related_reports', 'attached_reports', 'pages', 'attached_files', 'xbrlviewer' 중
+            선택(default: 전체)
+        max_workers: int, optional
+            최대 Thread 수 (default: 4)
+        """
+        components = list(REPORT_COMPONENTS) if components is None else list(components)
+        for component in components:
+            if component not in REPORT_COMPONENTS:
+                raise ValueError('Invalid component: {}'.format(component))
+
         self._get_report()
-        self.extract_related_reports()
-        self.extract_attached_reports()
-        self.extract_pages()
-        self.extract_attached_files()
-        self.extract_xbrlviewer()
-        self.find_all()
+        extractors = {
+            'related_reports': self.extract_related_reports,
+            'attached_reports': self.extract_attached_reports,
+            'pages': self.extract_pages,
+            'attached_files': self.extract_attached_files,
+            'xbrlviewer': self.extract_xbrlviewer,
+        }
+        if not concurrent:
+            for component in components:
+                extractors[component]()
+        else:
+            # 보고서 HTML 에서 추출하는 항목은 바로 처리하고, 추가 요청이 필요한 항목은 병렬로 요청
+            requested = ('attached_files', 'xbrlviewer')
+            for component in components:
+                if component not in requested:
+                    extractors[component]()
+            tasks = [extractors[component] for component in components if component in requested]
+            children = []
+            if 'related_reports' in components:
+                children.extend(self.related_reports)
+            if 'attached_reports' in components:
+                children.extend(self.attached_reports)
+            tasks.extend(child._get_report for child in children if child.html is None)
+            thread_map(lambda task: task(), tasks, max_workers=max_workers)
+
+        if len(components) > 0:
+            self.find_all(scope=components)
 
     def find_all(self, **kwargs):
         """ 보고서의 Page 재묵을 검색하여 검색된 Page 리스틑 반환하는 함수
@@ -416,27 +462,57 @@ class Report(object):
         """ XBRL 데이터 반환"""
         import tempfile
         if self._xbrl is None:
-            with tempfile.TemporaryDirectory() as path:
+            self._xbrl = xbrl_cache.get_model(self.rcept_no)
+        if self._xbrl is None:
+            if xbrl_cache.enabled:
+                # 캐시 폴더에 저장된 XBRL 파일 사용
                 try:
-                    file_path = download_xbrl(
-                        path=path, rcept_no=self.rcept_no)
-                    self._xbrl = get_xbrl_from_file(file_path)
-                except FileNotFoundError:
-                    xbrl_attached = self._get_xbrl()
-                    if xbrl_attached is not None:
-                        zip_path = xbrl_attached.download(path=path)
-                        folder_path = unzip(zip_path['full_path'])
-                        file = search_file(folder_path)
-                        if len(file) > 0:
-                            self._xbrl = get_xbrl_from_file(file[0])
-                        elif self.xbrlviewer.empty is False:
-                            self._xbrl = self.xbrlviewer.xbrl
-                        else:
-                            self._xbrl = None
-                    else:
-                        self._xbrl = None
+                    self._xbrl = self._load_xbrl(xbrl_cache.folder(self.rcept_no))
+                except BaseException:
+                    # 다운로드 또는 압축해제 중 오류가 발생한 경우 불완전한 파일이 재사용되지 않도록 삭제
+                    xbrl_cache.clear(self.rcept_no)
+                    raise
+                if self._xbrl is None:
+                    xbrl_cache.clear(self.rcept_no)
+                xbrl_cache.set_model(self.rcept_no, self._xbrl)
+            else:
+                with tempfile.TemporaryDirectory() as path:
+                    self._xbrl = self._load_xbrl(path)
         return self._xbrl
 
+    def _load_xbrl(self, path: str):
+        """ XBRL 파일 다운로드 및 로딩
+
+        Parameters
+        ----------
+        path: str
+            XBRL 파일 저장 경로
+
+        Returns
+        -------
+        DartXbrl or None
+            DartXbrl
+        """
+        file = search_file(path)
+        if len(file) > 0:
+            return get_xbrl_from_file(file[0])
+
+        try:
+            file_path = download_xbrl(
+                path=path, rcept_no=self.rcept_no)
+            return get_xbrl_from_file(file_path)
+        except FileNotFoundError:
+            xbrl_attached = self._get_xbrl()
+            if xbrl_attached is not None:
+                zip_path = xbrl_attached.download(path=path)
+                folder_path = unzip(zip_path['full_path'])
+                file = search_file(folder_path)
+                if len(file) > 0:
+                    return get_xbrl_from_file(file[0])
+                elif self.xbrlviewer.empty is False:
+                    return self.xbrlviewer.xbrl
+        return None
+
     def _get_xbrl(self):
         """ XBRL 첨부파일 검색"""
         query = {
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
-from typing import Union, List
+import itertools
+
+from typing import Union, List, Iterator
 from dart_fss.api.filings import search_filings
-from dart_fss.filings.search_result import SearchResults
+from dart_fss.errors import NoDataReceived
+from dart_fss.filings.reports import Report
+from dart_fss.filings.search_result import SearchResults, iter_responses
 str_or_list = Union[str, List[str]]
 
 
@@ -48,15 +52,148 @@ def search(corp_code: str = None,
     SearchResults
         검색결과
     """
-    resp = search_filings(corp_code=corp_code,
-                          bgn_de=bgn_de,
-                          end_de=end_de,
-                          last_reprt_at=last_reprt_at,
-                          pblntf_ty=pblntf_ty,
-                          pblntf_detail_ty=pblntf_detail_ty,
-                          corp_cls=corp_cls,
-                          sort=sort,
-                          sort_mth=sort_mth,
-                          page_no=page_no,
-                          page_count=page_count)
-    return SearchResults(resp)
\ No newline at end of file
+    params = dict(corp_code=corp_code,
+                  bgn_de=bgn_de,
+                  end_de=end_de,
+                  last_reprt_at=last_reprt_at,
+                  pblntf_ty=pblntf_ty,
+                  pblntf_detail_ty=pblntf_detail_ty,
+                  corp_cls=corp_cls,
+                  sort=sort,
+                  sort_mth=sort_mth,
+                  page_count=page_count)
+    resp = search_filings(**params, page_no=page_no)
+    return SearchResults(resp, params=params)
+
+
+def search_iter(corp_code: str = None,
+                bgn_de: str = None,
+                end_de: str = None,
+                last_reprt_at: str = 'N',
+                pblntf_ty: str_or_list = None,
+                pblntf_detail_ty: str_or_list = None,
+                corp_cls: str = None,
+                sort: str = 'date',
+                sort_mth: str = 'desc',
+                page_count: int = 100,
+                prefetch: bool = True) -> Iterator[Report]:
+    """ 모든 페이지의 공시보고서를 순차적으로 반환
+
+    페이지는 필요할 때 요청하며, prefetch 가 True 인 경우 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청한다.
+    검색 결과가 없는 경우 아무것도 반환하지 않는다.
+
+    Parameters
+    ----------
+    corp_code: str, optional
+        공시대상회사의 고유번호(8자리), 고유번호(corp_code)가 없는 경우 검색기간은 3개월로 제한
+    bgn_de: str, optional
+        검색시작 접수일자(YYYYMMDD), 없으면 종료일(end_de)
+    end_de: str, optional
+        검색종료 접수일자(YYYYMMDD), 없으면 당일
+    last_reprt_at: str, optional
+        최종보고서만 검색여부(Y or N), default : N
+    pblntf_ty: str, optional
+        공시유형 / Open DART  공시정보 -> 공시검색 -> 상세유형 참고
+    pblntf_detail_ty: str, optional
+        공시상세유형 / Open DART  공시정보 -> 공시검색 -> 상세유형 참고
+    corp_cls: str, optional
+        법인구분 : Y(유가), K(코스닥), N(코넥스), E(기타), 없으면 전체조회
+    sort: str, optional
+        정렬, {접수일자: date, 회사명: crp, 고서명: rpt}
+    sort_mth: str, optional
+        오름차순(asc), 내림차순(desc), default : desc
+    page_count: int, optional
+        페이지당 건수(1~100) default : 100
+    prefetch: bool, optional
+        다음 페이지 미리 요청 여부(default: True)
+
+    Yields
+    ------
+    Report
+        검색된 리포트
+
+    Examples
+    --------
+    >>> from dart_fss.filings import search_iter
+    >>> for report in search_iter(corp_code='00126380', bgn_de='20100101', pblntf_ty='A'):
+    ...     print(report.report_nm)
+    """
+    try:
+        results = search(corp_code=corp_code, bgn_de=bgn_de, end_de=end_de, last_reprt_at=last_reprt_at,
+                         pblntf_ty=pblntf_ty, pblntf_detail_ty=pblntf_detail_ty, corp_cls=corp_cls,
+                         sort=sort, sort_mth=sort_mth, page_no=1, page_count=page_count)
+    except NoDataReceived:
+        return
+    yield from results.iter_all(prefetch=prefetch)
+
+
+def search_all(corp_code: str = None,
+               bgn_de: str = None,
+               end_de: str = None,
+               last_reprt_at: str = 'N',
+               pblntf_ty: str_or_list = None,
+               pblntf_detail_ty: str_or_list = None,
+               corp_cls: str = None,
+               sort: str = 'date',
+               sort_mth: str = 'desc',
+               page_count: int = 100) -> SearchResults:
+    """ 모든 페이지의 공시보고서를 하나의 검색결과로 반환
+
+    Parameters
+    ----------
+    corp_code: str, optional
+        공시대상회사의 고유번호(8자리), 고유번호(corp_code)가 없는 경우 검색기간은 3개월로 제한
+    bgn_de: str, optional
+        검색시작 접수일자(YYYYMMDD), 없으면 종료일(end_de)
+    end_de: str, optional
+        검색종료 접수일자(YYYYMMDD), 없으면 당일
+    last_reprt_at: str, optional
+        최종보고서만 검색여부(Y or N), default : N
+    pblntf_ty: str, optional
+        공시유형 / Open DART  공시정보 -> 공시검색 -> 상세유형 참고
+    pblntf_detail_ty: str, optional
+        공시상세유형 / Open DART  공시정보 -> 공시검색 -> 상세유형 참고
+    corp_cls: str, optional
+        법인구분 : Y(유가), K(코스닥), N(코넥스), E(기타), 없으면 전체조회
+    sort: str, optional
+        정렬, {접수일자: date, 회사명: crp, 고서명: rpt}
+    sort_mth: str, optional
+        오름차순(asc), 내림차순(desc), default : desc
+    page_count: int, optional
+        페이지당 요청 건수(1~100) default : 100
+
+    Returns
+    -------
+    SearchResults
+        모든 페이지의 검색결과(page_no: 1, total_page: 1)
+
+    Raises
+    ------
+    NoDataReceived
+        검색 결과가 없는 경우
+    """
+    params = dict(corp_code=corp_code,
+                  bgn_de=bgn_de,
+                  end_de=end_de,
+                  last_reprt_at=last_reprt_at,
+                  pblntf_ty=pblntf_ty,
+                  pblntf_detail_ty=pblntf_detail_ty,
+                  corp_cls=corp_cls,
+                  sort=sort,
+                  sort_mth=sort_mth,
+                  page_count=page_count)
+    resp = search_filings(**params, page_no=1)
+    # 페이지 요청 사이에 새로운 공시가 접수되면 이전 페이지의 공시가 다음 페이지에 다시 포함되므로 중복 제거
+    items = dict()
+    for page in itertools.chain([resp], iter_responses(resp, params)):
+        for item in page['list']:
+            items.setdefault(item['rcept_no'], item)
+    items = list(items.values())
+    merged = {
+        'page_no': 1,
+        'page_count': len(items),
+        'total_count': len(items),
+        'total_page': 1,
+        'list': items,
+    }
+    return SearchResults(merged)
\ No newline at end of file
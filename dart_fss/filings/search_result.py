@@ -1,19 +1,115 @@
 # -*- coding: utf-8 -*-
-from typing import Dict
+import pandas as pd
 
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List
+
+from dart_fss.api.filings import search_filings
+from dart_fss.errors import NoDataReceived
 from dart_fss.utils import dict_to_html
 from dart_fss.filings.reports import Report
+from dart_fss.filings.store import FILING_FIELDS
+
+
+def iter_responses(resp: Dict, params: Dict, prefetch: bool = True) -> Iterator[Dict]:
+    """ 검색 결과의 다음 페이지부터 마지막 페이지까지 순차적으로 반환
+
+    prefetch 가 True 인 경우 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청한다.
+    반복을 중단한 경우 미리 요청한 페이지는 취소된다.
+
+    Parameters
+    ----------
+    resp: dict
+        현재 페이지 검색 결과
+    params: dict
+        search_filings 검색 인자(page_no 제외)
+    prefetch: bool, optional
+        다음 페이지 미리 요청 여부(default: True)
+
+    Yields
+    ------
+    dict
+        페이지별 검색 결과
+    """
+    def fetch(page_no):
+        try:
+            return search_filings(**params, page_no=page_no)
+        except NoDataReceived:
+            # 검색 중 공시 목록이 변경되어 페이지가 없는 경우
+            return None
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    future = None
+    try:
+        page_no = int(resp['page_no'])
+        total_page = int(resp['total_page'])
+        if executor is not None and page_no < total_page:
+            future = executor.submit(fetch, page_no + 1)
+        while page_no < total_page:
+            page_no += 1
+            if future is not None:
+                resp = future.result()
+                future = None
+            else:
+                resp = fetch(page_no)
+            if resp is None:
+                break
+            total_page = int(resp['total_page'])
+            if executor is not None and page_no < total_page:
+                future = executor.submit(fetch, page_no + 1)
+            yield resp
+    finally:
+        if future is not None:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# 검색 결과 한 건을 dict 대신 저장하는 Record, 검색 결과 항목 외의 값은 extra 에 저장
+FilingRow = namedtuple('FilingRow', FILING_FIELDS + ('extra',))
+
+
+def _to_row(item: Dict) -> FilingRow:
+    """ search_filings 검색 결과의 list 항목을 FilingRow 로 변환 """
+    values = [item.get(field) for field in FILING_FIELDS]
+    extra = {k: v for k, v in item.items() if k not in FILING_FIELDS}
+    return FilingRow(*values, extra or None)
+
+
+def _to_dict(row: FilingRow) -> Dict:
+    """ FilingRow 를 검색 결과의 list 항목으로 변환 (응답에 없던 항목은 제외) """
+    item = {field: value for field, value in zip(FILING_FIELDS, row) if value is not None}
+    if row.extra:
+        item.update(row.extra)
+    return item
 
 
 class SearchResults(object):
-    """ DART 검색결과 정보를 저장하는 클래스"""
+    """ DART 검색결과 정보를 저장하는 클래스
+
+    검색 결과는 FilingRow 로 저장하며, Report 는 조회시 생성된다.
+    """
 
-    def __init__(self, resp):
+    def __init__(self, resp, params: Dict = None):
+        """ 검색결과 초기화
+
+        Parameters
+        ----------
+        resp: dict
+            search_filings 검색 결과
+        params: dict, optional
+            search_filings 검색 인자(page_no 제외), 다음 페이지 검색시 사용
+        """
         self._page_no = resp['page_no']
         self._page_count = resp['page_count']
         self._total_count = resp['total_count']
         self._total_page = resp['total_page']
-        self._report_list = [Report(**x) for x in resp['list']]
+        self._rows = [_to_row(x) for x in resp['list']]
+        self._reports = [None] * len(self._rows)
+        # 다음 페이지 검색에 필요한 정보만 보관
+        self._resp = {'page_no': self._page_no, 'total_page': self._total_page}
+        self._params = params
 
     @property
     def page_no(self):
@@ -35,10 +131,55 @@ class SearchResults(object):
         """int: 총 페이지수"""
         return self._total_page
 
+    def _get_report(self, index: int) -> Report:
+        """ index 의 Report 반환, 생성된 Report 는 재사용 """
+        report = self._reports[index]
+        if report is None:
+            report = Report(**_to_dict(self._rows[index]))
+            self._reports[index] = report
+        return report
+
     @property
-    def report_list(self):
+    def report_list(self) -> List[Report]:
         """list of Report: 검색된 리포트 리스트"""
-        return self._report_list
+        for idx in range(len(self._rows)):
+            self._get_report(idx)
+        return self._reports
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """ Report 생성 없이 검색 결과를 DataFrame 으로 반환
+
+        Returns
+        -------
+        pd.DataFrame
+            검색 결과
+        """
+        if len(self._rows) == 0:
+            return pd.DataFrame(columns=list(FILING_FIELDS))
+        return pd.DataFrame([_to_dict(x) for x in self._rows])
+
+    def iter_all(self, prefetch: bool = True) -> Iterator[Report]:
+        """ 현재 페이지부터 마지막 페이지까지의 리포트를 순차적으로 반환
+
+        다음 페이지는 필요할 때 요청하며, prefetch 가 True 인 경우 현재 페이지를 처리하는 동안 미리 요청한다.
+
+        Parameters
+        ----------
+        prefetch: bool, optional
+            다음 페이지 미리 요청 여부(default: True)
+
+        Yields
+        ------
+        Report
+            검색된 리포트
+        """
+        # 반복 중 pop 으로 목록이 변경되어도 현재 페이지의 리포트는 모두 반환
+        yield from [self._get_report(idx) for idx in range(len(self._rows))]
+        if self._params is None:
+            return
+        for resp in iter_responses(self._resp, self._params, prefetch=prefetch):
+            for x in resp['list']:
+                yield Report(**x)
 
     def to_dict(self) -> Dict:
         """ dict 타입으로 반환
@@ -59,7 +200,10 @@ class SearchResults(object):
 
     def pop(self, index=-1):
         """ 주어진 index 의 리포트를 반환하며, 리스트에서 삭제하는 함수"""
-        return self._report_list.pop(index)
+        report = self._get_report(index)
+        self._rows.pop(index)
+        self._reports.pop(index)
+        return report
 
     def __repr__(self):
         from pprint import pformat
@@ -69,7 +213,9 @@ class SearchResults(object):
         return dict_to_html(self.to_dict(), exclude=['pages'], header=['Label', 'Data'])
 
     def __getitem__(self, item):
-        return self._report_list[item]
+        if isinstance(item, slice):
+            return [self._get_report(idx) for idx in range(len(self._rows))[item]]
+        return self._get_report(range(len(self._rows))[item])
 
     def __len__(self):
-        return len(self._report_list)
\ No newline at end of file
+        return len(self._rows)
\ No newline at end of file
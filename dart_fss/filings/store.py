@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import sqlite3
+import pandas as pd
+
+from typing import Dict, Iterable, Optional, Set
+
+from dart_fss.utils import create_folder
+
+# 공시검색 결과 항목
+FILING_FIELDS = ('rcept_no', 'corp_code', 'corp_name', 'stock_code', 'corp_cls',
+                 'report_nm', 'flr_nm', 'rcept_dt', 'rm')
+
+
+class FilingStore(object):
+    """ 공시검색 결과를 SQLite 에 저장하는 클래스
+
+    접수번호(rcept_no)를 기준으로 중복 없이 저장하며, 검색 조건별 마지막 동기화 위치(watermark) 및
+    동기화한 접수번호를 저장한다.
+    """
+    def __init__(self, path: str):
+        """ FilingStore 초기화
+
+        Parameters
+        ----------
+        path: str
+            SQLite 파일 경로, ':memory:' 인 경우 메모리에 저장
+        """
+        folder = os.path.dirname(path)
+        if path != ':memory:' and folder:
+            create_folder(folder)
+        self._path = path
+        self._conn = sqlite3.connect(path)
+        columns = ', '.join('{} TEXT'.format(x) for x in FILING_FIELDS[1:])
+        with self._conn:
+            self._conn.execute('CREATE TABLE IF NOT EXISTS filings (rcept_no TEXT PRIMARY KEY, {})'.format(columns))
+            self._conn.execute('CREATE INDEX IF NOT EXISTS filings_rcept_dt ON filings (rcept_dt)')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS watermarks '
+                               '(query TEXT PRIMARY KEY, rcept_no TEXT, rcept_dt TEXT, updated REAL)')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS synced '
+                               '(query TEXT, rcept_no TEXT, PRIMARY KEY (query, rcept_no)) WITHOUT ROWID')
+
+    @property
+    def path(self) -> str:
+        """ SQLite 파일 경로 """
+        return self._path
+
+    def add(self, filings: Iterable[Dict], query: str = None) -> int:
+        """ 공시검색 결과 저장, 이미 저장된 접수번호는 무시
+
+        Parameters
+        ----------
+        filings: iterable of dict
+            search_filings 검색 결과의 list 항목
+        query: str, optional
+            검색 조건 Key, 지정한 경우 해당 검색 조건으로 동기화한 접수번호로 기록
+
+        Returns
+        -------
+        int
+            새로 저장된 공시 수
+        """
+        rows = [tuple(x.get(field) for field in FILING_FIELDS) for x in filings]
+        if len(rows) == 0:
+            return 0
+        query_text = 'INSERT OR IGNORE INTO filings ({}) VALUES ({})'.format(
+            ', '.join(FILING_FIELDS), ', '.join('?' * len(FILING_FIELDS)))
+        with self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(query_text, rows)
+            count = self._conn.total_changes - before
+            if query is not None:
+                self._conn.executemany('INSERT OR IGNORE INTO synced (query, rcept_no) VALUES (?, ?)',
+                                       [(query, row[0]) for row in rows])
+        return count
+
+    def get_synced(self, query: str, rcept_list: Iterable[str]) -> Set[str]:
+        """ 검색 조건으로 이미 동기화한 접수번호 반환
+
+        Parameters
+        ----------
+        query: str
+            검색 조건 Key
+        rcept_list: iterable of str
+            확인할 접수번호 리스트
+
+        Returns
+        -------
+        set of str
+            rcept_list 중 이미 동기화한 접수번호
+        """
+        rcept_list = list(rcept_list)
+        if len(rcept_list) == 0:
+            return set()
+        cursor = self._conn.execute(
+            'SELECT rcept_no FROM synced WHERE query = ? AND rcept_no IN ({})'.format(', '.join('?' * len(rcept_list))),
+            [query] + rcept_list)
+        return set(x[0] for x in cursor)
+
+    def get(self, rcept_no: str) -> Optional[Dict]:
+        """ 접수번호에 해당하는 공시 반환, 없는 경우 None """
+        cursor = self._conn.execute(
+            'SELECT {} FROM filings WHERE rcept_no = ?'.format(', '.join(FILING_FIELDS)), (rcept_no,))
+        row = cursor.fetchone()
+        return dict(zip(FILING_FIELDS, row)) if row is not None else None
+
+    def get_watermark(self, query: str) -> Optional[Dict]:
+        """ 검색 조건의 마지막 동기화 위치 반환
+
+        Parameters
+        ----------
+        query: str
+            검색 조건 Key
+
+        Returns
+        -------
+        dict or None
+            rcept_no, rcept_dt, updated 정보, 동기화한 적이 없는 경우 None
+        """
+        cursor = self._conn.execute('SELECT rcept_no, rcept_dt, updated FROM watermarks WHERE query = ?', (query,))
+        row = cursor.fetchone()
+        return dict(zip(('rcept_no', 'rcept_dt', 'updated'), row)) if row is not None else None
+
+    def set_watermark(self, query: str, rcept_no: str, rcept_dt: str):
+        """ 검색 조건의 마지막 동기화 위치 저장
+
+        Parameters
+        ----------
+        query: str
+            검색 조건 Key
+        rcept_no: str
+            마지막으로 확인한 최신 공시의 접수번호
+        rcept_dt: str
+            마지막으로 확인한 접수일자(YYYYMMDD)
+        """
+        with self._conn:
+            self._conn.execute('INSERT OR REPLACE INTO watermarks (query, rcept_no, rcept_dt, updated) '
+                               'VALUES (?, ?, ?, ?)', (query, rcept_no, rcept_dt, time.time()))
+
+    def to_dataframe(self, bgn_de: str = None, end_de: str = None) -> pd.DataFrame:
+        """ 저장된 공시를 DataFrame 으로 반환
+
+        Parameters
+        ----------
+        bgn_de: str, optional
+            검색시작 접수일자(YYYYMMDD)
+        end_de: str, optional
+            검색종료 접수일자(YYYYMMDD)
+
+        Returns
+        -------
+        pd.DataFrame
+            접수일자, 접수번호 내림차순 공시 목록
+        """
+        conditions = []
+        params = []
+        if bgn_de is not None:
+            conditions.append('rcept_dt >= ?')
+            params.append(bgn_de)
+        if end_de is not None:
+            conditions.append('rcept_dt <= ?')
+            params.append(end_de)
+        query = 'SELECT {} FROM filings'.format(', '.join(FILING_FIELDS))
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY rcept_dt DESC, rcept_no DESC'
+        rows = self._conn.execute(query, params).fetchall()
+        return pd.DataFrame(rows, columns=list(FILING_FIELDS))
+
+    def close(self):
+        """ SQLite 연결 종료 """
+        self._conn.close()
+
+    def __contains__(self, rcept_no: str) -> bool:
+        cursor = self._conn.execute('SELECT 1 FROM filings WHERE rcept_no = ?', (rcept_no,))
+        return cursor.fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM filings').fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self) -> str:
+        return 'FilingStore({!r}, filings={})'.format(self._path, len(self))
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import json
+from datetime import datetime
+from typing import Dict, Iterator, List, Union
+
+from dart_fss.api.filings import search_filings
+from dart_fss.errors import NoDataReceived
+from dart_fss.filings.crawler import split_date_range
+from dart_fss.filings.search_result import iter_responses
+from dart_fss.filings.store import FilingStore
+from dart_fss.utils.http_cache import http_cache
+
+str_or_list = Union[str, List[str]]
+
+
+def get_query_key(params: Dict) -> str:
+    """ 검색 조건을 watermark 저장용 Key 로 변환 """
+    return json.dumps(params, sort_keys=True, ensure_ascii=False)
+
+
+def _iter_pages_desc(bgn_de: str, params: Dict) -> Iterator[List[Dict]]:
+    """ bgn_de 부터 당일까지의 검색 결과를 최신 페이지부터 반환
+
+    고유번호(corp_code)가 없는 경우 3개월 이하의 기간으로 분할하여 최근 기간부터 검색한다.
+    """
+    if params.get('corp_code') is None:
+        windows = split_date_range(bgn_de)
+    else:
+        windows = [(bgn_de, None)]
+    for window in reversed(windows):
+        query = dict(params, bgn_de=window[0], end_de=window[1], sort='date', sort_mth='desc')
+        try:
+            resp = search_filings(**query, page_no=1)
+        except NoDataReceived:
+            continue
+        yield resp['list']
+        # 이전 공시를 찾으면 중단하므로 다음 페이지는 미리 요청하지 않음
+        for page in iter_responses(resp, query, prefetch=False):
+            yield page['list']
+
+
+def sync_filings(store: Union[str, FilingStore],
+                 corp_code: str = None,
+                 bgn_de: str = None,
+                 last_reprt_at: str = 'N',
+                 pblntf_ty: str_or_list = None,
+                 pblntf_detail_ty: str_or_list = None,
+                 corp_cls: str = None,
+                 page_count: int = 100) -> List[Dict]:
+    """ 마지막 동기화 이후 새로 접수된 공시만 반환
+
+    검색 조건별로 동기화한 접수번호 및 마지막으로 확인한 최신 공시(watermark)를 store 에 저장하며, 다음 동기화시
+    마지막 접수일자부터 최신 공시순으로 검색하여 페이지의 모든 공시가 해당 검색 조건으로 이미 동기화된 경우 검색을
+    중단한다. 접수번호는 접수 순서와 일치하지 않으므로(KRX 제출 공시) 동기화 여부로만 새로운 공시를 판단하며,
+    다른 검색 조건 또는 crawl_filings 로 저장된 공시도 해당 검색 조건으로 처음 확인한 경우 새로운 공시로 반환한다.
+    최신 결과를 확인하기 위해 HTTP 캐시(enable_http_cache)에 저장된 응답은 사용하지 않는다.
+    새로운 공시가 없는 경우 1번의 요청으로 동기화가 완료된다.
+
+    Parameters
+    ----------
+    store: str or FilingStore
+        SQLite 파일 경로 또는 FilingStore
+    corp_code: str, optional
+        공시대상회사의 고유번호(8자리)
+    bgn_de: str, optional
+        최초 동기화시 검색시작 접수일자(YYYYMMDD), 없으면 당일
+    last_reprt_at: str, optional
+        최종보고서만 검색여부(Y or N), default : N
+    pblntf_ty: str, optional
+        공시유형
+    pblntf_detail_ty: str, optional
+        공시상세유형
+    corp_cls: str, optional
+        법인구분 : Y(유가), K(코스닥), N(코넥스), E(기타), 없으면 전체조회
+    page_count: int, optional
+        페이지당 건수(1~100), default : 100
+
+    Returns
+    -------
+    list of dict
+        새로 접수된 공시 목록(접수일자, 접수번호 오름차순)
+
+    Examples
+    --------
+    >>> from dart_fss.filings import sync_filings
+    >>> new_filings = sync_filings('./filings.db', pblntf_ty='A')
+    """
+    own_store = not isinstance(store, FilingStore)
+    if own_store:
+        store = FilingStore(store)
+
+    params = dict(corp_code=corp_code, last_reprt_at=last_reprt_at, pblntf_ty=pblntf_ty,
+                  pblntf_detail_ty=pblntf_detail_ty, corp_cls=corp_cls)
+    key = get_query_key(params)
+    params['page_count'] = page_count
+
+    try:
+        watermark = store.get_watermark(key)
+        if watermark is not None:
+            bgn_de = watermark['rcept_dt']
+        else:
+            bgn_de = bgn_de or datetime.today().strftime('%Y%m%d')
+
+        latest = None
+        new_filings = dict()
+        with http_cache.bypass():
+            for filings in _iter_pages_desc(bgn_de, params):
+                # KRX 를 통해 제출된 공시(접수번호 9~10번째 자리 80)로 인해 접수번호는 접수 순서와 일치하지 않으므로
+                # 검색 조건별 동기화 여부로만 이미 확인한 공시인지 판단
+                synced = store.get_synced(key, [x['rcept_no'] for x in filings])
+                seen = 0
+                for filing in filings:
+                    rcept_no = filing['rcept_no']
+                    if latest is None or filing['rcept_dt'] > latest['rcept_dt']:
+                        latest = filing
+                    if filing['rcept_dt'] < bgn_de or rcept_no in synced or rcept_no in new_filings:
+                        seen += 1
+                    else:
+                        new_filings[rcept_no] = filing
+                # 페이지 전체가 이미 동기화되었거나 watermark 이전 공시인 경우 중단
+                if len(filings) > 0 and seen == len(filings):
+                    break
+
+        new_filings = sorted(new_filings.values(), key=lambda x: (x['rcept_dt'], x['rcept_no']))
+        store.add(new_filings, query=key)
+        if latest is not None and (watermark is None or latest['rcept_dt'] >= watermark['rcept_dt']):
+            store.set_watermark(key, latest['rcept_no'], latest['rcept_dt'])
+    finally:
+        if own_store:
+            store.close()
+    return new_filings
@@ -2,10 +2,9 @@ import re
 import base64
 from typing import Dict
 
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
-from dart_fss.utils import dict_to_html, request, unzip, search_file
+from dart_fss.utils import dict_to_html, request, unzip, search_file, html_to_soup
 from dart_fss.xbrl import get_xbrl_from_file
 from dart_fss.utils.regex import str_to_regex
 from dart_fss.api.finance import download_xbrl
@@ -39,7 +38,7 @@ class XBRLViewer(object):
         """ 보고서 html 불러오기"""
         payload = dict(rcpNo=self.rcp_no)
         resp = request.get(url=self._VIEWER_URL_, payload=payload, referer=self._DART_URL_)
-        self.html = BeautifulSoup(resp.text, 'html.parser')
+        self.html = html_to_soup(resp.text)
 
     def extract_pages(self):
         """ 보고서 page 리스트 추출
@@ -91,7 +90,7 @@ class XBRLViewer(object):
             except UnicodeDecodeError:
                 html = html.decode('cp949')
             finally:
-                soup = BeautifulSoup(html, 'html.parser')
+                soup = html_to_soup(html)
                 trs = soup.find_all('tr')
                 for tr in trs[1:]:
                     tds = tr.find_all('td')
@@ -319,7 +318,7 @@ class XBRLViewerPage(object):
         except UnicodeDecodeError:
             html = html.decode('cp949')
         finally:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = html_to_soup(html)
             meta = soup.find('meta', {'content': re.compile(r'charset')})
             if meta:
                 meta['content'] = meta['content'].replace('euc-kr', 'utf-8')
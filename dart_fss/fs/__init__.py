@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from dart_fss.fs.extract import extract
+from dart_fss.fs.bulk import extract_many
 from dart_fss.fs.fs import FinancialStatement
 
-__all__ = ['extract', 'FinancialStatement']
\ No newline at end of file
+__all__ = ['extract', 'extract_many', 'FinancialStatement']
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.managers import BaseManager
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from dart_fss.auth import get_api_key, set_api_key
+from dart_fss.fs.extract import extract
+from dart_fss.fs.fs import FinancialStatement
+from dart_fss.utils import create_folder, is_notebook, request, RateLimiter, set_html_parser, get_html_parser
+from dart_fss.utils.http_cache import http_cache
+from dart_fss.xbrl.cache import xbrl_cache
+
+
+class _LimiterManager(BaseManager):
+    """ 여러 Process 가 하나의 RateLimiter 를 공유하기 위한 Manager """
+    pass
+
+
+_LimiterManager.register('RateLimiter', RateLimiter)
+
+
+class _SharedLimiter(object):
+    """ Manager 의 RateLimiter Proxy 를 Request.limiter 로 사용하기 위한 클래스
+
+    Proxy 는 속성에 접근할 수 없으므로 요청 제한 설정(max_calls, period, interval)은 Worker Process 에 보관하고,
+    acquire 등 요청 기록이 필요한 호출만 공유 RateLimiter 로 전달한다.
+    """
+    def __init__(self, proxy, max_calls: int, period: float, interval: float = None):
+        self._proxy = proxy
+        self.max_calls = max_calls
+        self.period = period
+        self.interval = interval
+
+    def set_limit(self, max_calls: int = None, period: float = None):
+        if max_calls is not None:
+            self.max_calls = max_calls
+        if period is not None:
+            self.period = period
+        self._proxy.set_limit(max_calls=max_calls, period=period)
+
+    def acquire(self, host: str = None) -> float:
+        return self._proxy.acquire(host)
+
+    def reset(self, host: str = None):
+        self._proxy.reset(host)
+
+
+def _worker_settings() -> Dict:
+    """ Worker Process 에 전달할 설정 반환 (spawn 방식의 경우 Main Process 의 설정이 전달되지 않음) """
+    return dict(
+        http_cache=dict(enable=http_cache.enabled, path=http_cache.path, max_size=http_cache.max_size,
+                        default_ttl=http_cache.default_ttl, ttl_policy=http_cache.ttl_policy),
+        xbrl_cache=dict(enable=xbrl_cache.enabled, path=xbrl_cache.path, statements=xbrl_cache.statements,
+                        max_models=xbrl_cache.max_models),
+        html_parser=get_html_parser(),
+        proxies=request.s.proxies,
+    )
+
+
+def _init_worker(api_key: Optional[str], limiter: _SharedLimiter, settings: Dict):
+    """ Worker Process 초기화: API KEY 및 설정 적용, 공유 RateLimiter 연결 """
+    if api_key is not None:
+        try:
+            get_api_key()
+        except ValueError:
+            set_api_key(api_key)
+    # fork 방식의 경우 Main Process 의 SQLite 연결 등을 상속하므로 초기화
+    http_cache.reset_after_fork()
+    xbrl_cache.reset_after_fork()
+    http_cache.enable(**settings['http_cache'])
+    xbrl_cache.enable(**settings['xbrl_cache'])
+    set_html_parser(settings['html_parser'])
+    request.set_proxies(settings['proxies'])
+    request.limiter = limiter
+
+
+def _extract_worker(corp_code: str, kwargs: Dict) -> Tuple[str, Optional[FinancialStatement], Optional[Exception]]:
+    """ Worker Process 에서 실행되는 재무제표 추출 함수 """
+    try:
+        return corp_code, extract(corp_code, **kwargs), None
+    except Exception as ex:
+        # 복원할 수 없는 예외는 Main Process 에서 Pool 을 중단시키므로 RuntimeError 로 변환
+        try:
+            pickle.loads(pickle.dumps(ex))
+        except Exception:
+            ex = RuntimeError('{}: {}'.format(type(ex).__name__, ex))
+        return corp_code, None, ex
+
+
+def _options_key(kwargs: Dict) -> str:
+    return json.dumps(kwargs, sort_keys=True, default=str)
+
+
+def _checkpoint_path(checkpoint: str, corp_code: str) -> str:
+    return os.path.join(checkpoint, '{}.pkl'.format(corp_code))
+
+
+def _load_checkpoint(checkpoint: str, corp_code: str, options: str) -> Optional[FinancialStatement]:
+    """ 저장된 추출 결과 반환, 없거나 추출 옵션이 다른 경우 None """
+    file_path = _checkpoint_path(checkpoint, corp_code)
+    if not os.path.isfile(file_path):
+        return None
+    try:
+        with open(file_path, 'rb') as f:
+            data = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if data.get('options') != options:
+        return None
+    return data.get('fs')
+
+
+def _save_checkpoint(checkpoint: str, corp_code: str, options: str, fs: FinancialStatement):
+    file_path = _checkpoint_path(checkpoint, corp_code)
+    temp_path = file_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        pickle.dump({'options': options, 'fs': fs}, f)
+    os.replace(temp_path, file_path)
+
+
+def extract_many(corp_codes: Iterable[str],
+                 bgn_de: str,
+                 max_workers: int = 4,
+                 checkpoint: str = None,
+                 progressbar: bool = True,
+                 **kwargs) -> Iterator[Tuple[str, Union[FinancialStatement, Exception]]]:
+    """
+    여러 회사의 재무제표를 Process Pool 을 이용하여 병렬로 추출
+
+    XBRL 분석은 CPU 연산 비중이 높으므로 회사별로 별도의 Process 에서 추출한다.
+    모든 Process 는 하나의 RateLimiter 를 공유하므로 전체 요청 횟수는 dart_fss.utils.request 의 요청 제한을 따른다.
+    추출이 완료된 순서대로 결과를 반환하며, checkpoint 폴더를 지정한 경우 완료된 결과를 저장하여
+    중단 후 다시 실행시 저장된 결과를 이용한다.
+
+    Parameters
+    ----------
+    corp_codes: iterable of str
+        공시대상회사의 고유번호(8자리) 리스트
+    bgn_de: str
+        검색 시작일자(YYYYMMDD)
+    max_workers: int, optional
+        최대 Process 수 (default: 4)
+    checkpoint: str, optional
+        추출 결과를 저장할 폴더 경로, None 인 경우 저장하지 않음
+    progressbar: bool, optional
+        ProgressBar 표시 여부 (default: True)
+    kwargs: dict, optional
+        dart_fss.fs.extract 에 전달할 인자 (ex. end_de, fs_tp, separate, report_tp)
+
+    Yields
+    ------
+    tuple of (str, FinancialStatement or Exception)
+        공시대상회사의 고유번호 및 재무제표 검색 결과, 오류가 발생한 경우 발생한 예외
+
+    Examples
+    --------
+    >>> from dart_fss.fs import extract_many
+    >>> for corp_code, fs in extract_many(['00126380', '00164779'], bgn_de='20180101', checkpoint='./fs'):
+    ...     if isinstance(fs, Exception):
+    ...         continue
+    ...     fs.save()
+    """
+    if is_notebook():
+        from tqdm import tqdm_notebook as tqdm
+    else:
+        from tqdm import tqdm
+
+    corp_codes = list(dict.fromkeys(corp_codes))
+    kwargs['bgn_de'] = bgn_de
+    # Worker 별 ProgressBar 는 표시하지 않음
+    kwargs['progressbar'] = False
+    options = _options_key(kwargs)
+
+    pbar = tqdm(total=len(corp_codes), desc='Extracting financial statements', unit='corp',
+                disable=not progressbar)
+
+    remains = []
+    if checkpoint is not None:
+        create_folder(checkpoint)
+    for corp_code in corp_codes:
+        fs = _load_checkpoint(checkpoint, corp_code, options) if checkpoint is not None else None
+        if fs is None:
+            remains.append(corp_code)
+        else:
+            pbar.update(1)
+            yield corp_code, fs
+
+    if len(remains) == 0:
+        pbar.close()
+        return
+
+    try:
+        api_key = get_api_key()
+    except ValueError:
+        api_key = None
+
+    limiter = request.limiter
+    manager = _LimiterManager()
+    manager.start()
+    executor = None
+    futures = []
+    try:
+        proxy = manager.RateLimiter(max_calls=limiter.max_calls, period=limiter.period, interval=limiter.interval)
+        shared_limiter = _SharedLimiter(proxy, max_calls=limiter.max_calls, period=limiter.period,
+                                        interval=limiter.interval)
+        executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                       initargs=(api_key, shared_limiter, _worker_settings()))
+        futures = [executor.submit(_extract_worker, corp_code, kwargs) for corp_code in remains]
+        for future in as_completed(futures):
+            corp_code, fs, error = future.result()
+            pbar.update(1)
+            if error is not None:
+                yield corp_code, error
+                continue
+            if checkpoint is not None and fs is not None:
+                _save_checkpoint(checkpoint, corp_code, options, fs)
+            yield corp_code, fs
+    finally:
+        for future in futures:
+            future.cancel()
+        # 실행중인 Worker 가 공유 RateLimiter 를 사용하므로 Worker 가 종료된 후 Manager 종료
+        if executor is not None:
+            executor.shutdown(wait=True)
+        manager.shutdown()
+        pbar.close()
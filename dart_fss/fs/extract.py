@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import re
+import copy
 import math
 import warnings
 import numpy as np
@@ -8,7 +9,9 @@ import pandas as pd
 import traceback
 
 from typing import Union, List, Dict, Tuple, Pattern, Optional
+from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
+from functools import lru_cache
 from pandas import DataFrame
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
@@ -17,14 +20,40 @@ from bs4.element import Tag
 
 from dart_fss.api.filings import get_corp_info
 from dart_fss.filings.reports import Report
-from dart_fss.filings import search as search_filings
-from dart_fss.utils import str_compare, str_unit_to_number_unit, is_notebook
+from dart_fss.filings import search_all as search_filings
+from dart_fss.utils import str_compare, str_unit_to_number_unit, is_notebook, Spinner
 from dart_fss.utils import str_insert_whitespace as ws
 from dart_fss.errors.errors import NotFoundConsolidated, NoDataReceived
 from dart_fss.utils import str_to_regex, get_currency_str
 from dart_fss.fs.fs import FinancialStatement
+from dart_fss.xbrl.cache import xbrl_cache
 from dart_fss.filings.search_result import SearchResults
 
+# 재무제표 추출에 사용되는 정규식
+# 함수 호출시마다 compile 하지 않도록 module 로딩시 한번만 생성
+regex_space = re.compile(r'\s+')
+regex_comma_space = re.compile(r',|\s+')
+regex_space_equal = re.compile(r'\s+|=+')
+regex_non_break_space = re.compile(u'\xa0')
+regex_br = re.compile(r'<br\s*?\/?\s*?>')
+# 음수 처리를 위한 정규식
+regex_negative = re.compile(r'\((-*\d+)\)|\(-\)(\d+)')
+regex_korean = re.compile(r'[ㄱ-힣]|[a-zA-Z]')
+# 단위 검색
+regex_unit = re.compile(r'\(단위\s*?:\s*(.*)\)')
+regex_row_unit = re.compile(r'\(단위\s*?:\s*([a-zA-Zㄱ-힣])\)')
+# YYYY년 MM월 DD일 형태 검색 (Exclude ':')
+regex_header_date = re.compile(r'(\d{4})[^0-9:]*\s*(\d{1,2})[^0-9]*\s*(\d{1,2})')
+# YYYY년 MM월 DD일 M'M'월 D'D'일 형태 검색 (Exclude ':')
+regex_header_date_range = re.compile(
+    r'(\d{4})[^0-9:]*\s*(\d{1,2})[^0-9]*\s*(\d{1,2})[^0-9]*\s*(\d{1,2})[^0-9]*\s*(\d{1,2})')
+regex_white_text = re.compile(r'color:#ffffff', re.IGNORECASE)
+# Table Header 날짜 검색
+regex_table_date = re.compile(r'\d{4}(.*?)\d{1,2}(.*?)\d{1,2}')
+regex_3month = re.compile(r'3개월')
+regex_account_title = re.compile(r'\[.*?\]|\(.*?\)|<.*?>|[^가-힣|a-z|A-Z]')
+regex_date = re.compile(r'\d{8}')
+
 
 def str_to_float(text: str, unit: float) -> float:
     """ 문자를 float 데이터로 변환
@@ -42,22 +71,21 @@ def str_to_float(text: str, unit: float) -> float:
     float
         변환된 숫자
     """
-    regex = re.compile(r'\((-*\d+)\)|\(-\)(\d+)')  # 음수 처리를 위한 정규식
-    regex_korean = re.compile(r'[ㄱ-힣]|[a-zA-Z]')
     if isinstance(text, str):
         try:
-            text = re.sub(r',|\s+', '', text)
+            text = regex_comma_space.sub('', text)
             if regex_korean.search(text):
                 value = float(regex_korean.sub('', text))
                 # Value 값에 단위가 들어간 경우 unit으로 나누어 이후 계산에서 일괄적으로 곱해질 unit 값을 제거한다
-                if re.search('원', text):
+                if '원' in text:
                     return value / unit
                 else:
                     return value
-            if regex.search(text):
-                value = regex.search(text).group(1)
+            negative = regex_negative.search(text)
+            if negative:
+                value = negative.group(1)
                 if value is None:
-                    value = regex.search(text).group(2)
+                    value = negative.group(2)
                 return -float(value)
             else:
                 return float(text)
@@ -69,9 +97,6 @@ def str_to_float(text: str, unit: float) -> float:
         raise ValueError('Invalid Value: {}'.format(text))
 
 
-regex_br = re.compile(r'<br\s*?\/?\s*?>')
-
-
 def text_split_by_br(tag) -> list:
     s = regex_br.sub('\n', str(tag),  re.MULTILINE)
     t = BeautifulSoup(s, 'html.parser')
@@ -104,27 +129,18 @@ def get_datetime(year, month, day):
 
 def extract_date_from_header(header):
     """ 재무제표 기간 추출을 위해 사용하는 method"""
-    # YYYY년 MM월 DD일 형태 검색
-    regex = re.compile(
-        r'(\d{4})[^0-9:]*\s*(\d{1,2})[^0-9]*\s*(\d{1,2})')  # Exclude ':'
-    # YYYY년 MM월 DD일 M'M'월 D'D'일 형태 검색
-    regex2 = re.compile(
-        # Exclude ':'
-        r'(\d{4})[^0-9:]*\s*(\d{1,2})[^0-9]*\s*(\d{1,2})[^0-9]*\s*(\d{1,2})[^0-9]*\s*(\d{1,2})')
     date_info = []
     td_list = header.find_all('td')
-    re_nbsp = re.compile(r'\xa0')
-    re_space = re.compile(r'\s+')
     for td in td_list:
         # Remove white text in tag
-        for tag in td.find_all(style=re.compile(r'color:#ffffff', re.IGNORECASE)):
+        for tag in td.find_all(style=regex_white_text):
             tag.decompose()
         texts = text_split_by_br(td)
         for text in texts:
-            text = re_nbsp.sub(' ', text)
-            text = re_space.sub(' ', text)
-            searched = regex.findall(text)
-            searched2 = regex2.findall(text)
+            text = regex_non_break_space.sub(' ', text)
+            text = regex_space.sub(' ', text)
+            searched = regex_header_date.findall(text)
+            searched2 = regex_header_date_range.findall(text)
 
             # 잘못된 Table Header 검색시 필터링
             searched_length = len(searched)
@@ -176,10 +192,9 @@ def extract_date_from_header(header):
 
 def extract_unit_from_header(header):
     """ html에서 unit을 추출하는 함수 """
-    unit_regex = re.compile(r'\(단위\s*?:\s*(.*)\)')
     td_list = header.find_all('td')
     for td in td_list:
-        searched = unit_regex.search(td.text)
+        searched = regex_unit.search(td.text)
         if searched:
             return searched.group(1)
 
@@ -260,7 +275,7 @@ def convert_thead_into_columns(fs_tp: str, fs_table: dict, separate: bool = Fals
         for jdx, th in enumerate(tr.find_all('th')):
             row_span = int(th.attrs.get('rowspan', 1))
             col_span = int(th.attrs.get('colspan', 1))
-            text = re.sub(r'\s+', '', th.text)
+            text = regex_space.sub('', th.text)
             # Bug fix (#141): Return an empty array if a duplicate column exists
             if text in duplicate_check:
                 return []
@@ -298,7 +313,6 @@ def convert_thead_into_columns(fs_tp: str, fs_table: dict, separate: bool = Fals
     if len(columns_matrix) < 2 or columns_matrix[1].count('과목') > 1:
         return []
 
-    regex_3month = re.compile(r'3개월')
     regex_total = str_to_regex(r'누적 OR 금액')
 
     columns = []
@@ -345,6 +359,16 @@ def convert_thead_into_columns(fs_tp: str, fs_table: dict, separate: bool = Fals
     return columns
 
 
+def get_text_before_newline(tag) -> str:
+    """ br 태그에 의해 구분되는 경우 첫번째 라인 텍스트만 반환 """
+    br = tag.find('br')
+    if br is None:
+        # br 태그가 없을시 단순 반환
+        return tag.get_text()
+    # 새로운 BeautifulSoup 객체를 생성하지 않고 br 태그 이전 요소들의 텍스트를 연결
+    return ''.join(x.get_text() if isinstance(x, Tag) else str(x) for x in br.previous_siblings)
+
+
 def convert_tbody_to_dataframe(columns: list, fs_table: dict):
     """ Html의 tbody를 DataFrame으로 변환하는 함수"""
     column_matrix = OrderedDict()
@@ -358,40 +382,29 @@ def convert_tbody_to_dataframe(columns: list, fs_table: dict):
     deduplicated = [key for key in column_matrix]
 
     df_columns = pd.MultiIndex.from_tuples(deduplicated)
-    df = pd.DataFrame(columns=df_columns)
+    df_column_list = df_columns.tolist()
 
     tbody = fs_table['table'].tbody
     regex = str_to_regex('label_ko OR comment')
     str_unit = extract_unit_from_header(fs_table['header'])
     unit = str_unit_to_number_unit(str_unit)
-    unit_regex = re.compile(r'\(단위\s*?:\s*([a-zA-Zㄱ-힣])\)')
-
-    # br 태그에 의해 구분되는 경우 처리하기 위한 함수
-    def get_text_before_newline(tag):
-        br = tag.find('br')
-        if br is None:
-            # br 태그가 없을시 단순 반환
-            return tag.text
-        else:
-            text = ''
-            for x in br.previous_siblings:
-                text += str(x)
-            # br 태그로 구분되는 경우 첫번째 라인 텍스트만 반환
-            return BeautifulSoup(text, 'html.parser').text
-
-    for idx, tr in enumerate(tbody.find_all('tr')):
-        extracted = [re.sub(r'\s+|=+', '', get_text_before_newline(td))
+
+    # column 별 데이터 타입은 모든 row 에 대해 동일하므로 미리 계산
+    # True: 문자 데이터, False: 숫자 데이터
+    column_types = [(key, index_list, isinstance(key[1], str) or bool(regex.search(' '.join(key[1]))))
+                    for key, index_list in column_matrix.items()]
+
+    data = []
+    for tr in tbody.find_all('tr'):
+        extracted = [regex_space_equal.sub('', get_text_before_newline(td))
                      for td in tr.find_all('td')]
         row = {key: 0 for key in deduplicated}
-        for key, index_list in column_matrix.items():
+        for key, index_list, is_text in column_types:
             for index in index_list:
                 if len(extracted) <= index:
                     row[key] = None
-                elif isinstance(key[1], str):
+                elif is_text:
                     row[key] = extracted[index]
-                elif regex.search(' '.join(key[1])):
-                    value = extracted[index]
-                    row[key] = value
                 else:
                     value = str_to_float(extracted[index], unit)
                     row[key] += value
@@ -402,13 +415,11 @@ def convert_tbody_to_dataframe(columns: list, fs_table: dict):
                 else:
                     row[key] = row[key] * unit
 
-        ordered_list = []
-        for column in df_columns.tolist():
-            ordered_list.append(row.get(column, None))
+        ordered_list = [row.get(column, None) for column in df_column_list]
 
         try:
             if len(ordered_list) > 0 and ordered_list[0] is not None:
-                row_unit = unit_regex.search(ordered_list[0])
+                row_unit = regex_row_unit.search(ordered_list[0])
             else:
                 row_unit = False
         except TypeError as ex:
@@ -424,16 +435,14 @@ def convert_tbody_to_dataframe(columns: list, fs_table: dict):
                 else:
                     ordered_list[jdx] = ordered_list[jdx] / unit * row_unit
 
-        df.loc[idx] = ordered_list
-    return df
+        data.append(ordered_list)
+    # 한 행씩 추가하는 경우 매번 재할당이 발생하므로 한번에 생성
+    return pd.DataFrame(data, columns=df_columns)
 
 
 def seek_table(tables: List, includes: Pattern,
                excludes: Union[Pattern, None] = None) -> Tuple[Union[str, None], Union[str, None], Union[str, None]]:
     """ Table 검색 """
-    # 날짜 검색을 위한 Regular Expression
-    regex = re.compile(r'\d{4}(.*?)\d{1,2}(.*?)\d{1,2}')
-
     # Header Tag 가 아닌 경우 저장
     not_headers = []
 
@@ -462,7 +471,7 @@ def seek_table(tables: List, includes: Pattern,
                 for child in children:
                     title = child
                     if title:
-                        title = re.sub(r'\s+', '', title)
+                        title = regex_space.sub('', title)
                         # 만약 타이틀에 제외될 단어 포함시 Pass
                         if excludes and excludes.search(title):
                             not_headers.append(tag)
@@ -489,7 +498,7 @@ def seek_table(tables: List, includes: Pattern,
                             # 검색된 날짜가 한개도 없을 경우 Pass
                             datetime_cnt = 0
                             for tr in tr_list:
-                                if regex.search(tr.text):
+                                if regex_table_date.search(tr.text):
                                     datetime_cnt += 1
 
                             if datetime_cnt == 0:
@@ -581,6 +590,13 @@ def extract_fs_table(fs_table, fs_tp, separate: bool = False, lang: str = 'ko',
     return results
 
 
+def replace_non_break_space(tag: Tag) -> Tag:
+    """ Tag 내부 문자열의 non-breaking space(\\xa0)를 공백으로 변환 """
+    for text in tag.find_all(string=regex_non_break_space):
+        text.replace_with(text.replace(u'\xa0', ' '))
+    return tag
+
+
 def report_find_all(report: Report, query: dict, fs_tp: Tuple[str], separate: bool) -> Tuple[int, Dict[str, Dict]]:
     """
     Report의 Page 중 Query 조건에 맞는 페이지 검색후 모든 재무제표 Table 추출
@@ -607,16 +623,18 @@ def report_find_all(report: Report, query: dict, fs_tp: Tuple[str], separate: bo
 
     for key in searched:
         for page in searched[key]:
-            non_break_space = u'\xa0'
-            html = page.html.replace(non_break_space, ' ')
-            soup = BeautifulSoup(html, 'html.parser')
-
-            tables = soup.find_all('table', border='1')
+            # 이미 분석된 page 의 html 을 그대로 사용 (검색에 사용하는 정규식은 \xa0 를 공백으로 처리)
+            tables = page.soup.find_all('table', border='1')
             fs_table = search_fs_table(
                 tables=tables, fs_tp=fs_tp, separate=separate)
             count = sum([fs_table[fs_tp]['table']
                         is not None for fs_tp in fs_table])
             if count > 0:
+                # 재무제표 추출시 Tag 가 수정되므로 page 의 html 이 변경되지 않도록 복사
+                for table in fs_table.values():
+                    for name in ('header', 'table'):
+                        if table[name] is not None:
+                            table[name] = replace_non_break_space(copy.copy(table[name]))
                 searched_end = True
                 break
         if searched_end:
@@ -718,14 +736,15 @@ def find_all_columns(df: DataFrame, query: str) -> pd.Index:
     return results
 
 
+@lru_cache(maxsize=4096)
 def extract_account_title(title):
     title = title.split('.')
     if len(title) == 1:
         title = title[0]
     elif len(title) > 1:
         title = ''.join(title[1:])
-    title = re.sub(r'\[.*?\]|\(.*?\)|<.*?>|[^가-힣|a-z|A-Z]', '', title)
-    title = re.sub(r'\s+', '', title)
+    title = regex_account_title.sub('', title)
+    title = regex_space.sub('', title)
     return title
 
 
@@ -756,30 +775,32 @@ def compare_df_and_ndf_label_and_concept(column: Tuple[Union[str, Tuple[str]]],
     tuple of list
         추가할 column의 데이터 리스트, 추가할 column의 label 리스트
     """
-    label_none_data = []
     df_label_column = find_all_columns(df, 'label_ko')[0]
     ndf_label_column = find_all_columns(ndf, 'label_ko')[0]
 
-    concept_none_data = {}
     df_concept_column = find_all_columns(df, 'concept_id')
     ndf_concept_column = find_all_columns(ndf, 'concept_id')
 
     # concept_id 컬럼이 존재하는지 여부 조사
     concept_exist = len(df_concept_column) * len(ndf_concept_column) != 0
-    if concept_exist:
-        df_concept_column = df_concept_column[0]
-        ndf_concept_column = ndf_concept_column[0]
 
-    en_none_data = {}
     df_en_column = find_all_columns(df, 'label_en')
     ndf_en_column = find_all_columns(ndf, 'label_en')
 
     # label_en 컬럼이 존재하는지 여부 조사
     en_exist = len(df_en_column) * len(ndf_en_column) != 0
-    if en_exist:
-        df_en_column = df_en_column[0]
-        ndf_en_column = ndf_en_column[0]
 
+    # 반복적인 iloc 접근을 피하기 위해 필요한 컬럼을 미리 배열로 변환
+    df_labels = df[df_label_column].to_numpy()
+    df_concepts = df[df_concept_column[0]].to_numpy() if concept_exist else None
+    df_ens = df[df_en_column[0]].to_numpy() if en_exist else None
+    ldf_values = ldf.to_numpy()
+
+    # 검색할 데이터가 없는 index 에 대한 hash index
+    # label 은 오름차순 index 리스트, concept_id 및 label_en 은 마지막 index 를 저장
+    label_index = {}
+    concept_index = {}
+    en_index = {}
     for idx, value in enumerate(ndata):
         if isinstance(value, str):
             # 이전에 검색된 데이터가 문자인 경우 pass
@@ -795,73 +816,90 @@ def compare_df_and_ndf_label_and_concept(column: Tuple[Union[str, Tuple[str]]],
             continue
 
         # label 추출
-        label = df[df_label_column].iloc[idx]
-        label = re.sub(r'\s+', '', label)
-        label = extract_account_title(label)
-        label_set = set(ldf.iloc[idx])
+        label = extract_account_title(regex_space.sub('', df_labels[idx]))
+        label_set = set(ldf_values[idx])
         label_set.add(label)
-        # (index, label_set) 리스트 생성
-        label_none_data.append((idx, label_set))
+        for item in label_set:
+            label_index.setdefault(item, []).append(idx)
 
         # concept_id가 존재하는 경우 concept_id도 추가로 검색
         if concept_exist:
-            concept = df[df_concept_column].iloc[idx]
-            concept_none_data[concept] = idx
+            concept_index[df_concepts[idx]] = idx
 
         # label_en가 존재하는 경우 label_en도 추가로 검색
         if en_exist:
-            en = df[df_en_column].iloc[idx]
-            en_none_data[en] = idx
+            en_index[df_ens[idx]] = idx
+
+    ndf_labels = ndf[ndf_label_column].to_numpy()
+    ndf_concepts = ndf[ndf_concept_column[0]].to_numpy() if concept_exist else None
+    ndf_ens = ndf[ndf_en_column[0]].to_numpy() if en_exist else None
+    ndf_values = ndf[column].to_numpy()
 
-    # 기존 Dataframe index 중 사용된 결과 값 리스트
-    used = []
+    # 기존 Dataframe index 중 사용된 결과 값
+    used = set()
 
     for idx in range(len(ndf)):
-        # 검색된 값
-        value_found = None
         # 검색된 기존 Dataframe 의 index
         index_found = None
 
         # 검색할 label 명
-        label = extract_account_title(ndf[ndf_label_column].iloc[idx])
+        label = extract_account_title(ndf_labels[idx])
 
         if concept_exist:
             # 추가할 Dataframe 의 concept_id
-            concept = ndf[ndf_concept_column].iloc[idx]
-            index_found = concept_none_data.get(concept)
+            index_found = concept_index.get(ndf_concepts[idx])
             if index_found in used:
                 continue
-            elif index_found is not None:
-                value_found = ndf[column].iloc[idx]
 
-        if index_found is None:
-            if en_exist:
-                en = ndf[ndf_en_column].iloc[idx]
-                index_found = en_none_data.get(en)
-                if index_found in used:
-                    continue
-                elif index_found is not None:
-                    value_found = ndf[column].iloc[idx]
+        if index_found is None and en_exist:
+            index_found = en_index.get(ndf_ens[idx])
+            if index_found in used:
+                continue
 
         if index_found is None:
-            for index, label_set in label_none_data:
-                if index in used:
-                    continue
-                if label in label_set:
-                    value_found = ndf[column].iloc[idx]
+            for index in label_index.get(label, ()):
+                if index not in used:
                     index_found = index
                     break
 
-        if index_found is None:
-            pass
-        elif isinstance(index_found, int):
-            used.append(index_found)
-            ndata[index_found] = value_found
+        if index_found is not None:
+            used.add(index_found)
+            ndata[index_found] = ndf_values[idx]
             nlabels[index_found] = label
 
     return ndata, nlabels
 
 
+def _is_missing_value(value) -> bool:
+    """ 문자, None 또는 NaN 인 경우 True """
+    if isinstance(value, str) or value is None:
+        return True
+    try:
+        return math.isnan(value)
+    except TypeError:
+        return False
+
+
+def _build_value_index(ndf: DataFrame, columns) -> Dict:
+    """ column 별 {값: row index 리스트} hash index 생성
+
+    문자, None 및 NaN 값은 비교 대상이 아니므로 제외한다.
+    """
+    index_values = ndf.index.values
+    value_index = {}
+    for col in columns:
+        mapping = {}
+        for pos, value in enumerate(ndf[col].to_numpy()):
+            if _is_missing_value(value):
+                continue
+            try:
+                mapping.setdefault(value, []).append(index_values[pos])
+            except TypeError:
+                continue
+        value_index[col] = mapping
+    return value_index
+
+
 def compare_df_and_ndf_value(column: Tuple[Union[str, Tuple[str]]],
                              df: DataFrame, ndf: DataFrame, ldf: DataFrame,
                              ndata: List[Union[float, str, None]],
@@ -898,20 +936,19 @@ def compare_df_and_ndf_value(column: Tuple[Union[str, Tuple[str]]],
     overlap = df_columns_set.intersection(ndf_columns_set)
     nko_column = find_all_columns(ndf, r'label_ko')
 
-    for idx, value in enumerate(ndata):
-        if isinstance(value, str):
-            # 이전에 검색된 데이터가 문자인 경우 pass
-            pass
-        elif value is None:
-            # 이전에 검색된 데이터가 없는 경우 pass
-            pass
-        elif math.isnan(value):
-            # 이전에 검색된 데이터가 유효한 값이 아닌 경우 pass
-            pass
-        else:
-            # 올바른 값이 경우 검색 X
-            continue
+    # 검색이 필요한 index 가 없는 경우 hash index 를 생성하지 않음
+    targets = [idx for idx, value in enumerate(ndata) if _is_missing_value(value)]
+    if len(targets) == 0:
+        return ndata, nlabels
+
+    # 모든 값이 0인지 확인하기 위한 row 별 합계
+    row_sums = df[list(overlap)].apply(pd.to_numeric, errors='coerce').sum(axis=1).to_numpy()
+    df_values = {col: df[col].to_numpy() for col in overlap}
+    ndf_index = _build_value_index(ndf, overlap)
+    ndf_values = ndf[column].to_numpy()
+    ndf_labels = ndf[nko_column].to_numpy()
 
+    for idx in targets:
         nvalue = None
         nlabel = ''
 
@@ -919,41 +956,30 @@ def compare_df_and_ndf_value(column: Tuple[Union[str, Tuple[str]]],
         found_sign = {}
         max_found = 0
 
-        check_all_zeros = pd.to_numeric(
-            df[list(overlap)].iloc[idx], errors='coerce').sum()
-        if check_all_zeros == 0.0:
+        if row_sums[idx] == 0.0:
             continue  # 모든 값이 0인 경우 pass
 
         for col in overlap:
-            value = df[col].iloc[idx]
-            if isinstance(value, str):
-                pass
-            elif value is None:
-                pass
-            elif math.isnan(value):
-                pass
-            else:
-                sign = 1
-                # Ref와 일치하는 값을 가지는 row index 찾기
-                w = ndf[ndf[col] == value].dropna(
-                    axis=1, how='all').dropna(how='all')
-                # 만약 찾지 못하는 경우 Ref의 값의 음수와 동일한 값을 가지는 row index 찾기
-                if len(w) == 0:
-                    sign = -1
-                    w = ndf[ndf[col] == -
-                            value].dropna(axis=1, how='all').dropna(how='all')
-
-                if len(w) > 0:
-                    for index in w.index.values:
-                        found[index] = found.get(index, 0) + 1
-                        max_found = max(max_found, found[index])
-                        found_sign[index] = sign
+            value = df_values[col][idx]
+            if _is_missing_value(value):
+                continue
+            sign = 1
+            # Ref와 일치하는 값을 가지는 row index 찾기
+            w = ndf_index[col].get(value, [])
+            # 만약 찾지 못하는 경우 Ref의 값의 음수와 동일한 값을 가지는 row index 찾기
+            if len(w) == 0:
+                sign = -1
+                w = ndf_index[col].get(-value, [])
+
+            for index in w:
+                found[index] = found.get(index, 0) + 1
+                max_found = max(max_found, found[index])
+                found_sign[index] = sign
 
         for k, v in found.items():
             if v >= max_found:
-                nvalue = found_sign[k] * ndf[column].iloc[k]
-                nlabel = ndf[nko_column].iloc[k].iloc[0]
-                nlabel = extract_account_title(nlabel)
+                nvalue = found_sign[k] * ndf_values[k]
+                nlabel = extract_account_title(ndf_labels[k][0])
 
         if nvalue and math.isnan(nvalue):
             nvalue = None
@@ -1082,10 +1108,9 @@ def merge_fs(fs_df: Dict[str, DataFrame],
 
             overlap = df_columns.intersection(ndf_columns)
 
-            date_regex = re.compile(r'\d{8}')
             diff = [x for x in (ndf_columns - overlap)
-                    if date_regex.search(x[0])]
-            diff.sort(key=lambda x: date_regex.findall(x[0])[0], reverse=True)
+                    if regex_date.search(x[0])]
+            diff.sort(key=lambda x: regex_date.findall(x[0])[0], reverse=True)
 
             # Data가 동일할 경우 Continue
             if len(diff) == 0:
@@ -1207,12 +1232,10 @@ def analyze_xbrl(report, fs_tp: Tuple[str] = ('bs', 'is', 'cis', 'cf'), separate
 
 
 def split_columns_concept_data(columns: pd.Index) -> Tuple[Optional[pd.Index], Optional[pd.Index]]:
-    regex = re.compile(r'\d{8}')
-
     concept_columns = []
     data_columns = []
     for column in columns:
-        df_column_date = regex.findall(column[0])
+        df_column_date = regex_date.findall(column[0])
         if len(df_column_date) == 0:
             concept_columns.append(column)
         else:
@@ -1236,10 +1259,9 @@ def sorting_data_columns(columns: pd.Index) -> pd.Index:
             ret = [x for x in value]
             return tuple(ret)
 
-    regex = re.compile(r'\d{8}')
     data_columns = []
     for column in columns:
-        df_column_date = regex.findall(column[0])
+        df_column_date = regex_date.findall(column[0])
         data_columns.append([column, df_column_date])
 
     data_columns.sort(key=lambda x: sorting(x[1]), reverse=True)
@@ -1331,11 +1353,9 @@ def remove_almost_empty_columns(df: Dict[str, DataFrame], min_data_number: int =
         The modified dictionary with almost empty columns removed.
     """
 
-    regex = re.compile(r'\d{8}')
-
     for tp, df_tp in df.items():
         if df_tp is not None:
-            new_columns = [col for col in df_tp.columns if (regex.search(
+            new_columns = [col for col in df_tp.columns if (regex_date.search(
                 col[0]) is None) or (df_tp[col].count() > min_data_number)]
             df[tp] = df_tp[new_columns]
 
@@ -1351,6 +1371,11 @@ def analyze_report(report: Report,
     # 2012년 이후 데이터만 XBRL 데이터 추출
     year = int(report.rcept_dt[:4])
     if year > 2011 and dataset == 'xbrl':
+        # XBRL 캐시에 저장된 추출 결과가 있는 경우 재사용
+        cache_options = {'fs_tp': fs_tp, 'separate': separate, 'lang': lang, 'separator': separator}
+        fs_df = xbrl_cache.get_statements(report.rcept_no, cache_options)
+        if fs_df is not None:
+            return fs_df
         xbrl = report.xbrl
     else:
         xbrl = None
@@ -1372,6 +1397,8 @@ def analyze_report(report: Report,
                 'Could not find consolidated financial statements')
 
     fs_df = remove_almost_empty_columns(fs_df, min_data_number=1)
+    if xbrl is not None:
+        xbrl_cache.set_statements(report.rcept_no, cache_options, fs_df)
     return fs_df
 
 
@@ -1432,7 +1459,8 @@ def extract(corp_code: str,
             progressbar: bool = True,
             skip_error: bool = True,
             last_report_only: bool = True,
-            min_required: int = 4) -> FinancialStatement:
+            min_required: int = 4,
+            max_workers: int = 1) -> FinancialStatement:
     """
     재무제표 검색
 
@@ -1466,6 +1494,8 @@ def extract(corp_code: str,
         최종 보고서만을 이용하여 데이터를 추출할지 여부 (default: True)
     min_required: int, optional
         Merge를 위한 최소한의 유효 데이터 개수 (default: 4)
+    max_workers: int, optional
+        보고서 다운로드 및 분석에 사용할 최대 Thread 수, 2 이상인 경우 보고서를 미리 병렬로 분석한 후 순서대로 Merge (default: 1)
     Returns
     -------
     FinancialStatement
@@ -1505,14 +1535,26 @@ def extract(corp_code: str,
             return False
 
     # Spinner disable
-    import dart_fss as dart
-    dart.utils.spinner.spinner_enable = False
+    spinner_enable = Spinner.spinner_enable
+    Spinner.spinner_enable = False
     statements = None
     label_df = None
     report = None
 
     regex_skip_title = str_to_regex("연장")
 
+    # 보고서 다운로드 및 분석은 병렬로 처리하고, Merge 는 보고서 순서대로 처리
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers and max_workers > 1 else None
+    futures = []
+
+    def submit(rpt):
+        if executor is None:
+            return None
+        future = executor.submit(analyze_report, report=rpt, fs_tp=fs_tp, separate=separate,
+                                 lang=lang, separator=separator, dataset=dataset)
+        futures.append(future)
+        return future
+
     try:
         for idx, tp in enumerate(all_report_tp):
             if check_report_tp(report_tp, tp):
@@ -1525,18 +1567,27 @@ def extract(corp_code: str,
                                              last_reprt_at=last_reprt_at)
 
                 length = len(reports)
-                for _ in tqdm(range(length), desc='{} reports'.format(all_report_name[idx]), unit='report', disable=tqdm_disable):
+                # 모든 보고서는 요청한 dataset 으로 한번만 분석
+                prefetched = [None] * length
+                for jdx in range(length):
+                    if not regex_skip_title.search(reports[jdx].report_nm):
+                        prefetched[jdx] = submit(reports[jdx])
+                for jdx in tqdm(range(length), desc='{} reports'.format(all_report_name[idx]), unit='report', disable=tqdm_disable):
                     try:
                         report = reports.pop(0)
                         if regex_skip_title.search(report.report_nm):
                             continue
 
                         if statements is None:
-                            statements = analyze_report(report=report,
-                                                        fs_tp=fs_tp,
-                                                        separate=separate,
-                                                        lang=lang,
-                                                        separator=separator)
+                            if prefetched[jdx] is not None:
+                                statements = prefetched[jdx].result()
+                            else:
+                                statements = analyze_report(report=report,
+                                                            fs_tp=fs_tp,
+                                                            separate=separate,
+                                                            lang=lang,
+                                                            separator=separator,
+                                                            dataset=dataset)
                             if statements is None:
                                 warnings_text = 'Unable to extract financial statements: {}.'.format(
                                     report.to_dict())
@@ -1548,12 +1599,15 @@ def extract(corp_code: str,
                                 # initialize label dictionary
                                 label_df = init_label(statements, fs_tp=fs_tp)
                         else:
-                            nstatements = analyze_report(report=report,
-                                                         fs_tp=fs_tp,
-                                                         separate=separate,
-                                                         lang=lang,
-                                                         separator=separator,
-                                                         dataset=dataset)
+                            if prefetched[jdx] is not None:
+                                nstatements = prefetched[jdx].result()
+                            else:
+                                nstatements = analyze_report(report=report,
+                                                             fs_tp=fs_tp,
+                                                             separate=separate,
+                                                             lang=lang,
+                                                             separator=separator,
+                                                             dataset=dataset)
                             if nstatements is None:
                                 warnings_text = 'Unable to extract financial statements: {}.'.format(
                                     report.to_dict())
@@ -1571,8 +1625,6 @@ def extract(corp_code: str,
                         else:
                             raise ex
 
-        # Spinner enable
-        dart.utils.spinner.spinner_enable = True
         if separate is False and (statements is None or all([statements[tp] is None for tp in statements])):
             raise NotFoundConsolidated(
                 'Could not find consolidated financial statements')
@@ -1606,4 +1658,8 @@ def extract(corp_code: str,
         e.args = (*e.args, msg, )
         raise e
     finally:
-        dart.utils.spinner.spinner_enable = True
+        if executor is not None:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+        Spinner.spinner_enable = spinner_enable
@@ -195,8 +195,10 @@ class FinancialStatement(object):
         return cls(statements, labels, info["info"].to_dict())
 
     def __getattr__(self, item):
-        if item in self.info:
-            return self.info[item]
+        # pickle 복원시 info 가 설정되기 전에 호출되는 경우 무한 재귀 방지
+        info = self.__dict__.get('info', {})
+        if item in info:
+            return info[item]
         else:
             error = "'{}' object has no attribute '{}'".format(type(self).__name__, item)
             raise AttributeError(error)
@@ -24,4 +24,21 @@ def test_search_filings(dart):
     f = dart.api.filings.search_filings(corp_code='00126380', bgn_de='20190101', end_de='20190301', last_reprt_at='Y')
     actual = f['total_count']
     expected = 29
-    assert actual == expected
\ No newline at end of file
+    assert actual == expected
+
+
+def test_iter_corp_code_xml(tmp_path):
+    from dart_fss.api.filings.corp_code import iter_corp_code_xml
+    path = tmp_path / 'CORPCODE.xml'
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n<result>\n'
+        '<list><corp_code>00126380</corp_code><corp_name>삼성전자</corp_name>'
+        '<corp_eng_name>SAMSUNG ELECTRONICS CO,.LTD</corp_eng_name>'
+        '<stock_code>005930</stock_code><modify_date>20230110</modify_date></list>\n'
+        '<list><corp_code>00434003</corp_code><corp_name>다코</corp_name>'
+        '<stock_code> </stock_code><modify_date>20170630</modify_date></list>\n'
+        '</result>\n', encoding='utf-8')
+    actual = list(iter_corp_code_xml(str(path)))
+    expected = [('00126380', '삼성전자', 'SAMSUNG ELECTRONICS CO,.LTD', '005930', '20230110'),
+                ('00434003', '다코', None, None, '20170630')]
+    assert actual == expected
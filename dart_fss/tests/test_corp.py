@@ -91,3 +91,202 @@ def test_corp_search_filings(corp_list):
     expected = 1
     assert actual == expected
 
+
+@pytest.fixture
+def fake_corp_list(tmp_path, monkeypatch):
+    from dart_fss.corp import corp_list as module
+    from dart_fss.utils import Singleton
+
+    corps = [
+        {'corp_code': '00126380', 'corp_name': '삼성전자', 'corp_eng_name': 'SAMSUNG ELECTRONICS CO,.LTD',
+         'stock_code': '005930', 'modify_date': '20230110'},
+        {'corp_code': '00164779', 'corp_name': '에스케이하이닉스', 'corp_eng_name': 'SK hynix Inc.',
+         'stock_code': '000660', 'modify_date': '20230110'},
+        {'corp_code': '00434003', 'corp_name': '다코', 'corp_eng_name': 'Daco corporation',
+         'stock_code': None, 'modify_date': '20170630'},
+    ]
+    markets = {
+        'Y': {'005930': {'sector': '통신 및 방송 장비 제조업', 'product': '반도체', 'corp_cls': 'Y'},
+              '000660': {'sector': '반도체 제조업', 'product': '메모리', 'corp_cls': 'Y'}},
+        'K': {}, 'N': {},
+    }
+    calls = {'corp_code': 0}
+
+    def fake_iter_corp_code():
+        calls['corp_code'] += 1
+        for x in corps:
+            yield tuple(x[key] for key in module.CORP_CODE_FIELDS)
+
+    monkeypatch.setattr(module, 'iter_corp_code', fake_iter_corp_code)
+    monkeypatch.setattr(module, 'get_stock_market_list', lambda k, _: dict(markets[k]))
+    monkeypatch.setattr(module, 'get_trading_halt_list', lambda k, _: {})
+
+    def create(**kwargs):
+        Singleton._instances.pop(module.CorpList, None)
+        return module.CorpList(snapshot_path=str(tmp_path / 'corp_list.pkl'), **kwargs)
+
+    yield create, corps, calls
+    Singleton._instances.pop(module.CorpList, None)
+
+
+def test_corp_list_snapshot(fake_corp_list, monkeypatch):
+    import datetime
+    from requests.exceptions import ConnectionError
+    from dart_fss.corp import corp_list as module
+    create, corps, calls = fake_corp_list
+
+    crp_list = create()
+    assert crp_list.find_by_stock_code('005930').corp_name == '삼성전자'
+
+    # Snapshot 이 만료되지 않은 경우 다운로드 하지 않음
+    crp_list = create(max_age=datetime.timedelta(days=1))
+    actual = (calls['corp_code'], len(crp_list), crp_list.find_by_stock_code('000660').corp_cls)
+    expected = (1, 3, 'Y')
+    assert actual == expected
+
+    # 다운로드 실패시 만료된 Snapshot 사용
+    def offline():
+        raise ConnectionError('offline')
+
+    monkeypatch.setattr(module, 'iter_corp_code', offline)
+    with pytest.warns(RuntimeWarning):
+        crp_list = create()
+    assert crp_list.find_by_corp_name('하이닉스')[0].corp_code == '00164779'
+
+
+def test_corp_list_singleton_settings(fake_corp_list):
+    import datetime
+    import warnings
+    from dart_fss.corp import corp_list as module
+    create, corps, calls = fake_corp_list
+
+    crp_list = create(max_age=datetime.timedelta(days=1))
+    # 설정을 지정하지 않거나 동일한 경우 경고하지 않음
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert module.CorpList() is crp_list
+        assert module.CorpList(max_age=datetime.timedelta(days=1)) is crp_list
+    with pytest.warns(RuntimeWarning, match='max_age'):
+        assert module.CorpList(max_age=datetime.timedelta(days=2)) is crp_list
+
+
+def test_corp_list_to_dataframe(fake_corp_list):
+    import pickle
+    create, corps, calls = fake_corp_list
+
+    crp_list = create()
+    df = crp_list.to_dataframe()
+    actual = (df['corp_code'].tolist(), df['corp_cls'].tolist(), df['stock_code'].tolist()[2])
+    expected = (['00126380', '00164779', '00434003'], ['Y', 'Y', 'E'], None)
+    assert actual == expected
+
+    # Corp 는 조회시 생성되며 재사용
+    assert crp_list._corps == [None, None, None]
+    corp = crp_list.find_by_product('메모리')[0]
+    assert corp is crp_list.find_by_corp_code('00164779')
+    assert crp_list._corps[0] is None
+
+    actual = (corp.sector, crp_list.find_by_corp_name('다코', market='Y'), len(crp_list.corps))
+    expected = ('반도체 제조업', None, 3)
+    assert actual == expected
+
+    restored = pickle.loads(pickle.dumps(corp))
+    assert restored.to_dict() == corp.to_dict()
+
+
+def test_corp_list_search_index(fake_corp_list):
+    create, corps, calls = fake_corp_list
+    crp_list = create()
+
+    def codes(res):
+        return [x.corp_code for x in res] if res else None
+
+    actual = [
+        codes(crp_list.find_by_corp_name('삼성전자', exactly=True)),
+        codes(crp_list.find_by_corp_name('하이')),
+        codes(crp_list.find_by_corp_name('ㅅㅅㅈㅈ', exactly=True)),
+        codes(crp_list.find_by_corp_name('ㄷㅋ', market='YK')),
+        codes(crp_list.find_by_corp_name('^(삼성|다코)')),
+        codes(crp_list.find_by_product('반도|메모')),
+        codes(crp_list.find_by_sector('제조업', market='K')),
+    ]
+    expected = [['00126380'], ['00164779'], ['00126380'], None, ['00126380', '00434003'],
+                ['00126380', '00164779'], None]
+    assert actual == expected
+
+
+def test_corp_list_fuzzy_search(fake_corp_list):
+    create, corps, calls = fake_corp_list
+    crp_list = create()
+
+    def codes(res):
+        return [x.corp_code for x, _ in res]
+
+    res = crp_list.fuzzy_search('삼성전지')
+    assert codes(res) == ['00126380']
+    assert 0 < res[0][1] < 1
+
+    actual = [
+        codes(crp_list.fuzzy_search('(주)삼성전자'))[0],
+        crp_list.fuzzy_search('samsung electronics')[0][1],
+        codes(crp_list.fuzzy_search('hynix', market='Y', min_score=0.3)),
+        codes(crp_list.fuzzy_search('0059')),
+        codes(crp_list.fuzzy_search('다코', market='Y')),
+        codes(crp_list.fuzzy_search('전자', top_k=1, min_score=0.9)),
+    ]
+    expected = ['00126380', 1.0, ['00164779'], ['00126380'], [], []]
+    assert actual == expected
+
+
+def test_corp_list_load_profiles(fake_corp_list, monkeypatch):
+    import datetime
+    from dart_fss.corp import corp_list as module
+    from dart_fss.errors import NoDataReceived
+    create, corps, calls = fake_corp_list
+    requested = []
+
+    def fake_get_corp_profile(corp_code):
+        requested.append(corp_code)
+        if corp_code == '00164779':
+            raise NoDataReceived('조회된 데이타가 없습니다.')
+        return {'corp_code': corp_code, 'ceo_nm': 'CEO ' + corp_code}
+
+    monkeypatch.setattr(module, 'get_corp_profile', fake_get_corp_profile)
+    crp_list = create()
+    samsung = crp_list.find_by_corp_code('00126380')
+    errors = crp_list.load_profiles(progressbar=False)
+    actual = (sorted(requested), list(errors), samsung.ceo_nm)
+    expected = (['00126380', '00164779'], ['00164779'], 'CEO 00126380')
+    assert actual == expected
+
+    # 저장된 기업개황 정보는 다시 요청하지 않음
+    requested.clear()
+    crp_list.load_profiles(['00126380', '00434003'], progressbar=False)
+    assert requested == ['00434003']
+
+    # Snapshot 에 저장된 기업개황 정보 사용
+    crp_list = create(max_age=datetime.timedelta(days=1))
+    actual = (calls['corp_code'], crp_list.find_by_corp_code('00434003').ceo_nm)
+    expected = (1, 'CEO 00434003')
+    assert actual == expected
+
+
+def test_ngram_index():
+    from dart_fss.corp.search_index import NGramIndex, to_choseong
+    index = NGramIndex(['삼성전자', '삼성SDI', None, '전자랜드'])
+    actual = (index.search('전자').tolist(), index.search('성전').tolist(), index.search('자전').tolist(),
+              index.search('삼성SDI', exactly=True).tolist(), to_choseong('LG전자'))
+    expected = ([0, 3], [0], [], [1], 'LGㅈㅈ')
+    assert actual == expected
+
+
+def test_merge_profiles():
+    from dart_fss.corp.snapshot import merge_profiles
+    snapshot = {
+        'corps': [{'corp_code': '1', 'modify_date': '20200101'}, {'corp_code': '2', 'modify_date': '20200101'}],
+        'profiles': {'1': {'ceo_nm': 'A'}, '2': {'ceo_nm': 'B'}},
+    }
+    corps = [{'corp_code': '1', 'modify_date': '20200101'}, {'corp_code': '2', 'modify_date': '20210101'}]
+    actual = merge_profiles(corps, snapshot)
+    expected = {'1': {'ceo_nm': 'A'}}
+    assert actual == expected
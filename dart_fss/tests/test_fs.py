@@ -159,4 +159,71 @@ def test_extract_fs(test_cases_for_xbrl, corp_list):
             f"with report type {test_case['report_tp']} "
             f"and financial statement type {test_case['fs_tp']}. "
             f"Expected {expected}, but got {actual}."
-        )
\ No newline at end of file
+        )
+
+
+def _fake_fs(corp_code):
+    import pandas as pd
+    from dart_fss.fs import FinancialStatement
+    df = pd.DataFrame({'label_ko': ['자산총계'], '20181231': [1.]})
+    return FinancialStatement({'bs': df}, {'bs': None}, {'corp_code': corp_code})
+
+
+def test_fs_pickle():
+    import pickle
+    fs = pickle.loads(pickle.dumps(_fake_fs('00126380')))
+    actual = (fs.corp_code, fs['bs'].iloc[0, 1])
+    expected = ('00126380', 1.)
+    assert actual == expected
+
+
+def test_extract_many_checkpoint(tmp_path, monkeypatch):
+    import multiprocessing
+    import importlib
+    if multiprocessing.get_start_method() != 'fork':
+        pytest.skip('fork start method required')
+
+    bulk = importlib.import_module('dart_fss.fs.bulk')
+    calls = []
+
+    def fake_extract(corp_code, **kwargs):
+        if corp_code == '00000002':
+            raise ValueError('failed')
+        return _fake_fs(corp_code)
+
+    monkeypatch.setattr(bulk, 'extract', fake_extract)
+    corp_codes = ['00000001', '00000002', '00000003']
+    checkpoint = str(tmp_path)
+
+    results = dict(bulk.extract_many(corp_codes, bgn_de='20180101', max_workers=2,
+                                     checkpoint=checkpoint, progressbar=False))
+    assert isinstance(results['00000002'], ValueError)
+    assert results['00000003'].corp_code == '00000003'
+
+    # 저장된 결과를 이용하는 경우 Worker 를 실행하지 않음
+    monkeypatch.setattr(bulk, 'ProcessPoolExecutor', lambda *args, **kwargs: calls.append(args))
+    results = dict(bulk.extract_many(['00000001', '00000003'], bgn_de='20180101',
+                                     checkpoint=checkpoint, progressbar=False))
+    actual = (calls, sorted(results), results['00000001'].corp_code)
+    expected = ([], ['00000001', '00000003'], '00000001')
+    assert actual == expected
+
+
+def test_shared_limiter():
+    import importlib
+    from dart_fss.utils import RateLimiter, request
+    bulk = importlib.import_module('dart_fss.fs.bulk')
+    proxy = RateLimiter(max_calls=10, period=60.)
+    limiter = bulk._SharedLimiter(proxy, max_calls=10, period=60.)
+    origin = request.limiter
+    request.limiter = limiter
+    try:
+        # Request.delay 및 set_rate_limit 이 동작해야 함
+        request.set_delay(0.5)
+        request.set_rate_limit(max_calls=5)
+        limiter.acquire('opendart.fss.or.kr')
+        actual = (request.delay, limiter.max_calls, proxy.max_calls, len(proxy._calls['opendart.fss.or.kr']))
+        expected = (0.5, 5, 5, 1)
+        assert actual == expected
+    finally:
+        request.limiter = origin
@@ -26,3 +26,180 @@ def test_extract_date_from_header():
         actual = '-'.join([x.strftime('%Y%m%d') for x in date_info])
     expected = '20180101-20181231'
     assert actual == expected
+
+
+def _fake_statements(dates, offset):
+    import pandas as pd
+    labels = ['유동자산', '비유동자산', '자산총계', '유동부채', '부채총계']
+    columns = [('Statement of financial position', 'label_ko')]
+    columns += [(date, ('연결재무제표',)) for date in dates]
+    data = [[label] + [float(offset + idx * 10 + jdx) for jdx in range(len(dates))]
+            for idx, label in enumerate(labels)]
+    df = pd.DataFrame(data, columns=pd.MultiIndex.from_tuples(columns))
+    return {'bs': df}
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_extract_merge_order(monkeypatch, max_workers):
+    import time
+    import importlib
+    fs_extract = importlib.import_module('dart_fss.fs.extract')
+    from dart_fss.filings.search_result import SearchResults
+
+    rcept_list = ['20200330000001', '20190401000001', '20180402000001']
+    resp = {
+        'page_no': 1, 'page_count': 100, 'total_count': 3, 'total_page': 1,
+        'list': [{'rcept_no': x, 'report_nm': '사업보고서', 'rcept_dt': x[:8]} for x in rcept_list]
+    }
+    dataset = {
+        rcept_list[0]: (['20191231', '20181231'], 0),
+        rcept_list[1]: (['20181231', '20171231'], 100),
+        rcept_list[2]: (['20171231', '20161231'], 200),
+    }
+
+    def fake_analyze_report(report, **kwargs):
+        # 먼저 요청된 보고서가 늦게 완료되도록 설정
+        time.sleep(0.05 * (3 - rcept_list.index(report.rcept_no)))
+        dates, offset = dataset[report.rcept_no]
+        return _fake_statements(dates, offset)
+
+    monkeypatch.setattr(fs_extract, 'search_annual_report', lambda **kwargs: SearchResults(resp))
+    monkeypatch.setattr(fs_extract, 'analyze_report', fake_analyze_report)
+
+    fs = fs_extract.extract('00126380', '20160101', fs_tp=('bs',), progressbar=False, max_workers=max_workers)
+    df = fs['bs']
+    actual = [column[0] for column in df.columns][1:]
+    expected = ['20191231', '20181231', '20171231', '20161231']
+    assert actual == expected
+    # 2016년 데이터는 세번째 보고서에서 추출
+    assert df[('20161231', ('연결재무제표',))].tolist() == [201.0, 211.0, 221.0, 231.0, 241.0]
+
+
+def test_extract_prefetch_once(monkeypatch):
+    import importlib
+    fs_extract = importlib.import_module('dart_fss.fs.extract')
+    from dart_fss.filings.search_result import SearchResults
+
+    rcept_list = ['20200330000001', '20190401000001', '20180402000001']
+    resp = {
+        'page_no': 1, 'page_count': 100, 'total_count': 3, 'total_page': 1,
+        'list': [{'rcept_no': rcept_list[0], 'report_nm': '사업보고서', 'rcept_dt': '20200330'},
+                 {'rcept_no': rcept_list[1], 'report_nm': '제출기한연장신고서', 'rcept_dt': '20190401'},
+                 {'rcept_no': rcept_list[2], 'report_nm': '사업보고서', 'rcept_dt': '20180402'}]
+    }
+    calls = []
+
+    def fake_analyze_report(report, dataset='xbrl', **kwargs):
+        calls.append((report.rcept_no, dataset))
+        if report.rcept_no == rcept_list[0]:
+            return _fake_statements(['20191231', '20181231'], 0)
+        return _fake_statements(['20171231', '20161231'], 200)
+
+    monkeypatch.setattr(fs_extract, 'search_annual_report', lambda **kwargs: SearchResults(resp))
+    monkeypatch.setattr(fs_extract, 'analyze_report', fake_analyze_report)
+
+    fs_extract.extract('00126380', '20160101', fs_tp=('bs',), dataset='web', progressbar=False, max_workers=4)
+    # 모든 보고서는 요청한 dataset 으로 한번만 분석하며, 연장 보고서는 분석하지 않음
+    actual = sorted(calls)
+    expected = [(rcept_list[2], 'web'), (rcept_list[0], 'web')]
+    assert actual == expected
+
+
+def test_compare_df_and_ndf_label_and_concept():
+    import numpy as np
+    import pandas as pd
+    column = ('20191231', ('연결재무제표',))
+    df = pd.DataFrame({
+        ('x', 'label_ko'): ['유동자산', '현금및현금성자산', '재고자산'],
+        ('x', 'concept_id'): ['ifrs_CurrentAssets', None, 'ifrs_Inventories'],
+        column: [1., np.nan, np.nan],
+    })
+    ndf = pd.DataFrame({
+        ('x', 'label_ko'): ['1.현금및현금성자산(주석3)', '재고', '재고자산'],
+        ('x', 'concept_id'): ['dart_Cash', 'ifrs_Inventories', 'ifrs_Other'],
+        column: [10., 20., 30.],
+    })
+    ldf = pd.DataFrame([[np.nan], [np.nan], [np.nan]])
+    actual = compare_df_and_ndf_label_and_concept(column, df, ndf, ldf, [1., np.nan, np.nan], [None] * 3)
+    expected = ([1., 10., 20.], [None, '현금및현금성자산', '재고'])
+    assert actual == expected
+
+
+def test_compare_df_and_ndf_value():
+    import numpy as np
+    import pandas as pd
+    column = ('20191231', ('연결재무제표',))
+    prev = ('20181231', ('연결재무제표',))
+    df = pd.DataFrame({
+        ('x', 'label_ko'): ['유동자산', '현금', '기타'],
+        prev: [100., -5., 0.],
+    })
+    ndf = pd.DataFrame({
+        ('x', 'label_ko'): ['1.유동자산', '현금성자산', '기타자산'],
+        prev: [100., 5., 0.],
+        column: [110., 7., 3.],
+    })
+    ldf = pd.DataFrame([[np.nan]] * 3)
+    actual = compare_df_and_ndf_value(column, df, ndf, ldf, [np.nan, None, None], [''] * 3)
+    expected = ([110., -7., None], ['유동자산', '현금성자산', ''])
+    assert actual == expected
+
+
+def test_convert_tbody_to_dataframe():
+    from bs4 import BeautifulSoup
+    header = BeautifulSoup('<table><tr><td>(단위 : 백만원)</td></tr></table>', 'html.parser')
+    table = BeautifulSoup(
+        '<table><tbody>'
+        '<tr><td>유동 자산</td><td>1,000</td><td>(200)</td></tr>'
+        '<tr><td><b>현금</b><br/>(주석3)</td><td>0</td><td>30</td></tr>'
+        '</tbody></table>', 'html.parser').table
+    columns = [['재무상태표', 'label_ko'], ['20191231', ('연결재무제표',)], ['20181231', ('연결재무제표',)]]
+    df = convert_tbody_to_dataframe(columns, {'table': table, 'header': header})
+    actual = df.values.tolist()
+    expected = [['유동자산', 1000000000.0, -200000000.0], ['현금', '', 30000000.0]]
+    assert actual == expected
+
+
+@pytest.mark.slow
+def test_str_to_float_benchmark():
+    import re
+    import timeit
+    from dart_fss.utils import str_to_regex
+
+    def inline_str_to_float(text, unit):
+        # 정규식을 매번 생성하던 이전 구현
+        regex = re.compile(r'\((-*\d+)\)|\(-\)(\d+)')
+        regex_korean = re.compile(r'[ㄱ-힣]|[a-zA-Z]')
+        try:
+            text = re.sub(r',|\s+', '', text)
+            if regex_korean.search(text):
+                value = float(regex_korean.sub('', text))
+                return value / unit if re.search('원', text) else value
+            if regex.search(text):
+                value = regex.search(text).group(1)
+                if value is None:
+                    value = regex.search(text).group(2)
+                return -float(value)
+            return float(text)
+        except (ValueError, TypeError):
+            return 0.0
+
+    def best(func, number=2000):
+        return min(timeit.repeat(func, number=number, repeat=5))
+
+    cells = ['1,234,567', '(12,345)', '(-)300', '', '12원', ' 7 ']
+    actual = [str_to_float(cell, 1000.) for cell in cells]
+    expected = [1234567.0, -12345.0, -300.0, 0.0, 0.012, 7.0]
+    assert actual == expected
+    assert [inline_str_to_float(cell, 1000.) for cell in cells] == expected
+
+    # 미리 생성한 정규식을 사용하는 경우 이전 구현보다 빨라야 함
+    elapsed = best(lambda: [str_to_float(cell, 1000.) for cell in cells])
+    baseline = best(lambda: [inline_str_to_float(cell, 1000.) for cell in cells])
+    assert elapsed < baseline
+
+    # 캐시된 str_to_regex 는 매번 정규식을 생성하는 경우보다 빨라야 함
+    query = ws('재무상태표') + ' OR ' + ws('대차대조표') + ' AND ' + ws('연결')
+    elapsed = best(lambda: str_to_regex(query))
+    baseline = best(lambda: str_to_regex.__wrapped__(query))
+    assert elapsed < baseline / 2
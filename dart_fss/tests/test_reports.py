@@ -56,4 +56,79 @@ def test_xbrlviewer(dart):
     actual = len(report.to_dict(summary=False)['xbrlviewer'])
     expected = 1
 
-    assert actual == expected
\ No newline at end of file
+    assert actual == expected
+
+
+def test_page_soup(monkeypatch):
+    from dart_fss.filings import pages
+
+    class FakeResponse:
+        content = ('<html><body><a href="/dsaf001/main.do" onclick="window.open(\'/report/a.do\')">a</a>'
+                   '<table border="1"><tr><td>자산\xa0총계</td></tr></table></body></html>').encode('utf-8')
+
+    calls = []
+
+    def fake_get(**kwargs):
+        calls.append(kwargs)
+        return FakeResponse()
+
+    monkeypatch.setattr(pages.request, 'get', fake_get)
+    page = pages.Page('재무제표', '20180402005019', '6060273', 1, '0', '0', 'dart3.xsd')
+    soup = page.soup
+    url = 'window.open(\'https://dart.fss.or.kr/report/a.do\')'
+    actual = (soup is page.soup, soup.a['href'], soup.a['onclick'] == url, url in page.html, len(calls))
+    expected = (True, 'https://dart.fss.or.kr/dsaf001/main.do', True, True, 1)
+    assert actual == expected
+
+
+@pytest.mark.parametrize('concurrent', [False, True])
+def test_report_load_concurrent(monkeypatch, concurrent):
+    import threading
+    from bs4 import BeautifulSoup
+    from dart_fss.filings.reports import Report
+
+    html = ('<select id="family"><option value="rcpNo=20200101000002">연관 보고서</option></select>'
+            '<select id="att"><option value="rcpNo=20200101000003&dcmNo=1">첨부 보고서</option></select>')
+    calls = []
+
+    def record(name):
+        calls.append((name, threading.current_thread() is threading.main_thread()))
+
+    def fake_get_report(self):
+        record(self.rcp_no)
+        self.html = BeautifulSoup(html, 'html.parser')
+
+    def fake_extract_attached_files(self):
+        record('attached_files')
+        self._attached_files = []
+        return self._attached_files
+
+    class FakeViewer(object):
+        def find_all(self, **kwargs):
+            return []
+
+    def fake_extract_xbrlviewer(self):
+        record('xbrlviewer')
+        self._xbrlviewer = FakeViewer()
+        return self._xbrlviewer
+
+    monkeypatch.setattr(Report, '_get_report', fake_get_report)
+    monkeypatch.setattr(Report, 'extract_attached_files', fake_extract_attached_files)
+    monkeypatch.setattr(Report, 'extract_xbrlviewer', fake_extract_xbrlviewer)
+
+    report = Report(rcept_no='20200101000001')
+    report.load(concurrent=concurrent)
+    actual = sorted(name for name, _ in calls)
+    expected = ['20200101000001', '20200101000002', '20200101000003', 'attached_files', 'xbrlviewer']
+    assert actual == expected
+    # 보고서 HTML 이후의 요청은 병렬로 처리
+    actual = [main for name, main in calls if name != '20200101000001']
+    assert actual == [not concurrent] * 4
+
+    calls.clear()
+    report = Report(rcept_no='20200101000001')
+    report.load(concurrent=concurrent, components=['pages', 'attached_files'])
+    assert sorted(name for name, _ in calls) == ['20200101000001', 'attached_files']
+
+    with pytest.raises(ValueError):
+        report.load(components=['unknown'])
@@ -30,3 +30,272 @@ def test_search_report_report_list(annual_reports):
     expected = 5
     assert actual == expected
 
+
+@pytest.fixture
+def fake_search_filings(monkeypatch):
+    import importlib
+    from dart_fss.errors import NoDataReceived
+    search_module = importlib.import_module('dart_fss.filings.search')
+    result_module = importlib.import_module('dart_fss.filings.search_result')
+    rcept_list = ['2020{:010d}'.format(x) for x in range(7)]
+    requested = []
+
+    def fake(corp_code=None, page_no=1, page_count=10, **kwargs):
+        requested.append(page_no)
+        if corp_code is None:
+            raise NoDataReceived('조회된 데이타가 없습니다.')
+        items = rcept_list[(page_no - 1) * page_count:page_no * page_count]
+        return {
+            'page_no': page_no, 'page_count': page_count, 'total_count': len(rcept_list),
+            'total_page': (len(rcept_list) + page_count - 1) // page_count,
+            'list': [{'rcept_no': x, 'report_nm': '사업보고서', 'rcept_dt': x[:8]} for x in items]
+        }
+
+    monkeypatch.setattr(search_module, 'search_filings', fake)
+    monkeypatch.setattr(result_module, 'search_filings', fake)
+    return rcept_list, requested
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_search_iter(fake_search_filings, prefetch):
+    from dart_fss.filings import search_iter
+    rcept_list, requested = fake_search_filings
+
+    actual = [x.rcept_no for x in search_iter(corp_code='00126380', page_count=3, prefetch=prefetch)]
+    assert actual == rcept_list
+    assert sorted(requested) == [1, 2, 3]
+
+    # 검색 결과가 없는 경우
+    assert list(search_iter(page_count=3)) == []
+
+
+def test_search_iter_break(fake_search_filings):
+    from dart_fss.filings import search_iter
+    rcept_list, requested = fake_search_filings
+
+    for report in search_iter(corp_code='00126380', page_count=3, prefetch=False):
+        if report.rcept_no == rcept_list[1]:
+            break
+    assert requested == [1]
+
+
+def test_search_all(fake_search_filings):
+    from dart_fss.filings import search, search_all
+    rcept_list, requested = fake_search_filings
+
+    results = search_all(corp_code='00126380', page_count=3)
+    actual = ([x.rcept_no for x in results], results.total_count, results.total_page)
+    expected = (rcept_list, 7, 1)
+    assert actual == expected
+
+    results = search(corp_code='00126380', page_no=2, page_count=3)
+    actual = [x.rcept_no for x in results.iter_all()]
+    assert actual == rcept_list[3:]
+
+
+def test_search_all_overlap(monkeypatch):
+    import importlib
+    search_module = importlib.import_module('dart_fss.filings.search')
+    result_module = importlib.import_module('dart_fss.filings.search_result')
+    from dart_fss.filings import search_all
+
+    # 첫번째 페이지 요청 후 새로운 공시가 접수되어 두번째 페이지에 이전 페이지의 공시가 다시 포함
+    pages = {
+        1: ['20200103000001', '20200102000002', '20200102000001'],
+        2: ['20200102000001', '20200101000001'],
+    }
+
+    def fake(page_no=1, page_count=10, **kwargs):
+        return {
+            'page_no': page_no, 'page_count': page_count, 'total_count': 6, 'total_page': 2,
+            'list': [{'rcept_no': x, 'report_nm': '사업보고서', 'rcept_dt': x[:8]} for x in pages[page_no]]
+        }
+
+    monkeypatch.setattr(search_module, 'search_filings', fake)
+    monkeypatch.setattr(result_module, 'search_filings', fake)
+    results = search_all(corp_code='00126380', page_count=3)
+    actual = ([x.rcept_no for x in results], results.total_count)
+    expected = (['20200103000001', '20200102000002', '20200102000001', '20200101000001'], 4)
+    assert actual == expected
+
+
+def test_split_date_range():
+    from dart_fss.filings import split_date_range
+    actual = split_date_range('20190101', '20191231')
+    expected = [('20190101', '20190331'), ('20190401', '20190630'),
+                ('20190701', '20190930'), ('20191001', '20191231')]
+    assert actual == expected
+    assert split_date_range('20190115', '20190115') == [('20190115', '20190115')]
+
+
+def test_crawl_filings(monkeypatch, tmp_path):
+    import importlib
+    from dart_fss.errors import NoDataReceived
+    from dart_fss.filings import crawl_filings, FilingStore
+    crawler = importlib.import_module('dart_fss.filings.crawler')
+
+    # 분기별 5건, 2019년 3분기는 검색 결과 없음, 경계의 공시는 중복 반환
+    def fake(bgn_de, end_de, page_no=1, page_count=10, **kwargs):
+        assert bgn_de[:4] == end_de[:4]
+        if bgn_de == '20190701':
+            raise NoDataReceived('조회된 데이타가 없습니다.')
+        rcept_list = [bgn_de + '{:06d}'.format(x) for x in range(5)] + ['20190101000000']
+        items = rcept_list[(page_no - 1) * page_count:page_no * page_count]
+        return {
+            'page_no': page_no, 'page_count': page_count, 'total_count': len(rcept_list),
+            'total_page': (len(rcept_list) + page_count - 1) // page_count,
+            'list': [{'rcept_no': x, 'corp_code': '00126380', 'report_nm': '사업보고서', 'rcept_dt': x[:8]}
+                     for x in items]
+        }
+
+    # 페이지당 2건으로 요청
+    monkeypatch.setattr(crawler, 'search_filings', lambda page_count=100, **kwargs: fake(page_count=2, **kwargs))
+    path = str(tmp_path / 'filings.db')
+    actual = crawl_filings(path, bgn_de='20190101', end_de='20191231', batch_size=4, progressbar=False)
+    assert actual == 15
+
+    with FilingStore(path) as store:
+        actual = (len(store), '20191001000004' in store, store.get('20190401000000')['report_nm'],
+                  store.to_dataframe(bgn_de='20191001')['rcept_no'].tolist()[0])
+        expected = (15, True, '사업보고서', '20191001000004')
+        assert actual == expected
+        # 이미 저장된 공시는 다시 저장하지 않음
+        assert crawl_filings(store, bgn_de='20190101', end_de='20190331', progressbar=False) == 0
+
+
+def test_sync_filings(monkeypatch, tmp_path):
+    import importlib
+    from dart_fss.errors import NoDataReceived
+    from dart_fss.filings import sync_filings, FilingStore
+    sync = importlib.import_module('dart_fss.filings.sync')
+    result_module = importlib.import_module('dart_fss.filings.search_result')
+
+    # 최신 접수순 공시 목록
+    feed = ['20200102000003', '20200102000002', '20200101000002', '20200101000001']
+    requests = []
+
+    def fake(bgn_de, page_no=1, page_count=10, **kwargs):
+        requests.append((bgn_de, page_no))
+        rcept_list = [x for x in feed if x[:8] >= bgn_de]
+        if len(rcept_list) == 0:
+            raise NoDataReceived('조회된 데이타가 없습니다.')
+        items = rcept_list[(page_no - 1) * page_count:page_no * page_count]
+        return {
+            'page_no': page_no, 'page_count': page_count, 'total_count': len(rcept_list),
+            'total_page': (len(rcept_list) + page_count - 1) // page_count,
+            'list': [{'rcept_no': x, 'corp_code': '00126380', 'rcept_dt': x[:8]} for x in items]
+        }
+
+    monkeypatch.setattr(sync, 'search_filings', fake)
+    monkeypatch.setattr(result_module, 'search_filings', fake)
+    path = str(tmp_path / 'filings.db')
+
+    def rcept_list(filings):
+        return [x['rcept_no'] for x in filings]
+
+    actual = rcept_list(sync_filings(path, corp_code='00126380', bgn_de='20200101', page_count=2))
+    assert actual == sorted(feed)
+
+    # 새로운 공시가 없는 경우 1번만 요청
+    requests.clear()
+    assert sync_filings(path, corp_code='00126380', page_count=2) == []
+    assert requests == [('20200102', 1)]
+
+    # 새로운 공시만 반환, 페이지 전체가 이미 저장된 경우 중단
+    feed[:0] = ['20200103800001', '20200103000001', '20200102000004']
+    requests.clear()
+    actual = rcept_list(sync_filings(path, corp_code='00126380', page_count=2))
+    expected = ['20200102000004', '20200103000001', '20200103800001']
+    assert actual == expected
+    assert requests == [('20200102', 1), ('20200102', 2), ('20200102', 3)]
+
+    # KRX 제출 공시(80)보다 접수번호가 작은 공시가 나중에 접수된 경우
+    feed[:0] = ['20200103000002']
+    requests.clear()
+    actual = rcept_list(sync_filings(path, corp_code='00126380', page_count=2))
+    expected = ['20200103000002']
+    assert actual == expected
+    assert requests == [('20200103', 1), ('20200103', 2)]
+
+    with FilingStore(path) as store:
+        actual = (len(store), store.get_watermark(sync.get_query_key(dict(
+            corp_code='00126380', last_reprt_at='N', pblntf_ty=None, pblntf_detail_ty=None, corp_cls=None)))['rcept_dt'])
+        expected = (8, '20200103')
+        assert actual == expected
+
+
+def test_sync_filings_queries(monkeypatch, tmp_path):
+    import importlib
+    from dart_fss.errors import NoDataReceived
+    from dart_fss.filings import sync_filings, FilingStore
+    sync = importlib.import_module('dart_fss.filings.sync')
+    result_module = importlib.import_module('dart_fss.filings.search_result')
+
+    feed = ['20200102800001', '20200102000001', '20200101000001']
+
+    def fake(bgn_de, end_de=None, page_no=1, page_count=10, **kwargs):
+        rcept_list = [x for x in feed if bgn_de <= x[:8] <= (end_de or '99999999')]
+        if len(rcept_list) == 0:
+            raise NoDataReceived('조회된 데이타가 없습니다.')
+        items = rcept_list[(page_no - 1) * page_count:page_no * page_count]
+        return {
+            'page_no': page_no, 'page_count': page_count, 'total_count': len(rcept_list),
+            'total_page': (len(rcept_list) + page_count - 1) // page_count,
+            'list': [{'rcept_no': x, 'corp_code': '00126380', 'rcept_dt': x[:8]} for x in items]
+        }
+
+    monkeypatch.setattr(sync, 'search_filings', fake)
+    monkeypatch.setattr(result_module, 'search_filings', fake)
+
+    with FilingStore(str(tmp_path / 'filings.db')) as store:
+        actual = sync_filings(store, pblntf_ty='A', bgn_de='20200101', page_count=2)
+        assert len(actual) == 3
+        # 다른 검색 조건으로 저장된 공시도 처음 동기화하는 검색 조건에서는 새로운 공시로 반환
+        actual = [x['rcept_no'] for x in sync_filings(store, corp_code='00126380', bgn_de='20200101', page_count=2)]
+        assert actual == sorted(feed)
+        assert sync_filings(store, corp_code='00126380', page_count=2) == []
+
+        key = sync.get_query_key(dict(corp_code='00126380', last_reprt_at='N', pblntf_ty=None,
+                                      pblntf_detail_ty=None, corp_cls=None))
+        watermark = store.get_watermark(key)
+        actual = (len(store), watermark['rcept_no'], watermark['rcept_dt'])
+        expected = (3, '20200102800001', '20200102')
+        assert actual == expected
+
+
+def test_search_results_lazy_report():
+    from dart_fss.filings.search_result import SearchResults
+    rcept_list = ['2020{:010d}'.format(x) for x in range(3)]
+    resp = {
+        'page_no': 1, 'page_count': 10, 'total_count': 3, 'total_page': 1,
+        'list': [{'rcept_no': x, 'report_nm': '사업보고서', 'rcept_dt': x[:8]} for x in rcept_list]
+    }
+    results = SearchResults(resp)
+
+    df = results.to_dataframe()
+    assert df['rcept_no'].tolist() == rcept_list
+    assert results._reports == [None, None, None]
+
+    report = results[-1]
+    actual = (report.rcept_no, report is results[2], results._reports[:2], len(results))
+    expected = (rcept_list[2], True, [None, None], 3)
+    assert actual == expected
+
+    actual = ([x.rcept_no for x in results[:2]], results.pop(0).rcept_no,
+              [x.rcept_no for x in results.report_list], resp['list'][0]['rcept_no'])
+    expected = (rcept_list[:2], rcept_list[0], rcept_list[1:], rcept_list[0])
+    assert actual == expected
+
+
+def test_search_results_filing_row():
+    from dart_fss.filings.search_result import SearchResults, FilingRow
+    item = {'rcept_no': '20200101000001', 'corp_name': '삼성전자', 'report_nm': '사업보고서',
+            'rcept_dt': '20200101', 'rm': '', 'new_field': 'x'}
+    resp = {'page_no': 1, 'page_count': 10, 'total_count': 1, 'total_page': 1, 'list': [item]}
+    results = SearchResults(resp)
+
+    # 응답의 dict 대신 FilingRow 로 저장하며, Report 및 DataFrame 은 응답과 동일한 항목으로 생성
+    report = results[0]
+    actual = (type(results._rows[0]), report.info, results.to_dataframe().to_dict('records'))
+    expected = (FilingRow, {k: v for k, v in item.items() if k != 'rcept_no'}, [item])
+    assert actual == expected
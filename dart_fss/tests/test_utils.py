@@ -1,3 +1,4 @@
+import pytest
 from dart_fss.utils import dict_to_html, check_datetime
 
 
@@ -23,3 +24,199 @@ def test_check_datetime():
     actual = check_datetime('20191231', '20190101', '20190201')
     expected = False
     assert actual == expected
+
+
+def test_rate_limiter_burst():
+    from dart_fss.utils import RateLimiter
+    limiter = RateLimiter(max_calls=5, period=60)
+    waited = [limiter.acquire('opendart.fss.or.kr') for _ in range(5)]
+    actual = sum(waited)
+    expected = 0
+    assert actual == expected
+
+
+def test_rate_limiter_window_full():
+    from dart_fss.utils import RateLimiter
+    limiter = RateLimiter(max_calls=2, period=0.2)
+    limiter.acquire('opendart.fss.or.kr')
+    limiter.acquire('opendart.fss.or.kr')
+    # 다른 Host 는 대기하지 않음
+    assert limiter.acquire('kind.krx.co.kr') == 0
+    actual = limiter.acquire('opendart.fss.or.kr')
+    assert actual > 0.1
+
+
+def test_thread_map_order():
+    import time
+    from dart_fss.utils import thread_map
+
+    def func(x):
+        time.sleep(0.01 * (5 - x))
+        return x * 2
+
+    actual = thread_map(func, range(5), max_workers=5)
+    expected = [0, 2, 4, 6, 8]
+    assert actual == expected
+
+
+def test_thread_map_return_exceptions():
+    from dart_fss.utils import thread_map
+    from dart_fss.errors import check_status, NoDataReceived
+
+    def func(status):
+        check_status(status=status)
+        return status
+
+    actual = thread_map(func, ['000', '013'], return_exceptions=True)
+    assert actual[0] == '000'
+    assert isinstance(actual[1], NoDataReceived)
+
+
+def test_http_cache():
+    import os
+    import datetime
+    import tempfile
+    from dart_fss.utils.http_cache import http_cache
+
+    url = 'https://opendart.fss.or.kr/api/empSttus.json'
+    payload = {'crtfc_key': 'xxxx', 'corp_code': '00126380', 'bsns_year': '2019', 'reprt_code': '11011'}
+    data = {'status': '000', 'message': '정상', 'list': [{'corp_code': '00126380'}]}
+    with tempfile.TemporaryDirectory() as path:
+        http_cache.enable(path=os.path.join(path, 'cache.sqlite3'))
+        try:
+            assert http_cache.get(url, payload) is None
+            http_cache.set(url, payload, data)
+            # crtfc_key 는 캐시 키에서 제외
+            actual = http_cache.get(url, {**payload, 'crtfc_key': 'yyyy'})
+            assert actual == data
+            info = http_cache.cache_info()
+            assert (info.hits, info.misses, info.count) == (1, 1, 1)
+
+            # bypass 중에는 저장된 응답을 사용하지 않음
+            with http_cache.bypass():
+                assert http_cache.get(url, payload) is None
+            assert http_cache.get(url, payload) == data
+
+            http_cache.enable(ttl_policy={'/api/empSttus.json': datetime.timedelta(seconds=-1)})
+            assert http_cache.get(url, payload) is None
+        finally:
+            http_cache.clear()
+            http_cache.enable(False)
+            http_cache.path = None
+            http_cache.ttl_policy.pop('/api/empSttus.json')
+
+
+def test_http_cache_eviction():
+    import os
+    import tempfile
+    from dart_fss.utils.http_cache import http_cache
+
+    url = 'https://opendart.fss.or.kr/api/company.json'
+    max_size = http_cache.max_size
+    with tempfile.TemporaryDirectory() as path:
+        http_cache.enable(path=os.path.join(path, 'cache.sqlite3'), max_size=200)
+        try:
+            for corp_code in ['00000001', '00000002', '00000003']:
+                http_cache.set(url, {'corp_code': corp_code}, {'status': '000', 'corp_code': corp_code, 'x': 'x' * 50})
+            info = http_cache.cache_info()
+            assert info.size <= 200
+            assert http_cache.get(url, {'corp_code': '00000001'}) is None
+            assert http_cache.get(url, {'corp_code': '00000003'}) is not None
+        finally:
+            http_cache.clear()
+            http_cache.enable(False, max_size=max_size)
+            http_cache.path = None
+
+
+def test_http_cache_low_water():
+    import os
+    import json
+    import tempfile
+    from dart_fss.utils.http_cache import http_cache
+
+    url = 'https://opendart.fss.or.kr/api/company.json'
+    max_size = http_cache.max_size
+
+    def data(idx):
+        return {'status': '000', 'corp_code': '{:08d}'.format(idx), 'x': 'x' * 50}
+
+    size = len(json.dumps(data(0), ensure_ascii=False).encode('utf-8'))
+    with tempfile.TemporaryDirectory() as path:
+        http_cache.enable(path=os.path.join(path, 'cache.sqlite3'), max_size=size * 5)
+        try:
+            counts = []
+            for idx in range(7):
+                http_cache.set(url, {'corp_code': idx}, data(idx))
+                counts.append(http_cache.cache_info().count)
+            # 최대 크기 초과시 90% 이하로 삭제하므로 다음 삽입시에는 삭제하지 않음
+            actual = (counts, http_cache.get(url, {'corp_code': 1}), http_cache.get(url, {'corp_code': 2}) is None)
+            expected = ([1, 2, 3, 4, 5, 4, 5], None, False)
+            assert actual == expected
+        finally:
+            http_cache.clear()
+            http_cache.enable(False, max_size=max_size)
+            http_cache.path = None
+
+
+def test_set_html_parser():
+    from dart_fss.utils import set_html_parser, get_html_parser, html_to_soup
+    pytest.importorskip('lxml')
+    try:
+        set_html_parser('lxml')
+        soup = html_to_soup('<table border="1"><tr><td>자산</td></tr></table>')
+        actual = (get_html_parser(), soup.find('table', border='1').td.text)
+        expected = ('lxml', '자산')
+        assert actual == expected
+        with pytest.raises(ValueError):
+            set_html_parser('unknown-parser')
+    finally:
+        set_html_parser('html.parser')
+
+
+def test_cache_lru_and_info():
+    from dart_fss.utils import cache
+    calls = []
+
+    @cache(ttl=None, maxsize=2)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    square(1), square(2), square(1), square(3), square(2)
+    actual = (calls, square.cache_info())
+    expected = ([1, 2, 3, 2], (1, 4, 2, 2))
+    assert actual == expected
+
+    square.cache_clear()
+    assert square.cache_info() == (0, 0, 2, 0)
+
+
+def test_cache_ttl():
+    import time
+    from dart_fss.utils import cache
+    calls = []
+
+    @cache(ttl=0.05)
+    def identity(x):
+        calls.append(x)
+        return x
+
+    identity('a'), identity('a')
+    time.sleep(0.1)
+    identity('a')
+    actual = calls
+    expected = ['a', 'a']
+    assert actual == expected
+
+
+def test_cache_thread_safe():
+    from dart_fss.utils import cache, thread_map
+
+    @cache(ttl=None, maxsize=16)
+    def double(x):
+        return x * 2
+
+    actual = thread_map(double, [x % 32 for x in range(2000)], max_workers=8)
+    expected = [(x % 32) * 2 for x in range(2000)]
+    assert actual == expected
+    assert double.cache_info().currsize <= 16
@@ -105,3 +105,55 @@ def test_xbrl_get_value_by_concept_id_casesensetive(dart):
         data = cf.get_value_by_concept_id(concept_id, start_dt='20230101', end_dt='20230930', label='Separate')
         actual = list(data.values())[-1]
         assert actual == expected[idx]
+
+
+def test_table_to_dataframe():
+    import datetime
+    import pandas as pd
+    from types import SimpleNamespace
+    from dart_fss.xbrl.helper import flatten, generate_df_columns, generate_df_rows
+    from dart_fss.xbrl.table import Table
+
+    def fact(concept_id, value):
+        return SimpleNamespace(concept=SimpleNamespace(id=concept_id), value=value, decimals='-6')
+
+    def label(concept_id, label_ko, children=(), is_abstract=False):
+        return {'concept_id': concept_id, 'label_ko': label_ko, 'label_en': concept_id, 'isAbstract': is_abstract,
+                'preferred': None, 'children': list(children)}
+
+    cls = [{'cls_id': 'c{}'.format(year), 'instant_datetime': datetime.datetime(year, 12, 31),
+            'start_datetime': None, 'end_datetime': None,
+            'label': {'ConsolidatedAxis': {'ko': '연결재무제표', 'en': 'Consolidated'}}} for year in (2018, 2017)]
+    dataset = {
+        'c2018': [fact('ifrs_Assets', '300'), fact('ifrs_CurrentAssets', '100'), fact('ifrs_Cash', '10')],
+        'c2017': [fact('ifrs_Assets', '200'), fact('ifrs_CurrentAssets', '50')],
+    }
+    labels = [label('ifrs_StatementAbstract', '재무상태표', is_abstract=True, children=[
+        label('ifrs_Assets', '자산총계', children=[
+            label('ifrs_CurrentAssets', '유동자산', children=[label('ifrs_Cash', '현금및현금성자산')]),
+        ]),
+    ])]
+    currency = [{'cls_id': 'd', 'instant_datetime': datetime.datetime(2018, 12, 31),
+                 'start_datetime': None, 'end_datetime': None, 'label': {}}]
+    unit_table = SimpleNamespace(cls=currency, dataset={'d': [fact('dart-gcd_EntityReportingCurrencyISOCode', 'KRW')]})
+
+    table = Table(SimpleNamespace(get_table_by_code=lambda code: unit_table), None, 'D210000', '재무상태표', None)
+    table._cls = cls
+    table._dataset = dataset
+    table._labels = labels
+    # to_DataFrame 에서 변경하는 표시 형식이 다른 테스트에 영향을 주지 않도록 복원
+    with pd.option_context('display.float_format', None):
+        df = table.to_DataFrame(cls=cls)
+
+    # 이전 구현(df.loc 로 한 행씩 추가)과 비교
+    columns = generate_df_columns('재무상태표 (Unit: KRW)', cls, 4)
+    expected = pd.DataFrame(columns=columns)
+    for idx, row in enumerate(flatten(flatten([generate_df_rows(x, cls, dataset, 4) for x in labels]))):
+        expected.loc[idx] = row
+
+    value_columns = [('20181231', ('연결재무제표',)), ('20171231', ('연결재무제표',))]
+    actual = (list(df.columns), len(df), [str(df[x].dtype) for x in value_columns])
+    assert actual == (list(expected.columns), len(expected), ['float64', 'float64'])
+    for column in value_columns:
+        pd.testing.assert_series_equal(df[column], expected[column].astype('float64'))
+    assert df[('재무상태표 (Unit: KRW)', 'label_ko')].tolist() == ['자산총계', '유동자산', '현금및현금성자산']
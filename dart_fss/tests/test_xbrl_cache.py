@@ -0,0 +1,66 @@
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+
+from dart_fss.xbrl.cache import xbrl_cache
+
+
+@pytest.fixture()
+def cache_folder():
+    with tempfile.TemporaryDirectory() as path:
+        xbrl_cache.enable(path=path)
+        yield path
+        xbrl_cache.enable(False)
+        xbrl_cache.path = None
+
+
+def test_xbrl_cache_file(cache_folder):
+    rcept_no = '20190401004781'
+    assert xbrl_cache.get_file(rcept_no) is None
+    file_path = os.path.join(xbrl_cache.folder(rcept_no), 'entity00126380_2018-12-31.xbrl')
+    with open(file_path, 'w') as f:
+        f.write('<xbrl/>')
+    actual = xbrl_cache.get_file(rcept_no)
+    expected = file_path
+    assert actual == expected
+
+
+def test_xbrl_cache_statements(cache_folder):
+    rcept_no = '20190401004781'
+    options = {'fs_tp': ('bs',), 'separate': False, 'lang': 'ko', 'separator': True}
+    statements = {'bs': pd.DataFrame({'a': [1.0, 2.0]})}
+    xbrl_cache.set_statements(rcept_no, options, statements)
+
+    actual = xbrl_cache.get_statements(rcept_no, options)
+    assert actual['bs'].equals(statements['bs'])
+    assert xbrl_cache.get_statements(rcept_no, {**options, 'separate': True}) is None
+
+
+def test_xbrl_cache_model_lru(cache_folder):
+    xbrl_cache.enable(max_models=2)
+    for rcept_no in ['1', '2', '3']:
+        xbrl_cache.set_model(rcept_no, object())
+    assert xbrl_cache.get_model('1') is None
+    assert xbrl_cache.get_model('3') is not None
+    xbrl_cache.enable(max_models=8)
+
+
+def test_xbrl_cache_clear_on_error(cache_folder, monkeypatch):
+    import importlib
+    from dart_fss.filings.reports import Report
+    reports = importlib.import_module('dart_fss.filings.reports')
+    rcept_no = '20190401004781'
+
+    def fake_download_xbrl(path, rcept_no):
+        # 일부만 저장된 후 오류 발생
+        with open(os.path.join(path, 'entity00126380_2018-12-31.xbrl'), 'w') as f:
+            f.write('<xbrl')
+        raise ConnectionError('connection aborted')
+
+    monkeypatch.setattr(reports, 'download_xbrl', fake_download_xbrl)
+    report = Report(rcept_no=rcept_no, lazy_loading=True)
+    with pytest.raises(ConnectionError):
+        report.load_xbrl()
+    assert not os.path.exists(os.path.join(cache_folder, rcept_no))
@@ -1,34 +1,97 @@
+import time
 import datetime
 import functools
+import threading
+
+from collections import OrderedDict, namedtuple
 
 # Default Time-To-Live
 CACHE_DEFAULT_TTL = datetime.timedelta(hours=1)
 
+# Default maximum number of cached results
+CACHE_DEFAULT_MAXSIZE = 128
+
+# 만료된 결과를 삭제하는 주기(cache miss 횟수)
+CACHE_SWEEP_INTERVAL = 128
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
 
-def cache(ttl=CACHE_DEFAULT_TTL):
-    """ TTL Cache Decorator
+def cache(ttl=CACHE_DEFAULT_TTL, maxsize=CACHE_DEFAULT_MAXSIZE):
+    """ TTL + LRU Cache Decorator
+
+    최대 maxsize 개의 결과를 저장하며, 초과시 가장 오래전에 사용된 결과부터 삭제한다.
+    만료된 결과는 조회시, 최대 개수에 도달한 경우 및 일정 횟수의 cache miss 마다 삭제된다.
+    여러 Thread 에서 동시에 호출하여도 안전하며, wrapped function 의 cache_info() 및 cache_clear() 를 통해
+    사용 통계 확인 및 초기화가 가능하다.
 
     Parameters
     ----------
-    ttl: datetime.timedelta
-        Time-To-Live
+    ttl: datetime.timedelta or float, optional
+        Time-To-Live(float 인 경우 초 단위), None 인 경우 만료되지 않음
+    maxsize: int, optional
+        최대 저장 개수, None 인 경우 제한 없음
 
     Returns
     -------
     function
         Wrapped Function
     """
+    if isinstance(ttl, datetime.timedelta):
+        ttl = ttl.total_seconds()
+
     def wrap(func):
-        cached = {}
+        cached = OrderedDict()
+        lock = threading.RLock()
+        stats = {'hits': 0, 'misses': 0}
+
+        def expired(created, now):
+            return ttl is not None and now - created > ttl
+
+        def sweep(now):
+            """ 만료된 결과 삭제 """
+            for key in [k for k, (created, _) in cached.items() if expired(created, now)]:
+                del cached[key]
 
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
-            now = datetime.datetime.now()
-            # see lru_cache for fancier alternatives
             key = tuple(args), frozenset(kwargs.items())
-            if key not in cached or now - cached[key][0] > ttl:
-                value = func(*args, **kwargs)
-                cached[key] = (now, value)
-            return cached[key][1]
+            now = time.monotonic()
+            with lock:
+                item = cached.get(key)
+                if item is not None and not expired(item[0], now):
+                    cached.move_to_end(key)
+                    stats['hits'] += 1
+                    return item[1]
+                stats['misses'] += 1
+
+            # 오래 걸리는 함수가 다른 Thread 를 막지 않도록 lock 밖에서 실행
+            value = func(*args, **kwargs)
+
+            with lock:
+                cached[key] = (time.monotonic(), value)
+                cached.move_to_end(key)
+                full = maxsize is not None and len(cached) > maxsize
+                if full or stats['misses'] % CACHE_SWEEP_INTERVAL == 0:
+                    sweep(now)
+                if maxsize is not None:
+                    while len(cached) > maxsize:
+                        cached.popitem(last=False)
+            return value
+
+        def cache_info() -> CacheInfo:
+            """ 캐시 사용 통계 반환 """
+            with lock:
+                return CacheInfo(stats['hits'], stats['misses'], maxsize, len(cached))
+
+        def cache_clear():
+            """ 캐시 초기화 """
+            with lock:
+                cached.clear()
+                stats['hits'] = 0
+                stats['misses'] = 0
+
+        wrapped.cache_info = cache_info
+        wrapped.cache_clear = cache_clear
         return wrapped
     return wrap
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, List
+
+from dart_fss.utils.notebook import is_notebook
+
+
+def thread_map(func: Callable, iterable: Iterable, max_workers: int = 4, return_exceptions: bool = False,
+               progressbar: bool = False, desc: str = None) -> List:
+    """ ThreadPool 을 이용하여 func 을 병렬로 실행하고 입력 순서대로 결과를 반환
+
+    요청 제한은 dart_fss.utils.request 의 RateLimiter 가 모든 Thread 에 대해 공통으로 적용한다.
+
+    Parameters
+    ----------
+    func: callable
+        실행할 함수
+    iterable: iterable
+        func 에 전달할 인자 리스트
+    max_workers: int, optional
+        최대 Thread 수 (default: 4)
+    return_exceptions: bool, optional
+        True 인 경우 오류 발생시 예외를 발생시키지 않고 결과 리스트에 예외 객체를 저장 (default: False)
+    progressbar: bool, optional
+        ProgressBar 표시 여부 (default: False)
+    desc: str, optional
+        ProgressBar 설명
+
+    Returns
+    -------
+    list
+        입력 순서대로 정렬된 실행 결과
+    """
+    if is_notebook():
+        from tqdm import tqdm_notebook as tqdm
+    else:
+        from tqdm import tqdm
+
+    items = list(iterable)
+    results = [None] * len(items)
+    if len(items) == 0:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(func, item): idx for idx, item in enumerate(items)}
+        try:
+            for future in tqdm(as_completed(futures), total=len(futures), desc=desc, disable=not progressbar):
+                idx = futures[future]
+                try:
+                    results[idx] = future.result()
+                except Exception as ex:
+                    if not return_exceptions:
+                        raise
+                    results[idx] = ex
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return results
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+# 보고서 페이지 등 큰 HTML 문서 분석에 사용할 BeautifulSoup parser
+_html_parser = 'html.parser'
+
+
+def set_html_parser(parser: str = 'html.parser'):
+    """
+    보고서 페이지 분석에 사용할 HTML parser 설정
+
+    기본값은 Python 내장 'html.parser' 이며, lxml 이 설치된 경우 'lxml' 을 사용하면 큰 문서의 분석 속도가 빨라진다.
+    parser 에 따라 잘못된 형식의 HTML 을 처리하는 방식이 다를 수 있다.
+
+    Parameters
+    ----------
+    parser: str
+        BeautifulSoup parser 이름 (ex. 'html.parser', 'lxml', 'html5lib')
+    """
+    global _html_parser
+    if builder_registry.lookup(parser) is None:
+        raise ValueError('Couldn\'t find a tree builder: {}. Do you need to install a parser library?'.format(parser))
+    _html_parser = parser
+
+
+def get_html_parser() -> str:
+    """
+    보고서 페이지 분석에 사용하는 HTML parser 반환
+
+    Returns
+    -------
+    str
+        BeautifulSoup parser 이름
+    """
+    return _html_parser
+
+
+def html_to_soup(markup) -> BeautifulSoup:
+    """
+    설정된 HTML parser 를 이용하여 BeautifulSoup 객체 생성
+
+    Parameters
+    ----------
+    markup: str or bytes
+        HTML 문서
+
+    Returns
+    -------
+    BeautifulSoup
+        분석된 HTML 문서
+    """
+    return BeautifulSoup(markup, _html_parser)
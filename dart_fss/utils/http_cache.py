@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import datetime
+import threading
+
+from collections import namedtuple
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from typing import Dict, Optional, Union
+
+from dart_fss.utils.file import get_cache_folder
+from dart_fss.utils.singleton import Singleton
+
+# Default Time-To-Live
+HTTP_CACHE_DEFAULT_TTL = datetime.timedelta(days=7)
+
+# Default maximum cache size (bytes)
+HTTP_CACHE_DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+# 최대 크기 초과시 삭제 후 남길 캐시 크기의 비율 (삽입할 때마다 삭제하지 않도록 여유분 확보)
+HTTP_CACHE_LOW_WATER = 0.9
+
+# Endpoint 별 기본 Time-To-Live
+HTTP_CACHE_TTL_POLICY = {
+    # 공시검색 결과는 신규 공시에 따라 변경
+    '/api/list.json': datetime.timedelta(hours=1),
+    # 기업개황은 변경 가능성이 있으므로 1일
+    '/api/company.json': datetime.timedelta(days=1),
+}
+
+# 캐시 키 생성시 제외할 요청 인자
+_EXCLUDED_PARAMS = ('crtfc_key',)
+
+HttpCacheInfo = namedtuple('HttpCacheInfo', ['hits', 'misses', 'count', 'size', 'max_size'])
+
+
+def _to_seconds(ttl: Optional[datetime.timedelta]) -> Optional[float]:
+    if ttl is None:
+        return None
+    return ttl.total_seconds()
+
+
+class HttpCache(object, metaclass=Singleton):
+    """ Open DART JSON 응답을 저장하는 디스크 캐시 클래스
+
+    요청 경로와 요청 인자(crtfc_key 제외)를 키로 사용하여 SQLite 파일에 응답을 저장한다.
+    Endpoint 별로 Time-To-Live를 설정할 수 있으며, 최대 크기를 초과하는 경우 가장 오래전에 사용된 응답부터 삭제한다.
+    기본값은 비활성화 상태이며 enable_http_cache 를 통해 활성화 할 수 있다.
+
+    Attributes
+    ----------
+    enabled: bool
+        캐시 사용 여부
+    path: str
+        캐시 파일 경로
+    max_size: int
+        최대 캐시 크기(bytes)
+    default_ttl: datetime.timedelta
+        TTL 정책이 없는 Endpoint 의 Time-To-Live, None 인 경우 만료되지 않음
+    ttl_policy: dict of {str: datetime.timedelta}
+        Endpoint 경로별 Time-To-Live
+    """
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.max_size = HTTP_CACHE_DEFAULT_MAX_SIZE
+        self.default_ttl = HTTP_CACHE_DEFAULT_TTL
+        self.ttl_policy = dict(HTTP_CACHE_TTL_POLICY)
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    def enable(self, enable: bool = True, path: str = None, max_size: int = None,
+               default_ttl: Union[datetime.timedelta, bool] = False, ttl_policy: Dict[str, datetime.timedelta] = None):
+        """ 캐시 활성화 설정
+
+        Parameters
+        ----------
+        enable: bool, optional
+            캐시 사용 여부
+        path: str, optional
+            캐시 파일 경로(default: {cache folder}/http_cache.sqlite3)
+        max_size: int, optional
+            최대 캐시 크기(bytes)
+        default_ttl: datetime.timedelta, optional
+            TTL 정책이 없는 Endpoint 의 Time-To-Live, None 인 경우 만료되지 않음
+        ttl_policy: dict of {str: datetime.timedelta}, optional
+            Endpoint 경로별 Time-To-Live (ex. {'/api/list.json': timedelta(minutes=10)})
+        """
+        with self._lock:
+            if path is not None and path != self.path:
+                self.close()
+                self.path = path
+            if max_size is not None:
+                self.max_size = max_size
+            if default_ttl is not False:
+                self.default_ttl = default_ttl
+            if ttl_policy is not None:
+                self.ttl_policy.update(ttl_policy)
+            self.enabled = enable
+            if not enable:
+                self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path is None:
+                self.path = os.path.join(get_cache_folder(), 'http_cache.sqlite3')
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, path TEXT, data TEXT, size INTEGER, created REAL, accessed REAL)'
+            )
+            # 크기 합계 및 삭제 대상 검색시 data 를 읽지 않도록 Covering index 사용
+            self._conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed, size)')
+            self._conn.commit()
+        return self._conn
+
+    def close(self):
+        """ 캐시 파일 닫기 """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def reset_after_fork(self):
+        """ fork 로 생성된 Process 에서 상속된 SQLite 연결 및 Lock 초기화
+
+        상속된 연결은 부모 Process 와 공유되므로 닫지 않고 버린 후 처음 사용할 때 다시 연결한다.
+        """
+        self._conn = None
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def bypass(self):
+        """ with 문 안에서 현재 Thread 의 요청은 저장된 응답을 사용하지 않고 새로 요청
+
+        새로 받은 응답은 저장되므로 이후 요청에서는 갱신된 응답을 사용한다.
+
+        Examples
+        --------
+        >>> with http_cache.bypass():
+        ...     resp = search_filings(corp_code='00126380')
+        """
+        self._local.bypass = getattr(self._local, 'bypass', 0) + 1
+        try:
+            yield
+        finally:
+            self._local.bypass -= 1
+
+    @staticmethod
+    def make_key(url: str, payload: dict = None) -> str:
+        """ 요청 경로 및 요청 인자를 이용하여 캐시 키 생성
+
+        Parameters
+        ----------
+        url: str
+            요청 URL
+        payload: dict, optional
+            요청 인자
+
+        Returns
+        -------
+        str
+            캐시 키
+        """
+        payload = payload or {}
+        params = {k: str(v) for k, v in payload.items() if v is not None and k not in _EXCLUDED_PARAMS}
+        key = json.dumps({'path': urlparse(url).path, 'payload': params}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def get_ttl(self, url: str) -> Optional[datetime.timedelta]:
+        """ Endpoint 의 Time-To-Live 반환 """
+        path = urlparse(url).path
+        return self.ttl_policy.get(path, self.default_ttl)
+
+    def get(self, url: str, payload: dict = None) -> Optional[dict]:
+        """ 저장된 응답 반환
+
+        Parameters
+        ----------
+        url: str
+            요청 URL
+        payload: dict, optional
+            요청 인자
+
+        Returns
+        -------
+        dict or None
+            저장된 응답, 없거나 만료된 경우 None
+        """
+        if not self.enabled or getattr(self._local, 'bypass', 0) > 0:
+            return None
+        key = self.make_key(url, payload)
+        ttl = _to_seconds(self.get_ttl(url))
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute('SELECT data, created FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None or (ttl is not None and now - row[1] > ttl):
+                self.misses += 1
+                return None
+            conn.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+            conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, url: str, payload: dict, data: dict):
+        """ 응답 저장
+
+        Parameters
+        ----------
+        url: str
+            요청 URL
+        payload: dict
+            요청 인자
+        data: dict
+            응답 데이터
+        """
+        if not self.enabled:
+            return
+        key = self.make_key(url, payload)
+        text = json.dumps(data, ensure_ascii=False)
+        size = len(text.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                         (key, urlparse(url).path, text, size, now, now))
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """ 최대 크기를 초과한 경우 가장 오래전에 사용된 응답부터 최대 크기의 HTTP_CACHE_LOW_WATER 비율까지 삭제 """
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_size:
+            return
+        # 만료 여부와 관계없이 가장 오래전에 사용된 응답부터 필요한 만큼만 읽어서 삭제
+        excess = total - int(self.max_size * HTTP_CACHE_LOW_WATER)
+        cursor = conn.execute('SELECT rowid, size FROM responses ORDER BY accessed ASC')
+        evicted = []
+        for rowid, size in cursor:
+            evicted.append((rowid,))
+            excess -= size
+            if excess <= 0:
+                break
+        cursor.close()
+        conn.executemany('DELETE FROM responses WHERE rowid = ?', evicted)
+
+    def clear(self, path: str = None):
+        """ 저장된 응답 삭제
+
+        Parameters
+        ----------
+        path: str, optional
+            삭제할 Endpoint 경로(ex. '/api/list.json'), None 인 경우 모든 응답 삭제
+        """
+        with self._lock:
+            conn = self._connect()
+            if path is None:
+                conn.execute('DELETE FROM responses')
+            else:
+                conn.execute('DELETE FROM responses WHERE path = ?', (path,))
+            conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> HttpCacheInfo:
+        """ 캐시 사용 통계 반환
+
+        Returns
+        -------
+        HttpCacheInfo
+            hits, misses, 저장된 응답 수, 캐시 크기(bytes), 최대 캐시 크기(bytes)
+        """
+        with self._lock:
+            count, size = 0, 0
+            if self.enabled:
+                conn = self._connect()
+                count, size = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+            return HttpCacheInfo(self.hits, self.misses, count, size, self.max_size)
+
+
+def enable_http_cache(enable: bool = True, path: str = None, max_size: int = None,
+                      default_ttl: Union[datetime.timedelta, bool] = False,
+                      ttl_policy: Dict[str, datetime.timedelta] = None):
+    """
+    Open DART JSON 응답 디스크 캐시 활성화 설정
+
+    Parameters
+    ----------
+    enable: bool, optional
+        캐시 사용 여부
+    path: str, optional
+        캐시 파일 경로(default: {cache folder}/http_cache.sqlite3)
+    max_size: int, optional
+        최대 캐시 크기(bytes, default: 512MB)
+    default_ttl: datetime.timedelta, optional
+        TTL 정책이 없는 Endpoint 의 Time-To-Live, None 인 경우 만료되지 않음(default: 7 days)
+    ttl_policy: dict of {str: datetime.timedelta}, optional
+        Endpoint 경로별 Time-To-Live (ex. {'/api/list.json': timedelta(minutes=10)})
+    """
+    http_cache.enable(enable=enable, path=path, max_size=max_size, default_ttl=default_ttl, ttl_policy=ttl_policy)
+
+
+# HttpCache object
+http_cache = HttpCache()
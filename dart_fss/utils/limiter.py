@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+from collections import deque
+
+
+class RateLimiter(object):
+    """ Host 별 Sliding window 방식의 요청 제한 클래스
+
+    각 Host 마다 최근 period 초 동안의 요청 시각을 기록하여, 요청 횟수가 max_calls 에 도달한
+    경우에만 대기한다. 제한에 도달하기 전까지는 대기 없이 연속으로 요청할 수 있다.
+
+    Attributes
+    ----------
+    max_calls: int
+        period 동안 허용되는 최대 요청 횟수
+    period: float
+        요청 횟수를 계산하는 기간(초)
+    interval: float
+        동일 Host 에 대한 연속 요청 사이의 최소 간격(초), None 인 경우 사용하지 않음
+    """
+    def __init__(self, max_calls: int = 1000, period: float = 60., interval: float = None):
+        self.max_calls = max_calls
+        self.period = period
+        self.interval = interval
+        self._calls = dict()
+        self._lock = threading.Lock()
+
+    def set_limit(self, max_calls: int = None, period: float = None):
+        """ 요청 제한 설정
+
+        Parameters
+        ----------
+        max_calls: int, optional
+            period 동안 허용되는 최대 요청 횟수
+        period: float, optional
+            요청 횟수를 계산하는 기간(초)
+        """
+        with self._lock:
+            if max_calls is not None:
+                self.max_calls = max_calls
+            if period is not None:
+                self.period = period
+
+    def _wait_time(self, calls: deque, now: float) -> float:
+        """ 요청 가능할 때까지 대기해야 하는 시간 반환 """
+        # 기간이 지난 요청 기록 삭제
+        while calls and now - calls[0] >= self.period:
+            calls.popleft()
+
+        wait = 0.
+        if self.max_calls is not None and len(calls) >= self.max_calls:
+            wait = calls[len(calls) - self.max_calls] + self.period - now
+        if self.interval and calls:
+            wait = max(wait, calls[-1] + self.interval - now)
+        return wait
+
+    def acquire(self, host: str = None) -> float:
+        """ 요청 가능할 때까지 대기
+
+        Parameters
+        ----------
+        host: str, optional
+            요청할 Host
+
+        Returns
+        -------
+        float
+            대기한 시간(초)
+        """
+        waited = 0.
+        while True:
+            with self._lock:
+                calls = self._calls.setdefault(host, deque())
+                now = time.monotonic()
+                wait = self._wait_time(calls, now)
+                if wait <= 0:
+                    calls.append(now)
+                    return waited
+            time.sleep(wait)
+            waited += wait
+
+    def reset(self, host: str = None):
+        """ 요청 기록 초기화
+
+        Parameters
+        ----------
+        host: str, optional
+            초기화할 Host, None 인 경우 모든 Host 초기화
+        """
+        with self._lock:
+            if host is None:
+                self._calls.clear()
+            else:
+                self._calls.pop(host, None)
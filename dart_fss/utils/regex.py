@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import re
 
+from functools import lru_cache
+
 
 def is_operator(item):
     """  연산자 여부 검색
@@ -89,9 +91,12 @@ def infix_to_postfix(infix):
     return results
 
 
+@lru_cache(maxsize=1024)
 def str_to_regex(query):
     """ regular expression
 
+    동일한 검색 문구에 대해 compile 된 Pattern 을 재사용한다.
+
     Parameters
     ----------
     query: str
@@ -105,6 +110,7 @@ def str_to_regex(query):
     return re.compile(str_to_pattern(query))
 
 
+@lru_cache(maxsize=1024)
 def str_to_pattern(query):
     """ AND OR 등 연산자를 regular expression 표현으로 변경
 
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 import re
 import requests
-from time import sleep
+from urllib.parse import urlparse
 from fake_useragent import UserAgent
 from .cache import cache
+from .limiter import RateLimiter
 from .singleton import Singleton
 
 
@@ -53,16 +54,27 @@ class Request(object, metaclass=Singleton):
     ---------
     s: Session
         Requests Session
+    limiter: RateLimiter
+        Host 별 요청 제한, Default: 분당 950회
     delay: float
-        Delay for repeat delay, Default: 1s
+        동일 Host 에 대한 연속 요청 사이의 최소 간격, Default: None
 
     """
     def __init__(self):
         self.s = requests.Session()
         self.update_user_agent()
         # 분당 1000회 이상 자체적으로 24시간 IP차단
-        # IP 차단 방지 위해 delay 0.1s -> 0.2s
-        self.delay = 0.2
+        # IP 차단 방지 위해 매 요청마다 delay 를 주는 대신 Host 별로 분당 요청 횟수를 제한(여유분 50회)
+        self.limiter = RateLimiter(max_calls=950, period=60.)
+
+    @property
+    def delay(self):
+        """ float: 동일 Host 에 대한 연속 요청 사이의 최소 간격 """
+        return self.limiter.interval
+
+    @delay.setter
+    def delay(self, second):
+        self.limiter.interval = second
 
     def update_user_agent(self, force: bool = False):
         """ Update User-Agent
@@ -98,10 +110,22 @@ class Request(object, metaclass=Singleton):
         Parameters
         ----------
         second: float
-            delay for repeat
+            minimum interval between requests to the same host
         """
         self.delay = second
 
+    def set_rate_limit(self, max_calls: int = None, period: float = None):
+        """ Set rate limit
+
+        Parameters
+        ----------
+        max_calls: int, optional
+            maximum number of requests per host within period
+        period: float, optional
+            period in seconds
+        """
+        self.limiter.set_limit(max_calls=max_calls, period=period)
+
     def request(self,
                 url: str,
                 method: str = 'GET',
@@ -131,7 +155,8 @@ class Request(object, metaclass=Singleton):
         requests.Response
             Response
         """
-        headers = self.s.headers
+        # Session headers 를 직접 수정하지 않도록 복사 (Thread-safe)
+        headers = self.s.headers.copy()
         if referer is not None:
             headers['referer'] = referer
 
@@ -140,9 +165,8 @@ class Request(object, metaclass=Singleton):
         # replace the call to Request.prepare() with a call to Session.prepare_request()
         req = requests.Request(method, url=url, params=payload, headers=headers)
         prepped = self.s.prepare_request(req)
+        self.limiter.acquire(urlparse(url).netloc)
         resp = self.s.send(prepped, stream=stream, timeout=timeout)
-        if self.delay is not None:
-            sleep(self.delay)
         return resp
 
     def get(self, url: str,
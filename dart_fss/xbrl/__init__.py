@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
 from .xbrl import get_xbrl_from_file
+from .cache import enable_xbrl_cache
 
-__all__ = ['get_xbrl_from_file']
\ No newline at end of file
+__all__ = ['get_xbrl_from_file', 'enable_xbrl_cache']
\ No newline at end of file
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import pickle
+import shutil
+import hashlib
+import threading
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from dart_fss.utils import create_folder, get_cache_folder, search_file
+from dart_fss.utils.singleton import Singleton
+
+# 메모리에 유지할 DartXbrl 최대 개수
+XBRL_CACHE_DEFAULT_MAX_MODELS = 8
+
+
+class XbrlCache(object, metaclass=Singleton):
+    """ 접수번호(rcept_no)별 XBRL 파일 및 분석 결과를 저장하는 캐시 클래스
+
+    - 다운로드한 XBRL 파일을 {cache folder}/xbrl/{rcept_no} 폴더에 보관
+    - Arelle 로 로딩한 DartXbrl 을 메모리에 LRU 방식으로 보관
+    - XBRL 에서 추출한 재무제표(DataFrame)를 pickle 파일로 보관
+
+    기본값은 비활성화 상태이며 enable_xbrl_cache 를 통해 활성화 할 수 있다.
+
+    Attributes
+    ----------
+    enabled: bool
+        캐시 사용 여부
+    path: str
+        캐시 폴더 경로
+    statements: bool
+        추출된 재무제표 저장 여부
+    max_models: int
+        메모리에 유지할 DartXbrl 최대 개수
+    """
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.statements = True
+        self.max_models = XBRL_CACHE_DEFAULT_MAX_MODELS
+        self._models = OrderedDict()
+        self._lock = threading.RLock()
+
+    def enable(self, enable: bool = True, path: str = None, statements: bool = None, max_models: int = None):
+        """ 캐시 활성화 설정
+
+        Parameters
+        ----------
+        enable: bool, optional
+            캐시 사용 여부
+        path: str, optional
+            캐시 폴더 경로(default: {cache folder}/xbrl)
+        statements: bool, optional
+            추출된 재무제표 저장 여부
+        max_models: int, optional
+            메모리에 유지할 DartXbrl 최대 개수
+        """
+        with self._lock:
+            if path is not None:
+                self.path = path
+            if statements is not None:
+                self.statements = statements
+            if max_models is not None:
+                self.max_models = max_models
+            self.enabled = enable
+            if not enable:
+                self._models.clear()
+            self._shrink()
+
+    def reset_after_fork(self):
+        """ fork 로 생성된 Process 에서 상속된 DartXbrl 및 Lock 초기화 """
+        self._models = OrderedDict()
+        self._lock = threading.RLock()
+
+    def folder(self, rcept_no: str) -> str:
+        """ 접수번호별 XBRL 파일 저장 폴더 반환 """
+        if self.path is None:
+            self.path = os.path.join(get_cache_folder(), 'xbrl')
+        path = os.path.join(self.path, rcept_no)
+        create_folder(path)
+        return path
+
+    def get_file(self, rcept_no: str) -> Optional[str]:
+        """ 저장된 XBRL 파일 경로 반환
+
+        Parameters
+        ----------
+        rcept_no: str
+            접수번호
+
+        Returns
+        -------
+        str or None
+            저장된 XBRL 파일 경로, 없는 경우 None
+        """
+        if not self.enabled:
+            return None
+        files = search_file(self.folder(rcept_no))
+        return files[0] if len(files) > 0 else None
+
+    def get_model(self, rcept_no: str):
+        """ 메모리에 저장된 DartXbrl 반환 """
+        if not self.enabled:
+            return None
+        with self._lock:
+            xbrl = self._models.get(rcept_no)
+            if xbrl is not None:
+                self._models.move_to_end(rcept_no)
+            return xbrl
+
+    def set_model(self, rcept_no: str, xbrl):
+        """ DartXbrl 을 메모리에 저장 """
+        if not self.enabled or xbrl is None:
+            return
+        with self._lock:
+            self._models[rcept_no] = xbrl
+            self._models.move_to_end(rcept_no)
+            self._shrink()
+
+    def _shrink(self):
+        while len(self._models) > max(self.max_models, 0):
+            self._models.popitem(last=False)
+
+    def _statements_path(self, rcept_no: str, options: Dict[str, Any]) -> str:
+        key = json.dumps(options, sort_keys=True, default=str)
+        filename = 'statements_{}.pkl'.format(hashlib.sha1(key.encode('utf-8')).hexdigest())
+        return os.path.join(self.folder(rcept_no), filename)
+
+    def get_statements(self, rcept_no: str, options: Dict[str, Any]):
+        """ 저장된 재무제표 반환
+
+        Parameters
+        ----------
+        rcept_no: str
+            접수번호
+        options: dict
+            재무제표 추출 옵션
+
+        Returns
+        -------
+        dict of {str: DataFrame} or None
+            저장된 재무제표, 없는 경우 None
+        """
+        if not self.enabled or not self.statements:
+            return None
+        file_path = self._statements_path(rcept_no, options)
+        if not os.path.isfile(file_path):
+            return None
+        try:
+            with open(file_path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def set_statements(self, rcept_no: str, options: Dict[str, Any], statements):
+        """ 추출된 재무제표 저장
+
+        Parameters
+        ----------
+        rcept_no: str
+            접수번호
+        options: dict
+            재무제표 추출 옵션
+        statements: dict of {str: DataFrame}
+            추출된 재무제표
+        """
+        if not self.enabled or not self.statements or statements is None:
+            return
+        file_path = self._statements_path(rcept_no, options)
+        temp_path = file_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump(statements, f)
+        os.replace(temp_path, file_path)
+
+    def clear(self, rcept_no: str = None):
+        """ 저장된 XBRL 파일 및 분석 결과 삭제
+
+        Parameters
+        ----------
+        rcept_no: str, optional
+            삭제할 접수번호, None 인 경우 모두 삭제
+        """
+        with self._lock:
+            if rcept_no is None:
+                self._models.clear()
+                if self.path is not None:
+                    shutil.rmtree(self.path, ignore_errors=True)
+            else:
+                self._models.pop(rcept_no, None)
+                if self.path is not None:
+                    shutil.rmtree(os.path.join(self.path, rcept_no), ignore_errors=True)
+
+
+def enable_xbrl_cache(enable: bool = True, path: str = None, statements: bool = None, max_models: int = None):
+    """
+    XBRL 파일 및 분석 결과 캐시 활성화 설정
+
+    Parameters
+    ----------
+    enable: bool, optional
+        캐시 사용 여부
+    path: str, optional
+        캐시 폴더 경로(default: {cache folder}/xbrl)
+    statements: bool, optional
+        XBRL 에서 추출된 재무제표 저장 여부(default: True)
+    max_models: int, optional
+        메모리에 유지할 DartXbrl 최대 개수(default: 8)
+    """
+    xbrl_cache.enable(enable=enable, path=path, statements=statements, max_models=max_models)
+
+
+# XbrlCache object
+xbrl_cache = XbrlCache()
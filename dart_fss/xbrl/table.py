@@ -231,7 +231,6 @@ class Table(object):
             pd.options.display.float_format = '{:,}'.format
         else:
             pd.options.display.float_format = '{:}'.format
-        df = pd.DataFrame(columns=columns)
 
         rows = []
         for label in self.labels:
@@ -240,8 +239,8 @@ class Table(object):
             rows.append(r)
         rows = flatten(rows)
         data = flatten(rows)
-        for idx, r in enumerate(data):
-            df.loc[idx] = r
+        # 한 행씩 추가하는 경우 매번 재할당이 발생하므로 한번에 생성
+        df = pd.DataFrame(data, columns=columns)
 
         regex_pass = str_to_regex('concept_id OR label_ko OR label_en OR class')
         df_count = df.count()